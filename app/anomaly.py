@@ -0,0 +1,217 @@
+# ======================================================
+# anomaly.py — EcoFusion 2.0 Streaming Consumption Anomaly Detection
+# ======================================================
+# Flags devices whose measured Energy(W) drifts from what energy_model.pkl
+# predicts for their Voltage/Current/Temperature. Every residual
+# (measured - predicted) is folded into per-device statistics:
+#
+#   count, mean, m2   Welford running mean / variance of the residual
+#   ewma              exponentially weighted residual (smoothing ``alpha``)
+#   drifting          whether the device is currently in a drift alert
+#
+# State lives in flat NumPy arrays indexed by device slot (33 bytes per
+# device), and each chunk updates it with bincount reductions — Chan's merge
+# for mean / variance, closed-form decay weights for the EWMA — so streams
+# interleaving tens of thousands of devices are processed a chunk at a time
+# with no per-reading Python work. Two alert kinds are emitted:
+#
+#   spike  |residual - mean| / std > spike_z for a single reading
+#   drift  EWMA control chart, |ewma - mean| / (std * sqrt(alpha / (2 - alpha))) > drift_z;
+#          raised once when a device enters the drifting state
+#
+# Readings are judged against their device's statistics as of the start of
+# the chunk, and a device alerts only after ``warmup`` readings.
+#
+# Run: python app/anomaly.py meter.csv --device-column Device_ID -o alerts.csv
+#      (without a device column the whole stream is treated as one device)
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from telemetry import DEFAULT_CHUNKSIZE, EnergyScorer, get_energy_model, iter_chunks
+
+MEASURED = "Energy(W)"
+ALERT_FIELDS = ("row", "device", "kind", "residual", "z")
+_STATE = ("count", "mean", "m2", "ewma", "drifting")
+
+
+class ResidualMonitor:
+    """Per-device residual statistics and alerting over a chunked stream."""
+
+    def __init__(self, scorer=None, alpha=0.05, spike_z=4.0, drift_z=3.0, warmup=30, capacity=1024):
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha must be in (0, 1), got {alpha!r}")
+        self.scorer = scorer or EnergyScorer(get_energy_model())
+        self.alpha = alpha
+        self.spike_z = spike_z
+        self.drift_z = drift_z
+        self.warmup = warmup
+        self.rows = 0
+        self._slots = {}
+        self._devices = []
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.mean = np.zeros(capacity)
+        self.m2 = np.zeros(capacity)
+        self.ewma = np.zeros(capacity)
+        self.drifting = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return len(self._devices)
+
+    # ---- device slots -----------------------------------------------
+    def slots_of(self, devices):
+        """Slot index per reading; unseen devices get fresh slots."""
+        codes, uniques = pd.factorize(np.asarray(devices))
+        slots = self._slots
+        table = np.empty(len(uniques), dtype=np.int64)
+        for i, device in enumerate(uniques.tolist()):
+            slot = slots.get(device)
+            if slot is None:
+                slot = slots[device] = len(self._devices)
+                self._devices.append(device)
+            table[i] = slot
+        if len(self._devices) > len(self.count):
+            capacity = max(len(self._devices), 2 * len(self.count))
+            for name in _STATE:
+                old = getattr(self, name)
+                new = np.zeros(capacity, dtype=old.dtype)
+                new[:len(old)] = old
+                setattr(self, name, new)
+        return table[codes]
+
+    # ---- update -----------------------------------------------------
+    def update(self, slots, residuals, offset=0):
+        """Fold one chunk of residuals into the state; returns its alerts.
+
+        ``slots`` come from slots_of(); ``offset`` is the stream row number
+        of the chunk's first reading (used in the alerts' ``row`` column).
+        """
+        slots = np.asarray(slots, dtype=np.int64)
+        residuals = np.asarray(residuals, dtype=np.float64)
+        size = len(self._devices)
+
+        # Spikes are judged against the state before this chunk
+        prior = self.count[slots]
+        prior_std = np.sqrt(self.m2[slots] / np.maximum(prior - 1, 1))
+        spike_z = np.abs(residuals - self.mean[slots]) / np.where(prior_std > 0, prior_std, np.inf)
+        spike = np.flatnonzero((prior >= self.warmup) & (spike_z > self.spike_z))
+
+        # Chunk count / mean / M2 per device, merged into the running state
+        n_b = np.bincount(slots, minlength=size)
+        seen = np.flatnonzero(n_b)
+        k = n_b[seen]
+        chunk_mean = np.zeros(size)
+        chunk_mean[seen] = np.bincount(slots, residuals, size)[seen] / k
+        centered = residuals - chunk_mean[slots]
+        m2_b = np.bincount(slots, centered * centered, size)[seen]
+        n_a = self.count[seen]
+        n = n_a + k
+        delta = chunk_mean[seen] - self.mean[seen]
+        self.mean[seen] += delta * k / n
+        self.m2[seen] += m2_b + delta * delta * n_a * k / n
+        self.count[seen] = n
+
+        # EWMA after k readings: ewma (1-a)^k + sum_j a (1-a)^(k-1-j) r_j
+        order = np.argsort(slots, kind="stable")
+        starts = np.searchsorted(slots[order], seen)
+        rank = np.arange(len(slots)) - np.repeat(starts, k)
+        decay = 1.0 - self.alpha
+        weights = self.alpha * np.power(decay, n_b[slots[order]] - 1 - rank)
+        new = n_a == 0
+        self.ewma[seen[new]] = residuals[order[starts[new]]]  # starts at the first reading
+        self.ewma[seen] = (self.ewma[seen] * np.power(decay, k)
+                           + np.bincount(slots[order], weights * residuals[order], size)[seen])
+
+        # Drift: EWMA control chart around the device's long-run mean
+        std = np.sqrt(self.m2[seen] / np.maximum(n - 1, 1)) * np.sqrt(self.alpha / (2.0 - self.alpha))
+        drift_z = np.abs(self.ewma[seen] - self.mean[seen]) / np.where(std > 0, std, np.inf)
+        drifting = (n >= self.warmup) & (drift_z > self.drift_z)
+        entered = drifting & ~self.drifting[seen]
+        self.drifting[seen] = drifting
+        self.rows += len(residuals)
+
+        devices = np.asarray(self._devices, dtype=object)
+        drifted = seen[entered]
+        last = order[starts[entered] + k[entered] - 1]  # the reading that tipped the EWMA
+        alerts = pd.DataFrame({
+            "row": np.concatenate((spike, last)) + offset,
+            "device": np.concatenate((devices[slots[spike]], devices[drifted])),
+            "kind": np.array(["spike"] * len(spike) + ["drift"] * len(drifted), dtype=object),
+            "residual": np.concatenate((residuals[spike], self.ewma[drifted] - self.mean[drifted])),
+            "z": np.concatenate((spike_z[spike], drift_z[entered])),
+        }, columns=list(ALERT_FIELDS))
+        return alerts.sort_values("row", kind="stable", ignore_index=True)
+
+    def process(self, chunk, device_column=None, offset=None):
+        """Score one telemetry DataFrame chunk and update; returns its alerts."""
+        offset = self.rows if offset is None else offset
+        residuals = chunk[MEASURED].to_numpy(dtype=np.float64) - self.scorer.predict(chunk)
+        if device_column is None:
+            devices = np.zeros(len(chunk), dtype=np.int64)
+        else:
+            devices = chunk[device_column].to_numpy()
+        return self.update(self.slots_of(devices), residuals, offset)
+
+    # ---- inspection -------------------------------------------------
+    def device_stats(self):
+        """One row per device: count, mean, std, ewma and drifting flag."""
+        size = len(self._devices)
+        count = self.count[:size]
+        return pd.DataFrame({
+            "device": self._devices,
+            "count": count,
+            "mean": self.mean[:size],
+            "std": np.sqrt(self.m2[:size] / np.maximum(count - 1, 1)),
+            "ewma": self.ewma[:size],
+            "drifting": self.drifting[:size],
+        })
+
+
+def detect_stream(source, device_column=None, monitor=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Lazily yield the alerts DataFrame of each chunk of ``source``."""
+    monitor = ResidualMonitor() if monitor is None else monitor
+    for chunk in iter_chunks(source, chunksize):
+        yield monitor.process(chunk, device_column)
+
+
+def run_detection(source, output, device_column=None, chunksize=DEFAULT_CHUNKSIZE, monitor=None):
+    """Write alerts for ``source`` to ``output`` (path, file object or ``-``).
+
+    Returns ``{"rows", "devices", "alerts", "seconds", "rows_per_sec"}``.
+    """
+    monitor = ResidualMonitor() if monitor is None else monitor
+    out = sys.stdout if output == "-" else output
+    alerts = 0
+    t0 = time.perf_counter()
+    for n, chunk_alerts in enumerate(detect_stream(source, device_column, monitor, chunksize)):
+        chunk_alerts.to_csv(out, mode="w" if n == 0 else "a", header=(n == 0), index=False)
+        alerts += len(chunk_alerts)
+    seconds = time.perf_counter() - t0
+    return {"rows": monitor.rows, "devices": len(monitor), "alerts": alerts, "seconds": seconds,
+            "rows_per_sec": monitor.rows / seconds if seconds else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag energy anomalies against energy_model.pkl")
+    parser.add_argument("source", help="CSV path, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="alerts CSV path (default: stdout)")
+    parser.add_argument("--device-column", help="column identifying the device of each reading")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--alpha", type=float, default=0.05, help="EWMA smoothing factor")
+    parser.add_argument("--spike-z", type=float, default=4.0)
+    parser.add_argument("--drift-z", type=float, default=3.0)
+    parser.add_argument("--warmup", type=int, default=30, help="readings before a device can alert")
+    args = parser.parse_args()
+
+    monitor = ResidualMonitor(alpha=args.alpha, spike_z=args.spike_z, drift_z=args.drift_z, warmup=args.warmup)
+    stats = run_detection(args.source, args.output, args.device_column, args.chunksize, monitor)
+    print(f"🔎 {stats['rows']:,} rows from {stats['devices']:,} devices in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_sec']:,.0f} rows/s), {stats['alerts']:,} alerts", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+# ======================================================
+# api.py — EcoFusion 2.0 Headless HTTP/JSON Analysis Service
+# ======================================================
+# Standard-library asyncio server (HTTP/1.1 with keep-alive). Every request
+# is answered from the precomputed catalog; no DataFrame is built per call.
+#
+#   GET  /health
+#   GET  /categories
+#   GET  /regions
+#   GET  /analyze?category=Fan&hours_per_day=6&electricity_rate=7[&region=US]
+#   POST /analyze              {"category": ..., "hours_per_day": ..., "electricity_rate": ..., "region": ...}
+#   POST /analyze/batch        {"category": [...], "hours_per_day": [...], "electricity_rate": [...], "region": [...]}
+#
+# ``region`` is optional (default grid); when given, a missing
+# electricity_rate defaults to the region's tariff.
+#   GET  /components?category=Fan
+#   GET  /metrics              Prometheus text (stage histograms, ECOFUSION_METRICS=1)
+#   GET  /metrics.json
+#
+# Run: python app/api.py --host 127.0.0.1 --port 8765
+
+import argparse
+import asyncio
+import json
+import math
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+import metrics
+from catalog import get_catalog
+from model import analyze_efficiency_batch, efficiency_record, get_component_breakdown
+from regions import REGIONS, get_region, get_region_table
+
+MAX_BODY_BYTES = 64 * 2**20
+# Batches larger than this are scored off the event loop
+EXECUTOR_BATCH_SIZE = 10_000
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ------------------------------------------------------
+# Handlers
+# ------------------------------------------------------
+def _number(params, name):
+    try:
+        value = float(params[name])
+    except KeyError:
+        raise HTTPError(400, f"Missing parameter: {name}") from None
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"Parameter {name} must be numeric") from None
+    if not math.isfinite(value):
+        raise HTTPError(400, f"Parameter {name} must be finite")
+    return value
+
+
+def _check_finite(values, name):
+    """400 unless ``values`` (scalar or list) are all finite numbers."""
+    try:
+        finite = np.isfinite(np.asarray(values, dtype=np.float64)).all()
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"Parameter {name} must be numeric") from None
+    if not finite:
+        raise HTTPError(400, f"Parameter {name} must be finite")
+
+
+def _category(params):
+    category = params.get("category")
+    if category is None:
+        raise HTTPError(400, "Missing parameter: category")
+    if not isinstance(category, str):
+        raise HTTPError(400, "Parameter category must be a string")
+    if category not in get_catalog():
+        raise HTTPError(404, f"Unknown appliance category: {category!r}")
+    return category
+
+
+def _region(params):
+    region = params.get("region")
+    if region is not None and not isinstance(region, str):
+        raise HTTPError(400, "Parameter region must be a string")
+    if region is not None and region not in REGIONS:
+        raise HTTPError(404, f"Unknown region: {region!r}")
+    return region
+
+
+def handle_health(params):
+    return {"status": "ok", "categories": len(get_catalog().categories)}
+
+
+def handle_categories(params):
+    return {"categories": list(get_catalog().categories)}
+
+
+def handle_regions(params):
+    return {"regions": [region._asdict() for region in REGIONS.values()]}
+
+
+def handle_analyze(params):
+    region = _region(params)
+    if region is not None and "electricity_rate" not in params:
+        rate = get_region(region).tariff
+    else:
+        rate = _number(params, "electricity_rate")
+    return efficiency_record(_category(params), _number(params, "hours_per_day"), rate, region)
+
+
+def handle_components(params):
+    return {"category": _category(params), "components": get_component_breakdown(params["category"])}
+
+
+def handle_batch(params):
+    catalog = get_catalog()
+    try:
+        names = params["category"]
+        hours = params["hours_per_day"]
+        region = params.get("region")
+        rates = params["electricity_rate"] if region is None else params.get("electricity_rate")
+    except (KeyError, TypeError, AttributeError):
+        raise HTTPError(400, "Body must contain category, hours_per_day and electricity_rate") from None
+    if isinstance(names, str):
+        names = [names]
+    elif not isinstance(names, list):
+        raise HTTPError(400, "Parameter category must be a string or a list of strings")
+    if isinstance(region, list):
+        if not all(isinstance(code, str) for code in region):
+            raise HTTPError(400, "Parameter region must be a string or a list of strings")
+        for code in dict.fromkeys(region):
+            _region({"region": code})
+    else:
+        _region(params)
+    _check_finite(hours, "hours_per_day")
+    if rates is not None:
+        _check_finite(rates, "electricity_rate")
+    try:
+        codes = [catalog.index_of(c) for c in names]
+        result = analyze_efficiency_batch(codes, hours, rates, region)
+    except KeyError as exc:
+        raise HTTPError(404, exc.args[0]) from None
+    except (TypeError, ValueError, IndexError) as exc:
+        raise HTTPError(400, str(exc)) from None
+
+    payload = {name: values.tolist() for name, values in result.items()}
+    payload["category"] = catalog.columns["Category"][result["category_code"]].tolist()
+    del payload["category_code"]
+    if "region_code" in payload:
+        payload["region"] = np.asarray(get_region_table().codes)[result["region_code"]].tolist()
+        del payload["region_code"]
+    return payload
+
+
+def handle_metrics(params):
+    return metrics.prometheus_text()
+
+
+def handle_metrics_json(params):
+    return {"enabled": metrics.ENABLED, "stages": metrics.snapshot()}
+
+
+ROUTES = {
+    ("GET", "/health"): handle_health,
+    ("GET", "/categories"): handle_categories,
+    ("GET", "/regions"): handle_regions,
+    ("GET", "/analyze"): handle_analyze,
+    ("POST", "/analyze"): handle_analyze,
+    ("POST", "/analyze/batch"): handle_batch,
+    ("GET", "/components"): handle_components,
+    ("GET", "/metrics"): handle_metrics,
+    ("GET", "/metrics.json"): handle_metrics_json,
+}
+
+
+# ------------------------------------------------------
+# HTTP plumbing
+# ------------------------------------------------------
+async def dispatch(method, target, body):
+    """Route one request; returns ``(status, payload)``."""
+    url = urlsplit(target)
+    handler = ROUTES.get((method, url.path))
+    if handler is None:
+        if any(path == url.path for _, path in ROUTES):
+            raise HTTPError(405, f"{method} not allowed on {url.path}")
+        raise HTTPError(404, f"No route for {url.path}")
+
+    params = dict(parse_qsl(url.query))
+    if body:
+        try:
+            params.update(json.loads(body))
+        except (ValueError, TypeError):
+            raise HTTPError(400, "Body must be a JSON object") from None
+
+    with metrics.stage(f"api{url.path}"):
+        category = params.get("category")
+        if handler is handle_batch and isinstance(category, list) and len(category) > EXECUTOR_BATCH_SIZE:
+            return 200, await asyncio.get_running_loop().run_in_executor(None, handler, params)
+        return 200, handler(params)
+
+
+def encode_response(status, payload, keep_alive):
+    """Serialize ``payload`` as JSON, or as plain text when it is a str."""
+    if isinstance(payload, str):
+        body, content_type = payload.encode(), "text/plain; version=0.0.4; charset=utf-8"
+    else:
+        content_type = "application/json"
+        try:
+            body = json.dumps(payload, separators=(",", ":"), allow_nan=False).encode()
+        except ValueError:  # NaN / Infinity are not JSON
+            status, body = 500, b'{"error":"Response contained a non-finite number"}'
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+async def handle_connection(reader, writer):
+    try:
+        while True:
+            try:
+                request_line = await reader.readline()
+            except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                break
+            if not request_line.strip():
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                writer.write(encode_response(400, {"error": "Malformed request line"}, False))
+                break
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                writer.write(encode_response(400, {"error": "Invalid Content-Length"}, False))
+                break
+            if length > MAX_BODY_BYTES:
+                writer.write(encode_response(413, {"error": "Request body too large"}, False))
+                break
+            body = await reader.readexactly(length) if length else b""
+
+            try:
+                status, payload = await dispatch(method, target, body)
+            except HTTPError as exc:
+                status, payload = exc.status, {"error": str(exc)}
+            except Exception as exc:  # keep serving other requests
+                status, payload = 500, {"error": f"{type(exc).__name__}: {exc}"}
+
+            writer.write(encode_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8765, ready=None):
+    get_catalog()  # build the catalog before accepting traffic
+    server = await asyncio.start_server(handle_connection, host, port)
+    if ready is not None:
+        ready(server)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EcoFusion 2.0 analysis API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"🌿 EcoFusion API listening on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,14 @@
 # app.py — EcoFusion 2.0 Streamlit Dashboard (Green-Themed Edition)
 # ======================================================
 
-import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from model import load_dataset, analyze_efficiency
+import streamlit as st
+import metrics
+from cache import (cached_catalog, cached_chart_png, cached_component_table, cached_portfolio_png,
+                   cached_summary, cached_surface, cached_uncertainty)
+from regions import DEFAULT_REGION, REGIONS, tariff_values
+from scoring import MODERN, UPDATED, rank, score_all_categories, score_summary, tier_names
+from shared import Overloaded
 
 # ------------------------------------------------------
 # Streamlit Page Config
@@ -17,187 +20,257 @@ st.set_page_config(
     page_icon="🌱"
 )
 
-# ------------------------------------------------------
-# Header
-# ------------------------------------------------------
-st.markdown(
-    """
-    <style>
-    .main-title {
-        text-align: center;
-        font-size: 2.2em;
-        color: #2E7D32;
-        font-weight: 700;
-        margin-bottom: 0;
-    }
-    .subtitle {
-        text-align: center;
-        font-size: 1.1em;
-        color: #388E3C;
-        margin-bottom: 1.5em;
-    }
-    .metric-card {
-        background-color: #E8F5E9;
-        border-radius: 15px;
-        padding: 15px;
-        text-align: center;
-        box-shadow: 0px 0px 8px rgba(46,125,50,0.2);
-    }
-    .metric-value {
-        font-size: 1.4em;
-        font-weight: 700;
-        color: #1B5E20;
-    }
-    .metric-label {
-        color: #388E3C;
-        font-size: 0.9em;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+# Opt-in instrumentation: no-ops unless ECOFUSION_METRICS / ECOFUSION_PROFILE
+# are set on the server. Everything below runs inside try/finally, so reruns
+# interrupted by st.stop(), a widget-triggered rerun or an error still stop
+# the profiler.
+rerun_profile = metrics.start_profile("app-rerun")
+rerun_timer = metrics.start("app.rerun")
 
-st.markdown("<div class='main-title'>🌿 EcoFusion 2.0</div>", unsafe_allow_html=True)
-st.markdown("<div class='subtitle'>Sustainable Intelligence Framework for Appliance Efficiency & CO₂ Optimization</div>", unsafe_allow_html=True)
+try:
+    # ------------------------------------------------------
+    # Header
+    # ------------------------------------------------------
+    st.markdown(
+        """
+        <style>
+        .main-title {
+            text-align: center;
+            font-size: 2.2em;
+            color: #2E7D32;
+            font-weight: 700;
+            margin-bottom: 0;
+        }
+        .subtitle {
+            text-align: center;
+            font-size: 1.1em;
+            color: #388E3C;
+            margin-bottom: 1.5em;
+        }
+        .metric-card {
+            background-color: #E8F5E9;
+            border-radius: 15px;
+            padding: 15px;
+            text-align: center;
+            box-shadow: 0px 0px 8px rgba(46,125,50,0.2);
+        }
+        .metric-value {
+            font-size: 1.4em;
+            font-weight: 700;
+            color: #1B5E20;
+        }
+        .metric-label {
+            color: #388E3C;
+            font-size: 0.9em;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True
+    )
 
-df = load_dataset()
+    st.markdown("<div class='main-title'>🌿 EcoFusion 2.0</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Sustainable Intelligence Framework for Appliance Efficiency & CO₂ Optimization</div>", unsafe_allow_html=True)
 
-# ------------------------------------------------------
-# Sidebar Controls
-# ------------------------------------------------------
-st.sidebar.header("⚙️ Configuration Panel")
-category = st.sidebar.selectbox("Select Appliance Category", df["Category"].tolist())
-hours_per_day = st.sidebar.slider("Average Usage Hours per Day", 1, 24, 6)
-electricity_rate = st.sidebar.slider("Electricity Rate (₹ per kWh)", 3, 15, 7)
+    catalog = cached_catalog()
 
-# ------------------------------------------------------
-# Data Analysis
-# ------------------------------------------------------
-summary = analyze_efficiency(category, hours_per_day, electricity_rate)
-row = summary["old_row"]
+    # ------------------------------------------------------
+    # Sidebar Controls
+    # ------------------------------------------------------
+    st.sidebar.header("⚙️ Configuration Panel")
+    view = st.sidebar.radio("View", ["Single Appliance", "Household Portfolio"], horizontal=True)
+    if view == "Single Appliance":
+        category = st.sidebar.selectbox("Select Appliance Category", list(catalog.categories))
+    region_code = st.sidebar.selectbox("Region", list(REGIONS), index=list(REGIONS).index(DEFAULT_REGION),
+                                       format_func=lambda code: f"{REGIONS[code].name} ({REGIONS[code].currency})")
+    region = REGIONS[region_code]
+    cur = region.symbol
+    HOURS_RANGE = tuple(range(1, 25))
+    RATE_RANGE = tariff_values(region_code)
+    hours_per_day = st.sidebar.slider("Average Usage Hours per Day", HOURS_RANGE[0], HOURS_RANGE[-1], 6)
+    electricity_rate = st.sidebar.slider(f"Electricity Rate ({cur} per kWh)", RATE_RANGE[0], RATE_RANGE[-1],
+                                         region.tariff, step=region.tariff_range[2])
 
-# ------------------------------------------------------
-# Metric Cards
-# ------------------------------------------------------
-st.subheader(f"📊 {category} Energy & CO₂ Efficiency Summary")
-
-col1, col2, col3, col4 = st.columns(4)
-col1.markdown(
-    f"<div class='metric-card'><div class='metric-value'>{summary['energy_diff']:.1f} W/hr</div>"
-    f"<div class='metric-label'>⚡ Energy Reduction</div></div>", unsafe_allow_html=True)
-col2.markdown(
-    f"<div class='metric-card'><div class='metric-value'>{summary['co2_diff']:.3f} kg/hr</div>"
-    f"<div class='metric-label'>🌫 CO₂ Reduction</div></div>", unsafe_allow_html=True)
-col3.markdown(
-    f"<div class='metric-card'><div class='metric-value'>+{summary['eff_gain']:.1f}%</div>"
-    f"<div class='metric-label'>⚙️ Efficiency Gain</div></div>", unsafe_allow_html=True)
-col4.markdown(
-    f"<div class='metric-card'><div class='metric-value'>₹{summary['annual_cost_saved']:.1f}/yr</div>"
-    f"<div class='metric-label'>💰 Annual Cost Saved</div></div>", unsafe_allow_html=True)
-
-st.markdown("---")
 
-# ------------------------------------------------------
-# Component Comparison Table
-# ------------------------------------------------------
-st.subheader("🔧 Component Evolution: Legacy → Modern → Self-Upgrading")
-
-components = summary["components"]
-if components:
-    # Align component lengths safely
-    all_keys = set(components["Old"].keys()) | set(components["Modern"].keys()) | set(components["Updated"].keys())
-
-    def get_value(dic, key): return dic.get(key, "")
-    comp_data = {
-        "Component": list(all_keys),
-        "Legacy": [get_value(components["Old"], k) for k in all_keys],
-        "Modern": [get_value(components["Modern"], k) for k in all_keys],
-        "Updated (Self-Upgrading)": [get_value(components["Updated"], k) for k in all_keys],
-    }
-    comp_df = pd.DataFrame(comp_data)
-    st.dataframe(comp_df, use_container_width=True, hide_index=True)
-else:
-    st.info("Component details unavailable for this category.")
-
-st.markdown("---")
+    # ------------------------------------------------------
+    # Footer (shared by both views)
+    # ------------------------------------------------------
+    def render_footer():
+        st.markdown("---")
+        st.caption("© EcoFusion 2.0 | Sustainable Intelligence Framework | Developed for IBM Z Datathon 🌱")
 
-# ------------------------------------------------------
-# Charts Section
-# ------------------------------------------------------
-st.markdown("### 📈 Comparative Performance Visualization")
-
-col1, col2, col3 = st.columns(3)
-with col1:
-    fig, ax = plt.subplots(figsize=(3.5, 2.5))
-    ax.bar(["Legacy", "Modern", "Updated"],
-           [row["Old_CO2(kg/hr)"], row["Modern_CO2(kg/hr)"], row["Updated_CO2(kg/hr)"]],
-           color=["#e74c3c", "#f1c40f", "#2ecc71"])
-    ax.set_title("CO₂ Emission (kg/hr)")
-    st.pyplot(fig)
-
-with col2:
-    fig, ax = plt.subplots(figsize=(3.5, 2.5))
-    ax.bar(["Legacy", "Modern", "Updated"],
-           [row["Old_Energy(W)"], row["Modern_Energy(W)"], row["Updated_Energy(W)"]],
-           color=["#ff7043", "#fbc02d", "#66bb6a"])
-    ax.set_title("Energy Consumption (W)")
-    st.pyplot(fig)
-
-with col3:
-    fig, ax = plt.subplots(figsize=(3.5, 2.5))
-    ax.bar(["Legacy", "Modern", "Updated"],
-           [row["Old_Eff(%)"], row["Modern_Eff(%)"], row["Updated_Eff(%)"]],
-           color=["#ef5350", "#fdd835", "#43a047"])
-    ax.set_title("Efficiency (%)")
-    st.pyplot(fig)
+        if rerun_profile.path:
+            st.caption(f"🧪 cProfile snapshot written to `{rerun_profile.path}`")
+        if metrics.ENABLED and st.query_params.get("metrics") == "1":
+            with st.expander("📟 Stage Metrics (Prometheus)"):
+                st.code(metrics.prometheus_text(), language="text")
 
-# ------------------------------------------------------
-# Radar Chart — Multi-Factor Comparison
-# ------------------------------------------------------
-st.markdown("### 🕸️ Multi-Factor Performance Radar")
-
-metrics = ["Efficiency", "CO₂ (low=better)", "Energy (low=better)", "Cost"]
-old_vals = [row["Old_Eff(%)"], row["Old_CO2(kg/hr)"]*100, row["Old_Energy(W)"]/10, row["Old_Cost($)"]/10]
-modern_vals = [row["Modern_Eff(%)"], row["Modern_CO2(kg/hr)"]*100, row["Modern_Energy(W)"]/10, row["Modern_Cost($)"]/10]
-updated_vals = [row["Updated_Eff(%)"], row["Updated_CO2(kg/hr)"]*100, row["Updated_Energy(W)"]/10, row["Updated_Cost($)"]/10]
-
-# Close radar loop
-old_vals += old_vals[:1]
-modern_vals += modern_vals[:1]
-updated_vals += updated_vals[:1]
-angles = np.linspace(0, 2*np.pi, len(metrics), endpoint=False).tolist()
-angles += angles[:1]
-
-fig2 = plt.figure(figsize=(5, 5))
-ax2 = plt.subplot(111, polar=True)
-ax2.plot(angles, old_vals, 'r-', linewidth=2, label='Legacy')
-ax2.fill(angles, old_vals, 'r', alpha=0.25)
-ax2.plot(angles, modern_vals, 'y-', linewidth=2, label='Modern')
-ax2.fill(angles, modern_vals, 'y', alpha=0.25)
-ax2.plot(angles, updated_vals, 'g-', linewidth=2, label='Updated')
-ax2.fill(angles, updated_vals, 'g', alpha=0.25)
-ax2.set_xticks(angles[:-1])
-ax2.set_xticklabels(metrics)
-ax2.set_title(f"{category} – Multi-Factor Radar", color="#1B5E20", fontsize=11)
-ax2.legend(loc="upper right", bbox_to_anchor=(1.3, 1.1))
-st.pyplot(fig2)
 
-# ------------------------------------------------------
-# Recommendation Engine
-# ------------------------------------------------------
-st.markdown("### 🏆 Smart Upgrade Recommendation")
+    def show_png(render, *args):
+        """Show a cached chart PNG; when the render pool is saturated, say so instead."""
+        try:
+            st.image(render(*args), use_container_width=True)
+        except Overloaded:
+            st.info("⏳ The server is busy rendering charts for other users — this chart will appear on the next refresh.")
 
-eco_score = (summary["eff_gain"] * 3) + (summary["annual_co2_saved"] / 10) + (summary["annual_cost_saved"] / 100)
 
-if eco_score > 120:
-    st.success(f"✅ **{summary['updated']}** is the optimal next-gen upgrade for your {category}.")
-elif eco_score > 80:
-    st.info(f"🟡 **{summary['modern']}** provides balanced efficiency and affordability.")
-else:
-    st.warning(f"⚠️ Continue with the **{summary['old']}** until newer models become viable.")
+    # ------------------------------------------------------
+    # Household Portfolio — every category in one vectorized pass
+    # ------------------------------------------------------
+    if view == "Household Portfolio":
+        st.subheader("🏠 Household Portfolio — All Appliances at a Glance")
 
-# ------------------------------------------------------
-# Footer
-# ------------------------------------------------------
-st.markdown("---")
-st.caption("© EcoFusion 2.0 | Sustainable Intelligence Framework | Developed for IBM Z Datathon 🌱")
+        with metrics.stage("app.portfolio"):
+            portfolio = score_all_categories(hours_per_day, electricity_rate, region=region_code)
+        order = rank(portfolio["eco_score"])
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.markdown(
+            f"<div class='metric-card'><div class='metric-value'>{portfolio['annual_energy_saved'].sum():,.0f} kWh/yr</div>"
+            f"<div class='metric-label'>⚡ Energy Saved</div></div>", unsafe_allow_html=True)
+        col2.markdown(
+            f"<div class='metric-card'><div class='metric-value'>{portfolio['annual_co2_saved'].sum():,.0f} kg/yr</div>"
+            f"<div class='metric-label'>🌫 CO₂ Avoided</div></div>", unsafe_allow_html=True)
+        col3.markdown(
+            f"<div class='metric-card'><div class='metric-value'>{cur}{portfolio['annual_cost_saved'].sum():,.0f}/yr</div>"
+            f"<div class='metric-label'>💰 Annual Cost Saved</div></div>", unsafe_allow_html=True)
+        col4.markdown(
+            f"<div class='metric-card'><div class='metric-value'>{int((portfolio['tier'] == UPDATED).sum())}"
+            f" / {len(order)}</div><div class='metric-label'>🏆 Ready for Next-Gen Upgrade</div></div>",
+            unsafe_allow_html=True)
+
+        st.markdown("### 🏆 Ranked Upgrade Savings")
+        names = [portfolio["categories"][i] for i in order.tolist()]
+        ranked = pd.DataFrame({
+            "Rank": range(1, len(order) + 1),
+            "Category": names,
+            "Recommendation": tier_names(portfolio["tier"][order]),
+            "Recommended Model": portfolio["recommended"][order],
+            "Eco Score": portfolio["eco_score"][order].round(1),
+            "Energy Saved (kWh/yr)": portfolio["annual_energy_saved"][order].round(1),
+            "CO₂ Avoided (kg/yr)": portfolio["annual_co2_saved"][order].round(1),
+            f"Cost Saved ({cur}/yr)": portfolio["annual_cost_saved"][order].round(1),
+        })
+        st.dataframe(ranked, use_container_width=True, hide_index=True)
+        st.bar_chart(ranked.set_index("Category")[f"Cost Saved ({cur}/yr)"], horizontal=True)
+
+        st.markdown("### 🎲 Savings & Payback Uncertainty (Monte Carlo, P10 – P90)")
+        with metrics.stage("app.uncertainty"):
+            bands = cached_uncertainty(hours_per_day, electricity_rate, region_code)
+        cost, payback = bands["annual_cost_saved"], bands["payback_years"]
+        st.dataframe(pd.DataFrame({
+            "Category": names,
+            f"Cost Saved P10 ({cur}/yr)": cost["p10"][order].round(1),
+            f"Cost Saved P50 ({cur}/yr)": cost["p50"][order].round(1),
+            f"Cost Saved P90 ({cur}/yr)": cost["p90"][order].round(1),
+            "Payback P10 (yrs)": payback["p10"][order].round(1),
+            "Payback P50 (yrs)": payback["p50"][order].round(1),
+            "Payback P90 (yrs)": payback["p90"][order].round(1),
+        }), use_container_width=True, hide_index=True)
+
+        st.markdown("### 📈 Comparative Performance — All Categories")
+        with metrics.stage("app.charts"):
+            show_png(cached_portfolio_png, region_code)
+
+        render_footer()
+        st.stop()
+
+    # ------------------------------------------------------
+    # Data Analysis
+    # ------------------------------------------------------
+    with metrics.stage("app.summary"):
+        summary = cached_summary(category, hours_per_day, electricity_rate, region_code)
+
+    # ------------------------------------------------------
+    # Metric Cards
+    # ------------------------------------------------------
+    st.subheader(f"📊 {category} Energy & CO₂ Efficiency Summary")
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.markdown(
+        f"<div class='metric-card'><div class='metric-value'>{summary['energy_diff']:.1f} W/hr</div>"
+        f"<div class='metric-label'>⚡ Energy Reduction</div></div>", unsafe_allow_html=True)
+    col2.markdown(
+        f"<div class='metric-card'><div class='metric-value'>{summary['co2_diff']:.3f} kg/hr</div>"
+        f"<div class='metric-label'>🌫 CO₂ Reduction</div></div>", unsafe_allow_html=True)
+    col3.markdown(
+        f"<div class='metric-card'><div class='metric-value'>+{summary['eff_gain']:.1f}%</div>"
+        f"<div class='metric-label'>⚙️ Efficiency Gain</div></div>", unsafe_allow_html=True)
+    col4.markdown(
+        f"<div class='metric-card'><div class='metric-value'>{cur}{summary['annual_cost_saved']:.1f}/yr</div>"
+        f"<div class='metric-label'>💰 Annual Cost Saved</div></div>", unsafe_allow_html=True)
+
+    with st.expander(f"📐 Savings Sensitivity — Annual Cost Saved ({cur}/yr) by Hours × Rate"):
+        surface = cached_surface(category, HOURS_RANGE, RATE_RANGE, region_code)
+        st.dataframe(
+            pd.DataFrame(surface["annual_cost_saved"], index=pd.Index(HOURS_RANGE, name="hours/day"),
+                         columns=[f"{cur}{r}" for r in RATE_RANGE]).round(1),
+            use_container_width=True)
+
+    with st.expander("🎲 Uncertainty — Monte Carlo Savings & Payback Bands"):
+        with metrics.stage("app.uncertainty"):
+            bands = cached_uncertainty(hours_per_day, electricity_rate, region_code)
+        i = bands["categories"].index(category)
+        st.dataframe(
+            pd.DataFrame([[bands[m][p][i] for p in ("p10", "p50", "p90", "mean")]
+                          for m in ("annual_cost_saved", "annual_co2_saved", "payback_years")],
+                         index=[f"Cost Saved ({cur}/yr)", "CO₂ Avoided (kg/yr)", "Payback (years)"],
+                         columns=["P10", "P50", "P90", "Mean"]).round(2),
+            use_container_width=True)
+        st.caption(f"{bands['samples']:,} samples: usage ±50% and tariff ±20% around the sliders, "
+                   f"grid factor {region.emission_factor:g} kg/kWh ±15%; upgrade price {cur}{bands['upgrade_cost'][i]:,.0f}.")
+
+    st.markdown("---")
+
+    # ------------------------------------------------------
+    # Component Comparison Table
+    # ------------------------------------------------------
+    st.subheader("🔧 Component Evolution: Legacy → Modern → Self-Upgrading")
+
+    with metrics.stage("app.component_table"):
+        comp_df = cached_component_table(category)
+    if comp_df is not None:
+        st.dataframe(comp_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("Component details unavailable for this category.")
+
+    st.markdown("---")
+
+    # ------------------------------------------------------
+    # Charts Section
+    # ------------------------------------------------------
+    st.markdown("### 📈 Comparative Performance Visualization")
+
+    col1, col2, col3 = st.columns(3)
+    with metrics.stage("app.charts"):
+        for col, kind in ((col1, "co2"), (col2, "energy"), (col3, "efficiency")):
+            with col:
+                show_png(cached_chart_png, category, kind, region_code)
+
+    # ------------------------------------------------------
+    # Radar Chart — Multi-Factor Comparison
+    # ------------------------------------------------------
+    st.markdown("### 🕸️ Multi-Factor Performance Radar")
+    with metrics.stage("app.radar"):
+        show_png(cached_chart_png, category, "radar", region_code)
+
+    # ------------------------------------------------------
+    # Recommendation Engine
+    # ------------------------------------------------------
+    st.markdown("### 🏆 Smart Upgrade Recommendation")
+
+    _, tier = score_summary(summary, region=region_code)
+
+    if tier == UPDATED:
+        st.success(f"✅ **{summary['updated']}** is the optimal next-gen upgrade for your {category}.")
+    elif tier == MODERN:
+        st.info(f"🟡 **{summary['modern']}** provides balanced efficiency and affordability.")
+    else:
+        st.warning(f"⚠️ Continue with the **{summary['old']}** until newer models become viable.")
+
+    # ------------------------------------------------------
+    # Footer
+    # ------------------------------------------------------
+    render_footer()
+finally:
+    rerun_timer.stop()
+    rerun_profile.stop()
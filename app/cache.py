@@ -0,0 +1,152 @@
+# ======================================================
+# cache.py — EcoFusion 2.0 Streamlit Caching Layer
+# ======================================================
+# The input space is small (8 categories × 24 hours × 13 rates), so every
+# expensive step of a rerun is memoized process-wide with bounded LRU caches.
+# Everything expensive depends on the category alone; slider parameters only
+# feed a few multiplications, which are re-applied on each rerun uncached.
+# Category summaries and chart PNGs are also kept in the persistent on-disk
+# cache (disk_cache.py), so a restarted process starts warm. Switching region
+# only swaps in precomputed regional columns (regions.py); region-dependent
+# entries are keyed by the resolved Region tuple, so register_region()
+# overrides never hit stale results in either cache layer. Misses go through
+# the shared layer (shared.py): concurrent sessions asking for the same value
+# compute it once, and chart PNGs render on the bounded render pool.
+
+import streamlit as st
+
+from catalog import get_catalog
+from disk_cache import persistent
+from shared import shared
+from charts import BAR_CHARTS, TIERS, bar_chart_png, portfolio_chart_png, radar_chart_png
+from model import category_summary, regional_row, savings_surface, usage_savings
+from montecarlo import factor_distribution, scenario_distributions, simulate_uncertainty
+from regions import DEFAULT_REGION, get_region, get_region_table
+
+CATEGORY_CACHE_SIZE = 64
+SURFACE_CACHE_SIZE = 64
+TABLE_CACHE_SIZE = 64
+CHART_CACHE_SIZE = 128
+UNCERTAINTY_CACHE_SIZE = 64
+PORTFOLIO_CACHE_SIZE = 16  # one PNG per region
+UNCERTAINTY_SAMPLES = 200_000
+# Chart kinds that plot CO₂ and therefore depend on the region's grid
+REGIONAL_CHARTS = ("co2", "radar")
+
+
+@st.cache_resource(show_spinner=False)
+def cached_catalog():
+    return get_catalog()
+
+
+@st.cache_resource(max_entries=CATEGORY_CACHE_SIZE, show_spinner=False)
+def cached_category_summary(category):
+    """Category-only part of the summary (shared across sessions, read-only)."""
+    return _stored_category_summary(category)
+
+
+@shared("category_summary")
+@persistent("category_summary")
+def _stored_category_summary(category):
+    return category_summary(category)
+
+
+def cached_summary(category, hours_per_day, electricity_rate, region=DEFAULT_REGION):
+    """analyze_efficiency, recomputing only the parameter-dependent fields."""
+    base = cached_category_summary(category)
+    i = cached_catalog().index_of(category)
+    base = {**base, "co2_diff": get_region_table().column("CO2_Diff", region)[i]}
+    if get_region(region).emission_factor != cached_catalog().co2_factor:
+        base["old_row"] = regional_row(base["old_row"].copy(), category, region)
+    return {**base, **usage_savings(base, hours_per_day, electricity_rate)}
+
+
+def cached_surface(category, hours_per_day, electricity_rate, region=DEFAULT_REGION):
+    """savings_surface for hashable ``hours_per_day`` / ``electricity_rate`` sweeps."""
+    return _cached_surface(category, hours_per_day, electricity_rate, get_region(region))
+
+
+@st.cache_data(max_entries=SURFACE_CACHE_SIZE, show_spinner=False)
+def _cached_surface(category, hours_per_day, electricity_rate, region):
+    return savings_surface(category, hours_per_day, electricity_rate, region.code)
+
+
+@st.cache_data(max_entries=TABLE_CACHE_SIZE, show_spinner=False)
+def cached_component_table(category):
+    """Legacy/Modern/Updated component table, or None if unavailable"""
+    table = cached_catalog().component_table(category)
+    return None if table is None else table.to_frame()
+
+
+def cached_chart_png(category, kind, region=DEFAULT_REGION):
+    """PNG bytes for one chart; ``kind`` is a BAR_CHARTS key or "radar"."""
+    # Energy / efficiency charts are the same in every region
+    return _cached_chart_png(category, kind, get_region(region if kind in REGIONAL_CHARTS else DEFAULT_REGION))
+
+
+@st.cache_data(max_entries=CHART_CACHE_SIZE, show_spinner=False)
+def _cached_chart_png(category, kind, region):
+    return _stored_chart_png(category, kind, region)
+
+
+@shared("chart_png", pool=True)
+@persistent("chart_png")
+def _stored_chart_png(category, kind, region):
+    # Runs on a render-pool thread: no Streamlit script context, so use the
+    # catalog directly rather than through cached_catalog()
+    row = regional_row(get_catalog().row(category), category, region.code)
+    if kind == "radar":
+        return radar_chart_png(row, category)
+    return bar_chart_png(row, kind)
+
+
+def cached_portfolio_png(region=DEFAULT_REGION):
+    """Small-multiples PNG of every category (depends only on catalog and region)."""
+    return _cached_portfolio_png(get_region(region))
+
+
+@st.cache_data(max_entries=PORTFOLIO_CACHE_SIZE, show_spinner=False)
+def _cached_portfolio_png(region):
+    return _stored_portfolio_png(region)
+
+
+@shared("portfolio_png", pool=True)
+@persistent("portfolio_png")
+def _stored_portfolio_png(region):
+    catalog = get_catalog()
+    rows = [catalog.index_of(c) for c in catalog.categories]
+    regional = get_region_table()
+    table = {f"{tier}_{suffix}": catalog.columns.take(f"{tier}_{suffix}", rows)
+             for _, suffix, _ in BAR_CHARTS.values() for tier in TIERS}
+    for tier in TIERS:
+        table[f"{tier}_CO2(kg/hr)"] = regional.column(f"{tier}_CO2(kg/hr)", region.code)[rows]
+    return portfolio_chart_png(table, catalog.categories)
+
+
+def cached_uncertainty(hours_per_day, electricity_rate, region=DEFAULT_REGION):
+    """Monte Carlo savings / payback bands for every category around the sliders."""
+    return _cached_uncertainty(hours_per_day, electricity_rate, get_region(region))
+
+
+@st.cache_data(max_entries=UNCERTAINTY_CACHE_SIZE, show_spinner=False)
+def _cached_uncertainty(hours_per_day, electricity_rate, region):
+    return _stored_uncertainty(hours_per_day, electricity_rate, region)
+
+
+@shared("uncertainty")
+@persistent("uncertainty")
+def _stored_uncertainty(hours_per_day, electricity_rate, region):
+    hours, rate = scenario_distributions(hours_per_day, electricity_rate)
+    # In-process: the server's threads make forking a worker pool unsafe
+    return simulate_uncertainty(hours, rate, factor_distribution(region.emission_factor),
+                                samples=UNCERTAINTY_SAMPLES, workers=1, price_rate=region.per_usd)
+
+
+def clear_caches():
+    cached_category_summary.clear()
+    _cached_surface.clear()
+    cached_component_table.clear()
+    _cached_chart_png.clear()
+    _cached_portfolio_png.clear()
+    _cached_uncertainty.clear()
+    cached_catalog.clear()
@@ -0,0 +1,348 @@
+# ======================================================
+# catalog.py — EcoFusion 2.0 Precomputed Appliance Catalog
+# ======================================================
+# The catalog is loaded from the columnar bundle in data/catalog/ (see
+# catalog_store.py). Set ECOFUSION_CATALOG to point at another bundle.
+# Opening it only memory-maps arrays and indexes category codes with NumPy;
+# text columns are decoded and derived columns computed on first access, so
+# startup cost and memory stay flat as the catalog grows.
+# pandas is imported lazily: lookups, records and batch scoring by category
+# code only need NumPy, which keeps cold import of the analysis core fast.
+
+import os
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+
+from catalog_store import BUNDLE_PATH, TIERS, read_bundle
+from metrics import instrument
+from utils import EMISSION_FACTOR, co2_from_watts
+
+
+CO2_FACTOR = EMISSION_FACTOR  # kg CO₂ per kWh
+
+
+def _frozen(values):
+    arr = np.asarray(values)
+    if arr.dtype.kind == "U":
+        arr = arr.astype(object)
+    if arr.flags.writeable:
+        arr.flags.writeable = False
+    return arr
+
+
+class _Columns(Mapping):
+    """Read-only column mapping that decodes / derives columns on first use."""
+
+    def __init__(self, raw, text_columns, strings, derived):
+        self._raw = raw
+        self._text = text_columns
+        self._strings = strings
+        self._derived = derived
+        self._names = tuple(raw) + tuple(derived)
+        self._cache = {}
+
+    def __getitem__(self, name):
+        arr = self._cache.get(name)
+        if arr is None:
+            if name in self._derived:
+                arr = self._derived[name](self.__getitem__)
+            elif name in self._text:
+                arr = self._strings.decode(self._raw[name])
+            else:
+                arr = self._raw[name]
+            arr = self._cache[name] = _frozen(arr)
+        return arr
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._raw or name in self._derived
+
+    def codes(self, name):
+        """Raw int32 string codes of a text column."""
+        return self._raw[name]
+
+    def take(self, name, rows):
+        """Values of ``name`` at ``rows`` without materializing the column."""
+        if name in self._cache:
+            out = self._cache[name][rows]
+        elif name in self._derived:
+            out = self._derived[name](lambda dep: self.take(dep, rows))
+        elif name in self._text:
+            codes = self._raw[name][rows]
+            out = self._strings[int(codes)] if np.ndim(codes) == 0 else self._strings.decode(codes)
+        else:
+            out = self._raw[name][rows]
+        if isinstance(out, np.ndarray) and out.ndim == 0:
+            out = out[()]
+        return out
+
+
+class ComponentTable:
+    """Aligned Legacy/Modern/Updated component table for one category.
+
+    ``keys`` holds attribute string codes in first-appearance order (Old,
+    then Modern, then Updated), and ``values`` is a (3, len(keys)) array of
+    value codes, -1 where a tier lacks the attribute. Both are views into
+    catalog-wide arrays; strings are decoded through the catalog's interned
+    component vocabulary only when a table is rendered.
+    """
+
+    __slots__ = ("category", "keys", "values", "_decode")
+
+    COLUMNS = ("Component", "Legacy", "Modern", "Updated (Self-Upgrading)")
+
+    def __init__(self, category, keys, values, decode):
+        self.category = category
+        self.keys = keys
+        self.values = values
+        self._decode = decode
+
+    def __len__(self):
+        return len(self.keys)
+
+    def attributes(self):
+        return self._decode(self.keys.tolist())
+
+    def column(self, tier):
+        """Decoded values of one tier ("Old", "Modern" or "Updated"), "" if missing."""
+        return self._decode(self.values[TIERS.index(tier)].tolist())
+
+    def to_dict(self):
+        """``{column: [values]}`` in display order."""
+        return dict(zip(self.COLUMNS, [self.attributes()] + [self.column(t) for t in TIERS]))
+
+    def to_frame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.to_dict())
+
+
+class ApplianceCatalog:
+    """Immutable, category-indexed view of the appliance dataset.
+
+    CO₂ per tier is derived once per process, so lookups never rebuild a
+    DataFrame or scan rows. A category may span several rows (one per
+    appliance model line); scalar lookups use the first, matching the
+    original ``df[df["Category"] == c].iloc[0]``.
+    """
+
+    __slots__ = ("categories", "columns", "manifest", "strings", "co2_factor", "_index",
+                 "_category_codes", "_models", "_rows", "_records", "_components",
+                 "_component_spans", "_component_tables", "_component_index", "_vocabulary",
+                 "_breakdowns")
+
+    def __init__(self, bundle, co2_factor=CO2_FACTOR):
+        self.strings = bundle.strings
+        self.manifest = MappingProxyType(bundle.manifest)
+        self.co2_factor = co2_factor
+
+        # Derived columns are functions of a column getter, so they can be
+        # evaluated for the whole catalog or just the rows being looked up
+        derived = {"CO2_Factor": lambda get: np.full(np.shape(get("Old_Energy(W)")), co2_factor)}
+        for tier in TIERS:
+            derived[f"{tier}_CO2(kg/hr)"] = (
+                lambda get, tier=tier: co2_from_watts(get(f"{tier}_Energy(W)"), get("CO2_Factor")))
+        self.columns = _Columns(bundle.columns, bundle.text_columns, bundle.strings, derived)
+
+        # Category name -> first row, in order of first appearance
+        self._category_codes = np.asarray(bundle.columns["Category"])
+        uniques, first = np.unique(self._category_codes, return_index=True)
+        order = np.argsort(first, kind="stable")
+        self.categories = tuple(self.strings[c] for c in uniques[order].tolist())
+        self._index = dict(zip(self.categories, first[order].tolist()))
+
+        self._components = bundle.components
+        self._component_spans = {}
+        codes = np.asarray(bundle.components["category"])
+        if len(codes):
+            bounds = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)])).tolist()
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                self._component_spans[self.strings[int(codes[start])]] = (start, stop)
+        self._component_tables = {}
+        self._breakdowns = {}
+        self._component_index = None
+        self._vocabulary = {-1: ""}
+
+        self._models = None
+        self._rows = {}
+        self._records = {}
+
+    def __len__(self):
+        return len(self._category_codes)
+
+    def __contains__(self, category):
+        return category in self._index
+
+    def index_of(self, category):
+        try:
+            return self._index[category]
+        except KeyError:
+            raise KeyError(f"Unknown appliance category: {category!r}") from None
+
+    def rows_of(self, category):
+        """All row indices belonging to ``category``."""
+        code = self._category_codes[self.index_of(category)]
+        return np.flatnonzero(self._category_codes == code)
+
+    def find_model(self, name):
+        """Return ``(category, tier, row)`` for a component/model name."""
+        if self._models is None:
+            models = {}
+            for tier in TIERS:
+                codes = self.columns.codes(f"{tier}_Component")
+                uniques, first = np.unique(codes, return_index=True)
+                for code, row in zip(uniques.tolist(), first.tolist()):
+                    models.setdefault(self.strings[code], (row, tier))
+            self._models = models
+        try:
+            row, tier = self._models[name]
+        except KeyError:
+            raise KeyError(f"Unknown appliance model: {name!r}") from None
+        return self.columns["Category"][row], tier, row
+
+    def indices_of(self, categories):
+        """Map category names (or integer row codes) to an integer index array.
+
+        Names are resolved once per distinct value, so the cost is
+        independent of how many times each category repeats.
+        """
+        arr = np.asarray(categories)
+        if arr.dtype.kind in "iu":
+            if arr.size and (arr.min() < 0 or arr.max() >= len(self)):
+                raise IndexError("Category code out of range")
+            return arr.astype(np.intp, copy=False)
+        import pandas as pd
+
+        inverse, uniques = pd.factorize(arr.ravel())
+        codes = np.array([self.index_of(c) for c in uniques.tolist()], dtype=np.intp)
+        return codes[inverse].reshape(arr.shape)
+
+    def column(self, name):
+        return self.columns[name]
+
+    def value(self, category, name):
+        return self.columns[name][self.index_of(category)]
+
+    @instrument("catalog.row")
+    def row(self, category):
+        """Return a private copy of the catalog row for ``category``."""
+        i = self.index_of(category)
+        row = self._rows.get(i)
+        if row is None:
+            row = self._rows[i] = self.to_frame(slice(i, i + 1)).iloc[0]
+        return row.copy()
+
+    def record(self, category):
+        """Return the catalog row as a plain dict of Python scalars (no pandas)."""
+        i = self.index_of(category)
+        record = self._records.get(i)
+        if record is None:
+            values = {name: self.columns.take(name, i) for name in self.columns}
+            record = self._records[i] = MappingProxyType(
+                {name: v.item() if isinstance(v, np.generic) else v for name, v in values.items()})
+        return dict(record)
+
+    def components(self, category):
+        """Return a private copy of ``{tier: {attribute: value}}`` for one category, or None."""
+        breakdown = self._breakdowns.get(category)
+        if breakdown is None:
+            span = self._component_spans.get(category)
+            if span is None:
+                return None
+            start, stop = span
+            strings = self.strings
+            breakdown = {tier: {} for tier in TIERS}
+            arrays = (self._components[name][start:stop].tolist() for name in ("tier", "key", "value"))
+            for tier, key, value in zip(*arrays):
+                breakdown[TIERS[tier]][strings[key]] = strings[value]
+            self._breakdowns[category] = breakdown
+        return {tier: dict(attributes) for tier, attributes in breakdown.items()}
+
+    @property
+    def component_codes(self):
+        """Flat coded breakdown arrays: ``category``, ``tier``, ``key``, ``value``."""
+        return self._components
+
+    def _decode_components(self, codes):
+        # Component strings repeat heavily ("BLDC", "IoT", ...), so each code
+        # is decoded once and the same interned str is shared by every table
+        vocabulary = self._vocabulary
+        out = []
+        for code in codes:
+            value = vocabulary.get(code)
+            if value is None:
+                value = vocabulary[code] = sys.intern(self.strings[code])
+            out.append(value)
+        return out
+
+    def _build_component_index(self):
+        """Align every category's attributes in one vectorized pass.
+
+        Returns (keys, values, spans): attribute codes ordered by first
+        appearance within each category, a (3, n) value-code matrix (-1 =
+        missing) and each category's column range into both.
+        """
+        comp = self._components
+        codes = np.asarray(comp["category"])
+        keys = np.asarray(comp["key"]).astype(np.int64)
+        # Entry -> span number, so (span, key) identifies one table row
+        group = np.zeros(len(codes), dtype=np.int64)
+        if len(codes):
+            group[1:] = np.cumsum(codes[1:] != codes[:-1])
+        pair = group * (int(keys.max(initial=0)) + 1) + keys
+        _, first, inverse = np.unique(pair, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        column = np.empty_like(order)
+        column[order] = np.arange(len(order))
+
+        table_keys = keys[first[order]].astype(np.int32)
+        values = np.full((len(TIERS), len(order)), -1, dtype=np.int32)
+        values[np.asarray(comp["tier"]), column[inverse]] = comp["value"]
+        # Categories are stored as contiguous spans in _component_spans order
+        bounds = np.searchsorted(group[first[order]], np.arange(len(self._component_spans) + 1)).tolist()
+        table_keys.flags.writeable = values.flags.writeable = False
+        return table_keys, values, dict(zip(self._component_spans, zip(bounds[:-1], bounds[1:])))
+
+    def component_table(self, category):
+        """ComponentTable for ``category``, or None if it has no breakdown."""
+        table = self._component_tables.get(category)
+        if table is None:
+            if category not in self._component_spans:
+                return None
+            if self._component_index is None:
+                self._component_index = self._build_component_index()
+            keys, values, spans = self._component_index
+            lo, hi = spans[category]
+            table = self._component_tables[category] = ComponentTable(
+                category, keys[lo:hi], values[:, lo:hi], self._decode_components)
+        return table
+
+    def to_frame(self, rows=slice(None)):
+        import pandas as pd
+
+        return pd.DataFrame({name: np.array(self.columns.take(name, rows)) for name in self.columns},
+                            index=pd.RangeIndex(len(self))[rows])
+
+
+def load_catalog(path=None):
+    """Open the catalog bundle at ``path`` (default: $ECOFUSION_CATALOG or data/catalog)."""
+    return ApplianceCatalog(read_bundle(path or os.environ.get("ECOFUSION_CATALOG") or BUNDLE_PATH))
+
+
+_CATALOG = None
+
+
+def get_catalog():
+    """Return the process-wide catalog, building it on first use."""
+    global _CATALOG
+    if _CATALOG is None:
+        _CATALOG = load_catalog()
+    return _CATALOG
@@ -0,0 +1,245 @@
+# ======================================================
+# catalog_store.py — EcoFusion 2.0 Columnar Catalog Bundle
+# ======================================================
+# On-disk layout of a catalog bundle (a directory, e.g. data/catalog/):
+#
+#   manifest.json      format/version info, column schema, content hash
+#   strings.bin        interned string table shared by every text column,
+#   strings_offsets.npy  as one UTF-8 blob plus int64 start offsets
+#   col_XX.npy         one array per catalog column; text columns hold
+#                      int32 codes into the string table
+#   comp_*.npy         component breakdown as flat coded arrays
+#                      (category, tier, attribute key, attribute value)
+#
+# Arrays and the string blob are memory-mapped, so loading is zero-copy and
+# resident memory only grows with the pages actually touched.
+#
+# Run: python app/catalog_store.py export data/catalog out_dir/
+#      python app/catalog_store.py build appliances.csv components.csv data/catalog --version 2.1
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+FORMAT = "ecofusion-catalog"
+FORMAT_VERSION = 1
+BUNDLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "catalog")
+TIERS = ("Old", "Modern", "Updated")
+COMPONENT_ARRAYS = ("category", "tier", "key", "value")
+
+
+class CatalogFormatError(ValueError):
+    pass
+
+
+class StringTable:
+    """Read-only view of an interned string table stored as a UTF-8 blob.
+
+    Strings are decoded on access, so opening a table with millions of
+    entries costs two memory maps.
+    """
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+
+    @classmethod
+    def open(cls, path):
+        offsets = np.load(os.path.join(path, "strings_offsets.npy"), mmap_mode="r")
+        if offsets[-1] == 0:
+            return cls(np.empty(0, np.uint8), offsets)
+        return cls(np.memmap(os.path.join(path, "strings.bin"), dtype=np.uint8, mode="r"), offsets)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, code):
+        start, stop = self._offsets[code], self._offsets[code + 1]
+        return self._blob[start:stop].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def decode(self, codes):
+        """Object array of strings for an array of codes (one decode per distinct code)."""
+        codes = np.asarray(codes)
+        uniques, inverse = np.unique(codes, return_inverse=True)
+        table = np.array([self[c] for c in uniques.tolist()] or [""], dtype=object)
+        return table[inverse].reshape(codes.shape)
+
+
+class _StringTableBuilder:
+    def __init__(self):
+        self.strings = []
+        self._codes = {}
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+    def encode(self, values):
+        return np.array([self.code(v) for v in values], dtype=np.int32)
+
+
+def _content_hash(path, manifest):
+    digest = hashlib.sha256()
+    files = (["strings.bin", "strings_offsets.npy"] + [c["file"] for c in manifest["columns"]]
+             + list(manifest["components"].values()))
+    for name in files:
+        with open(os.path.join(path, name), "rb") as fh:
+            digest.update(fh.read())
+    return digest.hexdigest()
+
+
+def write_bundle(path, data, components, catalog_version):
+    """Write ``data`` (column name -> values) and ``components``
+    (category -> tier -> {attribute: value}) as a bundle at ``path``.
+    """
+    os.makedirs(path, exist_ok=True)
+    strings = _StringTableBuilder()
+
+    columns = []
+    for i, (name, values) in enumerate(data.items()):
+        arr = np.asarray(values)
+        kind = "str" if arr.dtype.kind in "UO" else "num"
+        if kind == "str":
+            arr = strings.encode(values)
+        filename = f"col_{i:02d}.npy"
+        np.save(os.path.join(path, filename), arr)
+        columns.append({"name": name, "file": filename, "kind": kind, "dtype": arr.dtype.str})
+
+    flat = {name: [] for name in COMPONENT_ARRAYS}
+    for category, tiers in components.items():
+        for t, tier in enumerate(TIERS):
+            for key, value in tiers.get(tier, {}).items():
+                flat["category"].append(strings.code(category))
+                flat["tier"].append(t)
+                flat["key"].append(strings.code(key))
+                flat["value"].append(strings.code(value))
+    component_files = {}
+    for name, values in flat.items():
+        filename = f"comp_{name}.npy"
+        dtype = np.int8 if name == "tier" else np.int32
+        np.save(os.path.join(path, filename), np.asarray(values, dtype=dtype))
+        component_files[name] = filename
+
+    encoded = [value.encode("utf-8") for value in strings.strings]
+    with open(os.path.join(path, "strings.bin"), "wb") as fh:
+        fh.write(b"".join(encoded))
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    np.save(os.path.join(path, "strings_offsets.npy"), offsets)
+
+    manifest = {
+        "format": FORMAT,
+        "format_version": FORMAT_VERSION,
+        "catalog_version": str(catalog_version),
+        "rows": len(next(iter(data.values()))),
+        "columns": columns,
+        "components": component_files,
+    }
+    manifest["content_hash"] = _content_hash(path, manifest)
+    with open(os.path.join(path, "manifest.json"), "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2, ensure_ascii=False)
+    return manifest
+
+
+CatalogBundle = namedtuple("CatalogBundle", "columns text_columns components strings manifest")
+
+
+def read_bundle(path=BUNDLE_PATH):
+    """Open a bundle as a :class:`CatalogBundle`.
+
+    Every array is a read-only memory map; text columns stay as int32 codes
+    into the interned :class:`StringTable` and are decoded by the caller.
+    """
+    with open(os.path.join(path, "manifest.json"), encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    if manifest.get("format") != FORMAT:
+        raise CatalogFormatError(f"{path} is not an EcoFusion catalog bundle")
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise CatalogFormatError(
+            f"Unsupported catalog format version {manifest.get('format_version')} "
+            f"(expected {FORMAT_VERSION})")
+
+    strings = StringTable.open(path)
+    columns = {col["name"]: np.load(os.path.join(path, col["file"]), mmap_mode="r")
+               for col in manifest["columns"]}
+    text_columns = frozenset(col["name"] for col in manifest["columns"] if col["kind"] == "str")
+    components = {name: np.load(os.path.join(path, filename), mmap_mode="r")
+                  for name, filename in manifest["components"].items()}
+    return CatalogBundle(columns, text_columns, components, strings, manifest)
+
+
+def decode_columns(bundle):
+    """Materialize every column, decoding text codes to Python strings."""
+    return {name: bundle.strings.decode(arr) if name in bundle.text_columns else arr
+            for name, arr in bundle.columns.items()}
+
+
+# ------------------------------------------------------
+# CSV import / export for maintaining catalogs
+# ------------------------------------------------------
+def export_csv(bundle, out_dir):
+    bundle = read_bundle(bundle)
+    columns, components, strings, manifest = (decode_columns(bundle), bundle.components,
+                                              bundle.strings, bundle.manifest)
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "appliances.csv"), "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(list(columns))
+        writer.writerows(zip(*(col.tolist() for col in columns.values())))
+    with open(os.path.join(out_dir, "components.csv"), "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["Category", "Tier", "Component", "Value"])
+        for c, t, k, v in zip(*(components[name].tolist() for name in COMPONENT_ARRAYS)):
+            writer.writerow([strings[c], TIERS[t], strings[k], strings[v]])
+    return manifest
+
+
+def build_from_csv(appliances_csv, components_csv, out, catalog_version):
+    import pandas as pd
+
+    frame = pd.read_csv(appliances_csv)
+    data = {name: frame[name].to_numpy() for name in frame.columns}
+    components = {}
+    with open(components_csv, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            tiers = components.setdefault(row["Category"], {tier: {} for tier in TIERS})
+            tiers[row["Tier"]][row["Component"]] = row["Value"]
+    return write_bundle(out, data, components, catalog_version)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or export EcoFusion catalog bundles")
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="write appliances.csv and components.csv from a bundle")
+    exp.add_argument("bundle")
+    exp.add_argument("out_dir")
+    build = sub.add_parser("build", help="build a bundle from appliances.csv and components.csv")
+    build.add_argument("appliances_csv")
+    build.add_argument("components_csv")
+    build.add_argument("out")
+    build.add_argument("--version", required=True, help="catalog version recorded in the manifest")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        manifest = export_csv(args.bundle, args.out_dir)
+    else:
+        manifest = build_from_csv(args.appliances_csv, args.components_csv, args.out, args.version)
+    print(f"🌱 catalog v{manifest['catalog_version']} ({manifest['rows']} rows, "
+          f"hash {manifest['content_hash'][:12]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# ======================================================
+# charts.py — EcoFusion 2.0 Reusable Chart Renderer (PNG bytes)
+# ======================================================
+# Figures are built once per chart kind with the object-oriented
+# matplotlib API (never registered with pyplot, so nothing leaks) and then
+# redrawn in place: each render only swaps bar heights / radar polygons.
+# matplotlib is imported on first render, so a dashboard served entirely
+# from cached PNGs never loads it.
+
+import io
+import threading
+
+import numpy as np
+
+from metrics import stage
+
+TIER_LABELS = ["Legacy", "Modern", "Updated"]
+TIERS = ("Old", "Modern", "Updated")
+
+# kind -> (title, column suffix, bar colours)
+BAR_CHARTS = {
+    "co2": ("CO₂ Emission (kg/hr)", "CO2(kg/hr)", ["#e74c3c", "#f1c40f", "#2ecc71"]),
+    "energy": ("Energy Consumption (W)", "Energy(W)", ["#ff7043", "#fbc02d", "#66bb6a"]),
+    "efficiency": ("Efficiency (%)", "Eff(%)", ["#ef5350", "#fdd835", "#43a047"]),
+}
+RADAR_METRICS = ["Efficiency", "CO₂ (low=better)", "Energy (low=better)", "Cost"]
+RADAR_STYLES = (("Old", "Legacy", "r"), ("Modern", "Modern", "y"), ("Updated", "Updated", "g"))
+
+
+def radar_values(row, tier):
+    vals = [row[f"{tier}_Eff(%)"], row[f"{tier}_CO2(kg/hr)"]*100,
+            row[f"{tier}_Energy(W)"]/10, row[f"{tier}_Cost($)"]/10]
+    # Close radar loop
+    return vals + vals[:1]
+
+
+class _BarChart:
+    __slots__ = ("fig", "ax", "bars", "suffix")
+    dpi = 200
+
+    def __init__(self, kind):
+        from matplotlib.figure import Figure
+
+        title, self.suffix, colors = BAR_CHARTS[kind]
+        self.fig = Figure(figsize=(3.5, 2.5))
+        self.ax = self.fig.subplots()
+        self.bars = self.ax.bar(TIER_LABELS, [0, 0, 0], color=colors)
+        self.ax.set_title(title)
+
+    def update(self, row, category):
+        for bar, tier in zip(self.bars, TIERS):
+            bar.set_height(row[f"{tier}_{self.suffix}"])
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+
+class _RadarChart:
+    __slots__ = ("fig", "ax", "lines", "fills", "angles")
+    dpi = 200
+
+    def __init__(self):
+        from matplotlib.figure import Figure
+
+        angles = np.linspace(0, 2*np.pi, len(RADAR_METRICS), endpoint=False).tolist()
+        self.angles = angles + angles[:1]
+        zeros = [0] * len(self.angles)
+
+        self.fig = Figure(figsize=(5, 5))
+        self.ax = self.fig.add_subplot(111, polar=True)
+        self.lines, self.fills = [], []
+        for _, label, color in RADAR_STYLES:
+            self.lines.append(self.ax.plot(self.angles, zeros, f"{color}-", linewidth=2, label=label)[0])
+            self.fills.append(self.ax.fill(self.angles, zeros, color, alpha=0.25)[0])
+        self.ax.set_xticks(self.angles[:-1])
+        self.ax.set_xticklabels(RADAR_METRICS)
+        self.ax.legend(loc="upper right", bbox_to_anchor=(1.3, 1.1))
+
+    def update(self, row, category):
+        for (tier, _, _), line, fill in zip(RADAR_STYLES, self.lines, self.fills):
+            vals = radar_values(row, tier)
+            line.set_ydata(vals)
+            fill.set_xy(np.column_stack([self.angles, vals]))
+        self.ax.set_title(f"{category} – Multi-Factor Radar", color="#1B5E20", fontsize=11)
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+
+class _PortfolioChart:
+    """Small multiples: one panel per BAR_CHARTS kind, a bar group per category."""
+
+    __slots__ = ("fig", "axes", "bars", "categories")
+    # ~1420 px wide: within Streamlit's 1460 px content width, so st.image
+    # serves the PNG as-is instead of resizing / re-encoding it every rerun
+    dpi = 130
+
+    def __init__(self):
+        from matplotlib.figure import Figure
+
+        self.fig = Figure()
+        self.axes = self.fig.subplots(1, len(BAR_CHARTS), sharey=True)
+        self.bars = None
+        self.categories = None
+
+    def _layout(self, categories):
+        n = len(categories)
+        self.fig.set_size_inches(11, 1.2 + 0.45 * n)
+        y = np.arange(n)
+        height = 0.8 / len(TIERS)
+        self.bars = {}
+        for ax, (kind, (title, _, colors)) in zip(self.axes, BAR_CHARTS.items()):
+            ax.clear()
+            self.bars[kind] = [
+                ax.barh(y + (t - 1) * height, np.zeros(n), height, color=colors[t], label=TIER_LABELS[t])
+                for t in range(len(TIERS))
+            ]
+            ax.set_title(title, fontsize=10)
+        # Axes share y, so one inversion lists categories top-down in all panels
+        self.axes[0].invert_yaxis()
+        self.axes[0].set_yticks(y)
+        self.axes[0].set_yticklabels(categories)
+        self.fig.tight_layout()
+        if not self.fig.legends:
+            self.fig.legend(self.bars["co2"], TIER_LABELS, loc="upper center", ncol=len(TIERS),
+                            bbox_to_anchor=(0.5, 0), fontsize=9, frameon=False)
+        self.categories = tuple(categories)
+
+    def update(self, table, categories):
+        """``table`` maps catalog column names to arrays aligned with ``categories``."""
+        if tuple(categories) != self.categories:
+            self._layout(categories)
+        for ax, (kind, (_, suffix, _)) in zip(self.axes, BAR_CHARTS.items()):
+            for bars, tier in zip(self.bars[kind], TIERS):
+                for bar, value in zip(bars, table[f"{tier}_{suffix}"]):
+                    bar.set_width(value)
+            ax.relim()
+            ax.autoscale_view()
+
+
+class ChartRenderer:
+    """Owns one persistent figure per chart kind and renders PNG bytes.
+
+    Streamlit runs sessions on separate threads, so rendering is serialized
+    with a lock; call ``close()`` to release every figure. Render-pool
+    workers (shared.py) each own a renderer, so the pool renders in parallel.
+    """
+
+    def __init__(self):
+        self._charts = {}
+        self._lock = threading.Lock()
+
+    def _chart(self, kind):
+        chart = self._charts.get(kind)
+        if chart is None:
+            if kind == "radar":
+                chart = _RadarChart()
+            elif kind == "portfolio":
+                chart = _PortfolioChart()
+            else:
+                chart = _BarChart(kind)
+            self._charts[kind] = chart
+        return chart
+
+    def render_png(self, kind, row, category):
+        with self._lock:
+            chart = self._chart(kind)
+            with stage("charts.draw"):
+                chart.update(row, category)
+            # Same savefig settings st.pyplot uses, so output looks unchanged
+            with stage("charts.savefig"):
+                buf = io.BytesIO()
+                chart.fig.savefig(buf, format="png", bbox_inches="tight", dpi=chart.dpi)
+            return buf.getvalue()
+
+    def close(self):
+        with self._lock:
+            for chart in self._charts.values():
+                chart.fig.clear()
+            self._charts.clear()
+
+
+_RENDERER = None
+_RENDERER_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+
+def use_thread_renderer():
+    """Give the calling thread its own ChartRenderer (a render-pool initializer)."""
+    _LOCAL.renderer = ChartRenderer()
+
+
+def get_renderer():
+    global _RENDERER
+    renderer = getattr(_LOCAL, "renderer", None)
+    if renderer is not None:
+        return renderer
+    with _RENDERER_LOCK:
+        if _RENDERER is None:
+            _RENDERER = ChartRenderer()
+        return _RENDERER
+
+
+def bar_chart_png(row, kind):
+    return get_renderer().render_png(kind, row, None)
+
+
+def radar_chart_png(row, category):
+    return get_renderer().render_png("radar", row, category)
+
+
+def portfolio_chart_png(table, categories):
+    """One PNG comparing every category across the BAR_CHARTS metrics."""
+    return get_renderer().render_png("portfolio", table, categories)
@@ -0,0 +1,213 @@
+# ======================================================
+# disk_cache.py — EcoFusion 2.0 Persistent Result Cache (SQLite)
+# ======================================================
+# Summaries and rendered chart PNGs survive restarts and are shared by every
+# process on the host (dashboard replicas, API workers, fleet jobs).
+#
+#   key    sha256(catalog content_hash, namespace, parameters)
+#   value  raw bytes, or pickled Python objects
+#
+# The database runs in WAL mode with a busy timeout, so concurrent readers
+# never block and writers from several processes serialize safely. Entries
+# carry a last-access time; once the total size exceeds max_bytes the least
+# recently used entries are evicted. When the catalog's content hash differs
+# from the one the database was last written with, all entries are dropped.
+#
+# ECOFUSION_CACHE_PATH   database file (default: $XDG_CACHE_HOME/ecofusion/results.sqlite)
+# ECOFUSION_CACHE_MB     size bound in MiB (default 256)
+# ECOFUSION_DISK_CACHE=0 disables the persistent layer
+#
+# It is only a cache: if the database cannot be opened, read or written
+# (unwritable path, locked or corrupt file), one warning is logged and the
+# wrapped functions are simply computed.
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from catalog import get_catalog
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get("ECOFUSION_CACHE_MB", 256)) * 2**20)
+ENABLED = os.environ.get("ECOFUSION_DISK_CACHE", "1").lower() not in ("0", "false", "no", "off")
+# Reads refresh an entry's LRU stamp at most this often, so hot keys do not
+# turn every lookup into a write transaction
+TOUCH_INTERVAL = 60.0
+
+_MISSING = object()
+# Errors that degrade the persistent layer to a pass-through
+CACHE_ERRORS = (OSError, sqlite3.Error)
+
+_LOG = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    pickled INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def default_path():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.environ.get("ECOFUSION_CACHE_PATH") or os.path.join(base, "ecofusion", "results.sqlite")
+
+
+class DiskCache:
+    """Size-bounded LRU key/value store in one SQLite file, scoped to a catalog version."""
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES, catalog_hash=None):
+        self.path = path or default_path()
+        self.max_bytes = max_bytes
+        self.catalog_hash = catalog_hash or get_catalog().manifest["content_hash"]
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._check_catalog()
+
+    def _conn(self):
+        # sqlite3 connections must not cross threads or fork boundaries
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _check_catalog(self):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE name = 'catalog_hash'").fetchone()
+            if row is None or row[0] != self.catalog_hash:
+                conn.execute("DELETE FROM entries")
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('catalog_hash', ?)", (self.catalog_hash,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def key(self, namespace, *params):
+        """Stable key for ``params`` under this catalog version."""
+        digest = hashlib.sha256(f"{self.catalog_hash}\0{namespace}\0{params!r}".encode())
+        return digest.hexdigest()
+
+    def get(self, key, default=None):
+        conn = self._conn()
+        row = conn.execute("SELECT value, pickled, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        value, pickled, accessed = row
+        now = time.time()
+        if now - accessed > TOUCH_INTERVAL:
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return pickle.loads(value) if pickled else bytes(value)
+
+    def set(self, key, value):
+        pickled = not isinstance(value, (bytes, bytearray, memoryview))
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) if pickled else bytes(value)
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                         (key, blob, int(pickled), len(blob), time.time()))
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            doomed.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def stats(self):
+        entries, size = self._conn().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"path": self.path, "entries": entries, "bytes": size, "max_bytes": self.max_bytes,
+                "catalog_hash": self.catalog_hash}
+
+    def clear(self):
+        self._conn().execute("DELETE FROM entries")
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+_UNAVAILABLE = set()  # database paths that failed to open
+_WARNED = False
+
+
+def _warn_unavailable(exc):
+    global _WARNED
+    if not _WARNED:
+        _WARNED = True
+        _LOG.warning("Persistent result cache unavailable, computing without it: %s", exc)
+
+
+def get_disk_cache():
+    """Process-wide DiskCache for get_catalog(), or None when disabled or unavailable."""
+    global _CACHE
+    if not ENABLED:
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE.catalog_hash != get_catalog().manifest["content_hash"]:
+            path = default_path()
+            if path in _UNAVAILABLE:
+                return None
+            try:
+                _CACHE = DiskCache(path)
+            except CACHE_ERRORS as exc:
+                _UNAVAILABLE.add(path)
+                _warn_unavailable(exc)
+                return None
+        return _CACHE
+
+
+def persistent(namespace):
+    """Memoize a function of hashable-repr arguments in the persistent cache."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args):
+            cache = get_disk_cache()
+            if cache is None:
+                return fn(*args)
+            key = cache.key(namespace, *args)
+            try:
+                value = cache.get(key, _MISSING)
+            except CACHE_ERRORS as exc:
+                _warn_unavailable(exc)
+                return fn(*args)
+            if value is _MISSING:
+                value = fn(*args)
+                try:
+                    cache.set(key, value)
+                except CACHE_ERRORS as exc:
+                    _warn_unavailable(exc)
+            return value
+        return wrapper
+    return decorate
@@ -0,0 +1,230 @@
+# ======================================================
+# metrics.py — EcoFusion 2.0 Opt-in Timing Instrumentation
+# ======================================================
+# Per-stage latency histograms for the analysis core, chart rendering and
+# dashboard reruns. Everything is off unless ECOFUSION_METRICS=1 is set when
+# the process starts:
+#
+#   @instrument("model.analyze_efficiency")   returns the function unchanged
+#   with stage("app.charts"): ...             a shared no-op context manager
+#   timer = start("app.rerun"); timer.stop()  same, for unindented code
+#
+# so disabled instrumentation adds no wrapper call at all. When enabled,
+# histograms are exported as Prometheus text (prometheus_text) or JSON
+# (snapshot / dump_json; also written at exit to ECOFUSION_METRICS_JSON).
+#
+# Profiling: with ECOFUSION_PROFILE=<dir> set on the server, profile() /
+# start_profile() record cProfile stats to
+# <dir>/<name>-<time>-<pid>-<n>.pstats, readable with pstats, snakeviz or flameprof.
+
+import atexit
+import bisect
+import contextlib
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+
+ENABLED = os.environ.get("ECOFUSION_METRICS", "").lower() in ("1", "true", "yes", "on")
+PROFILE_DIR = os.environ.get("ECOFUSION_PROFILE")
+JSON_PATH = os.environ.get("ECOFUSION_METRICS_JSON")
+
+# Upper bounds in seconds (Prometheus "le" labels); +Inf is implicit
+BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+           0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (counts per bucket, sum, count)."""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+_HISTOGRAMS = {}
+_LOCK = threading.Lock()
+
+
+def observe(name, seconds):
+    with _LOCK:
+        hist = _HISTOGRAMS.get(name)
+        if hist is None:
+            hist = _HISTOGRAMS[name] = Histogram()
+        hist.observe(seconds)
+
+
+class _Timer:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name):
+        self.name = name
+        self.t0 = time.perf_counter()
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def stop(self):
+        observe(self.name, time.perf_counter() - self.t0)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def stop(self):
+        pass
+
+
+_NULL = _NullTimer()
+
+
+def stage(name):
+    """Context manager timing a block as stage ``name`` (no-op when disabled)."""
+    return _Timer(name) if ENABLED else _NULL
+
+
+def start(name):
+    """Start timing stage ``name`` now; call ``.stop()`` on the result to record it."""
+    return _Timer(name) if ENABLED else _NULL
+
+
+def instrument(name):
+    """Decorator timing every call as stage ``name``; identity when disabled."""
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - t0)
+        return wrapper
+    return decorate
+
+
+def reset():
+    with _LOCK:
+        _HISTOGRAMS.clear()
+
+
+# ------------------------------------------------------
+# Export
+# ------------------------------------------------------
+def snapshot():
+    """JSON-serializable ``{stage: {"buckets", "counts", "sum", "count"}}``."""
+    with _LOCK:
+        return {
+            name: {"buckets": list(BUCKETS) + ["+Inf"], "counts": list(h.counts), "sum": h.sum, "count": h.count}
+            for name, h in sorted(_HISTOGRAMS.items())
+        }
+
+
+def prometheus_text(prefix="ecofusion_stage_seconds"):
+    """Prometheus text exposition (format 0.0.4) of every stage histogram."""
+    lines = [f"# HELP {prefix} Time spent per EcoFusion stage.", f"# TYPE {prefix} histogram"]
+    for name, hist in snapshot().items():
+        cumulative = 0
+        for le, n in zip(hist["buckets"], hist["counts"]):
+            cumulative += n
+            lines.append(f'{prefix}_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'{prefix}_sum{{stage="{name}"}} {hist["sum"]!r}')
+        lines.append(f'{prefix}_count{{stage="{name}"}} {hist["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def dump_json(path):
+    """Atomically write snapshot() to ``path``."""
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump({"enabled": ENABLED, "stages": snapshot()}, fh, indent=2)
+    os.replace(tmp, path)
+
+
+if ENABLED and JSON_PATH:
+    atexit.register(dump_json, JSON_PATH)
+
+
+# ------------------------------------------------------
+# Profiling
+# ------------------------------------------------------
+class _Profile:
+    __slots__ = ("path", "_profiler")
+
+    def __init__(self, path):
+        import cProfile
+
+        self.path = path
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop(self):
+        """Stop profiling and write the stats file; returns its path."""
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.path)
+            self._profiler = None
+        return self.path
+
+
+_PROFILE_IDS = itertools.count(1)
+
+
+class _NullProfile:
+    __slots__ = ()
+    path = None
+
+    def stop(self):
+        return None
+
+
+def start_profile(name="profile", enabled=None, directory=None):
+    """Start a cProfile snapshot; ``.stop()`` writes it and returns the path.
+
+    Runs when ``enabled`` is true, or when it is None and ECOFUSION_PROFILE
+    is set; otherwise returns a no-op whose ``stop()`` returns None.
+    """
+    if not (enabled if enabled is not None else PROFILE_DIR):
+        return _NullProfile()
+    import tempfile
+
+    directory = directory or PROFILE_DIR or tempfile.gettempdir()
+    os.makedirs(directory, exist_ok=True)
+    stamp = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_PROFILE_IDS)}"
+    return _Profile(os.path.join(directory, f"{name}-{stamp}.pstats"))
+
+
+@contextlib.contextmanager
+def profile(name="profile", enabled=None, directory=None):
+    """Context-manager form of start_profile(); yields the output path or None."""
+    session = start_profile(name, enabled, directory)
+    try:
+        yield session.path
+    finally:
+        session.stop()
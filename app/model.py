@@ -2,409 +2,174 @@
 # model.py — EcoFusion 2.0 (Full Multi-Device Component Mapping)
 # ======================================================
 
-import pandas as pd
+import sys
+
 import numpy as np
 
+from catalog import get_catalog
+from metrics import instrument
+from regions import get_region_table
 
-def load_dataset():
-    data = {
-        "Category": [
-            "Air Conditioner", "Refrigerator", "Washing Machine", "Fan",
-            "Television", "Computer", "Lighting", "Cooking Appliance"
-        ],
-        "Old_Component": [
-            "Conventional AC", "Old Refrigerator", "Semi-Automatic Washing Machine",
-            "Ceiling Fan", "CRT TV", "Desktop PC", "CFL Bulb", "Microwave Oven"
-        ],
-        "Modern_Component": [
-            "Inverter AC", "Smart Refrigerator", "Front-Load Washing Machine",
-            "BLDC Fan", "LED TV", "Laptop", "LED Bulb", "Induction Cooktop"
-        ],
-        "Updated_Component": [
-            "AI Adaptive AC", "IoT Smart Refrigerator", "AI Sensor Washing Machine",
-            "Smart IoT Fan", "Quantum Dot OLED TV", "AI Edge PC",
-            "Smart Adaptive LED", "Smart Induction Hob"
-        ],
-        "Old_Energy(W)": [1800, 250, 500, 75, 120, 200, 20, 1200],
-        "Modern_Energy(W)": [1200, 150, 300, 35, 60, 60, 9, 1800],
-        "Updated_Energy(W)": [900, 120, 250, 25, 40, 45, 6, 1500],
-        "Old_Eff(%)": [55, 40, 60, 70, 50, 45, 60, 60],
-        "Modern_Eff(%)": [95, 75, 85, 92, 90, 80, 95, 90],
-        "Updated_Eff(%)": [98, 90, 92, 96, 95, 90, 98, 95],
-        "Old_Cost($)": [600, 200, 150, 40, 150, 800, 3, 100],
-        "Modern_Cost($)": [800, 500, 300, 70, 300, 900, 5, 150],
-        "Updated_Cost($)": [1000, 700, 450, 90, 500, 1200, 7, 200],
-    }
 
-    df = pd.DataFrame(data)
-    df["CO2_Factor"] = 0.82
-    df["Old_CO2(kg/hr)"] = (df["Old_Energy(W)"] / 1000) * df["CO2_Factor"]
-    df["Modern_CO2(kg/hr)"] = (df["Modern_Energy(W)"] / 1000) * df["CO2_Factor"]
-    df["Updated_CO2(kg/hr)"] = (df["Updated_Energy(W)"] / 1000) * df["CO2_Factor"]
-    return df
+@instrument("model.load_dataset")
+def load_dataset():
+    """Return a fresh DataFrame copy of the appliance catalog"""
+    return get_catalog().to_frame()
 
 
+@instrument("model.get_component_breakdown")
 def get_component_breakdown(category):
     """Return 10–12 component-level mappings for each appliance"""
-    components = {
-        "Air Conditioner": {
-            "Old": {
-                "Compressor": "Fixed-speed Rotary",
-                "Condenser Coil": "Aluminium",
-                "Refrigerant": "R22",
-                "Filter": "Mesh Filter",
-                "Sensor": "Mechanical Thermostat",
-                "Motor": "AC Induction",
-                "Controller": "Manual Knob",
-                "Expansion Valve": "Capillary Tube",
-                "Housing": "Basic Plastic",
-                "Noise Level": "High",
-            },
-            "Modern": {
-                "Compressor": "Inverter Rotary",
-                "Condenser Coil": "Copper (Blue Fin)",
-                "Refrigerant": "R32 Eco",
-                "Filter": "PM2.5 Filter",
-                "Sensor": "Digital Thermistor",
-                "Motor": "BLDC",
-                "Controller": "Digital Thermostat",
-                "Expansion Valve": "Electronic",
-                "Housing": "ABS Plastic",
-                "Noise Level": "Low",
-            },
-            "Updated": {
-                "Compressor": "AI Variable Scroll Compressor",
-                "Condenser Coil": "Nano-Coated Copper",
-                "Refrigerant": "R290 (Ultra-Low GWP)",
-                "Filter": "HEPA + UV Sterilization",
-                "Sensor": "IoT Smart Multi-Sensor",
-                "Motor": "BLDC SmartSync",
-                "Controller": "AI Adaptive Voice/App",
-                "Expansion Valve": "Smart Proportional Valve",
-                "Housing": "Recyclable Biopolymer",
-                "Noise Level": "Whisper Mode",
-                "Connectivity": "Wi-Fi + Cloud Learning",
-                "Cooling Mode": "Self-Optimizing Adaptive Cooling",
-            },
-        },
-
-        "Refrigerator": {
-            "Old": {
-                "Compressor": "Reciprocating",
-                "Refrigerant": "R134a",
-                "Coil": "Bare Metal",
-                "Thermostat": "Manual Dial",
-                "Lighting": "Incandescent Bulb",
-                "Defrost": "Manual",
-                "Shelves": "Plastic",
-                "Door Seal": "Rubber",
-                "Insulation": "PU Foam",
-                "Motor": "Fixed Speed",
-            },
-            "Modern": {
-                "Compressor": "Digital Inverter",
-                "Refrigerant": "R600a",
-                "Coil": "Aluminium Alloy",
-                "Thermostat": "Electronic",
-                "Lighting": "LED",
-                "Defrost": "Auto",
-                "Shelves": "Tempered Glass",
-                "Door Seal": "Anti-bacterial",
-                "Insulation": "High-Density Foam",
-                "Motor": "Variable Speed",
-            },
-            "Updated": {
-                "Compressor": "AI Linear Compressor",
-                "Refrigerant": "R1234yf (Green Blend)",
-                "Coil": "Graphene Alloy Coil",
-                "Thermostat": "AI Predictive Control",
-                "Lighting": "Smart Adaptive LED",
-                "Defrost": "AI Auto Defrost",
-                "Shelves": "Smart Weight Sensors",
-                "Door Seal": "Self-Healing Magnetic Seal",
-                "Insulation": "Vacuum Nano Insulation",
-                "Motor": "EcoSynch Variable Drive",
-                "Connectivity": "IoT + Inventory Tracking",
-                "Control System": "App + Voice Integration",
-            },
-        },
-
-        "Washing Machine": {
-            "Old": {
-                "Motor": "Belt-Driven AC Motor",
-                "Drum": "Plastic",
-                "Control": "Manual Knob",
-                "Heater": "Fixed Resistive Coil",
-                "Pump": "Fixed-Speed",
-                "Sensor": "Mechanical Timer",
-                "Panel": "Analog",
-                "Drive Type": "Belt Drive",
-                "Water Valve": "Basic Solenoid",
-                "Body": "Plastic Frame",
-            },
-            "Modern": {
-                "Motor": "Inverter Direct Drive",
-                "Drum": "Steel Drum",
-                "Control": "Digital Panel",
-                "Heater": "Ceramic Heater",
-                "Pump": "Variable-Speed",
-                "Sensor": "Load Sensor",
-                "Panel": "Touch Control",
-                "Drive Type": "Direct Drive",
-                "Water Valve": "Electronic",
-                "Body": "Stainless Steel",
-            },
-            "Updated": {
-                "Motor": "AI Direct Drive BLDC",
-                "Drum": "NanoShield Stainless Steel",
-                "Control": "AI Predictive Smart Panel",
-                "Heater": "Self-Cleaning Ceramic",
-                "Pump": "EcoSense Adaptive Flow",
-                "Sensor": "AI Load + Dirt Sensors",
-                "Panel": "Smart Touch + App",
-                "Drive Type": "Sensorless Torque Control",
-                "Water Valve": "Smart Flow Valve",
-                "Body": "Recycled Polycomposite",
-                "Connectivity": "IoT + Self Diagnostics",
-                "Eco Wash": "Auto Optimize Water/Energy",
-            },
-        },
-
-        "Fan": {
-            "Old": {
-                "Motor": "AC Induction",
-                "Blade": "Metal",
-                "Speed Control": "Manual Regulator",
-                "Bearings": "Friction Bearings",
-                "Body": "Iron",
-                "Mounting": "Fixed Rod",
-                "Power Supply": "AC 230V",
-                "Protection": "Basic Grill",
-                "Noise": "High",
-                "Efficiency": "Low",
-            },
-            "Modern": {
-                "Motor": "BLDC",
-                "Blade": "Polymer",
-                "Speed Control": "Remote",
-                "Bearings": "Ball Bearings",
-                "Body": "Plastic",
-                "Mounting": "Adjustable Rod",
-                "Power Supply": "DC Converter",
-                "Protection": "Safety Grill",
-                "Noise": "Low",
-                "Efficiency": "High",
-            },
-            "Updated": {
-                "Motor": "Smart BLDC IoT Motor",
-                "Blade": "Carbon Fiber Aero Design",
-                "Speed Control": "Smart Remote + App",
-                "Bearings": "Sealed Ceramic Bearings",
-                "Body": "Recyclable Alloy",
-                "Mounting": "Smart Adjustable Mount",
-                "Power Supply": "DC + Solar Backup",
-                "Protection": "Smart Obstruction Sensor",
-                "Noise": "Silent",
-                "Efficiency": "Super High",
-                "Sensors": "Temperature + Motion Sensors",
-                "Connectivity": "IoT + Voice Command",
-            },
-        },
-
-        "Television": {
-            "Old": {
-                "Display": "CRT",
-                "Backlight": "Cathode Ray",
-                "Resolution": "480p",
-                "Panel Type": "Glass Tube",
-                "Audio": "Mono",
-                "Connectivity": "RF Only",
-                "Frame": "Plastic",
-                "Input": "AV Ports",
-                "Energy": "High",
-                "Color Depth": "Limited",
-            },
-            "Modern": {
-                "Display": "LED",
-                "Backlight": "Edge LED",
-                "Resolution": "4K UHD",
-                "Panel Type": "Flat Panel",
-                "Audio": "Stereo",
-                "Connectivity": "HDMI / USB",
-                "Frame": "Metal",
-                "Input": "Multiple Ports",
-                "Energy": "Moderate",
-                "Color Depth": "Wide Gamut",
-            },
-            "Updated": {
-                "Display": "Quantum Dot OLED",
-                "Backlight": "Self-Emissive",
-                "Resolution": "8K Adaptive",
-                "Panel Type": "Ultra Thin Flexible",
-                "Audio": "Dolby Atmos AI Surround",
-                "Connectivity": "Wi-Fi 6 / Bluetooth 5.3",
-                "Frame": "Carbon Fiber Edge",
-                "Input": "Wireless + HDMI 2.2",
-                "Energy": "Optimized AI",
-                "Color Depth": "1B+ Colors",
-                "Processor": "Neural Image Processor",
-                "Smart OS": "AI Vision Interface",
-            },
-        },
-
-        "Computer": {
-            "Old": {
-                "CPU": "Intel Core 2 Duo",
-                "Cooling": "Fan-based",
-                "Power Supply": "400W ATX",
-                "Storage": "HDD",
-                "GPU": "Integrated Basic",
-                "RAM": "DDR2",
-                "Motherboard": "Non-Optimized PCB",
-                "OS": "Legacy OS",
-                "Connectivity": "Ethernet Only",
-                "Case": "Steel Chassis",
-            },
-            "Modern": {
-                "CPU": "i7 / Ryzen 7",
-                "Cooling": "Heat Pipe + Fan",
-                "Power Supply": "650W Modular",
-                "Storage": "SSD",
-                "GPU": "Dedicated",
-                "RAM": "DDR4",
-                "Motherboard": "Energy Efficient PCB",
-                "OS": "Windows / Linux",
-                "Connectivity": "Wi-Fi 6 + Bluetooth 5",
-                "Case": "Aluminum",
-            },
-            "Updated": {
-                "CPU": "AI Edge Processor (ARM + Neural Cores)",
-                "Cooling": "Liquid + AI-Control",
-                "Power Supply": "USB-C PD + Renewable Input",
-                "Storage": "NVMe Gen5 SSD",
-                "GPU": "Integrated Neural GPU",
-                "RAM": "LPDDR5x Adaptive",
-                "Motherboard": "Graphene-Based Eco Board",
-                "OS": "Edge AI OS",
-                "Connectivity": "Wi-Fi 7 + 6G Ready",
-                "Case": "Recycled Carbon Fiber",
-                "Sensors": "Thermal + Usage AI Sensors",
-                "Cloud Sync": "Auto Backup + Optimization",
-            },
-        },
-
-        "Lighting": {
-            "Old": {
-                "Type": "CFL",
-                "Efficiency": "60 lm/W",
-                "Base": "E27 Screw",
-                "Driver": "Magnetic Ballast",
-                "Color": "Warm White",
-                "Material": "Glass",
-                "Power": "High",
-                "Life": "6,000 hrs",
-                "Control": "Switch",
-                "Heat": "Moderate",
-            },
-            "Modern": {
-                "Type": "LED",
-                "Efficiency": "110 lm/W",
-                "Base": "B22 Bayonet",
-                "Driver": "Electronic",
-                "Color": "Cool White",
-                "Material": "Plastic",
-                "Power": "Low",
-                "Life": "25,000 hrs",
-                "Control": "Dimmable Switch",
-                "Heat": "Low",
-            },
-            "Updated": {
-                "Type": "Smart Adaptive LED",
-                "Efficiency": "140 lm/W",
-                "Base": "Smart Wireless Base",
-                "Driver": "IoT Adaptive Driver",
-                "Color": "Dynamic RGB + Circadian",
-                "Material": "Recycled Polymer",
-                "Power": "Ultra Low",
-                "Life": "50,000 hrs",
-                "Control": "App + Voice",
-                "Heat": "Negligible",
-                "Sensors": "Light + Occupancy Sensors",
-                "Connectivity": "Wi-Fi + Cloud Sync",
-            },
-        },
-
-        "Cooking Appliance": {
-            "Old": {
-                "Heating": "Convection Coil",
-                "Surface": "Metal",
-                "Control": "Knob",
-                "Safety": "Thermal Fuse",
-                "Material": "Steel",
-                "Timer": "Manual",
-                "Sensor": "None",
-                "Power": "High",
-                "Body": "Plastic Frame",
-                "Efficiency": "Low",
-            },
-            "Modern": {
-                "Heating": "Induction",
-                "Surface": "Ceramic",
-                "Control": "Touch",
-                "Safety": "Auto Shutoff",
-                "Material": "Glass",
-                "Timer": "Digital",
-                "Sensor": "Temperature Sensor",
-                "Power": "Moderate",
-                "Body": "Steel + Glass",
-                "Efficiency": "High",
-            },
-            "Updated": {
-                "Heating": "AI Induction Magnetic Field",
-                "Surface": "Nano-Coated Ceramic",
-                "Control": "Smart Touch + App",
-                "Safety": "AI Auto Detection",
-                "Material": "Recycled Glass Ceramic",
-                "Timer": "Adaptive Predictive",
-                "Sensor": "Smart Cooking Sensors",
-                "Power": "Auto Adjust",
-                "Body": "Eco Alloy Frame",
-                "Efficiency": "Ultra High",
-                "Connectivity": "IoT Cloud Recipes",
-                "Assistant": "Voice Cooking Guide",
-            },
-        },
+    return get_catalog().components(category)
+
+
+def category_deltas(category, region=None):
+    """Category-only half of a summary: component names and per-hour deltas.
+
+    Everything here is independent of the usage sliders, so callers can
+    compute it once per category and re-apply new parameters cheaply.
+    ``region`` (a regions.REGIONS code) selects the grid behind ``co2_diff``.
+    """
+    catalog = get_catalog()
+    i = catalog.index_of(category)
+    col = catalog.columns
+    if region is None:
+        co2_diff = col.take("Old_CO2(kg/hr)", i) - col.take("Updated_CO2(kg/hr)", i)
+    else:
+        co2_diff = get_region_table().column("CO2_Diff", region)[i]
+    return {
+        "category": category,
+        "old": col.take("Old_Component", i),
+        "modern": col.take("Modern_Component", i),
+        "updated": col.take("Updated_Component", i),
+        "energy_diff": col["Old_Energy(W)"][i] - col["Updated_Energy(W)"][i],
+        "co2_diff": co2_diff,
+        "eff_gain": col["Updated_Eff(%)"][i] - col["Old_Eff(%)"][i],
     }
 
-    return components.get(category, None)
-
-
-def analyze_efficiency(category, hours_per_day, electricity_rate):
-    df = load_dataset()
-    row = df[df["Category"] == category].iloc[0]
 
-    energy_diff = row["Old_Energy(W)"] - row["Updated_Energy(W)"]
-    co2_diff = row["Old_CO2(kg/hr)"] - row["Updated_CO2(kg/hr)"]
-    eff_gain = row["Updated_Eff(%)"] - row["Old_Eff(%)"]
+def usage_savings(deltas, hours_per_day, electricity_rate):
+    """Parameter-dependent half: annual savings from ``energy_diff`` / ``co2_diff``.
 
+    Works on scalars or broadcasting arrays.
+    """
     annual_hours = hours_per_day * 365
-    annual_energy_saved = (energy_diff / 1000) * annual_hours
-    annual_co2_saved = co2_diff * annual_hours
+    annual_energy_saved = (deltas["energy_diff"] / 1000) * annual_hours
+    annual_co2_saved = deltas["co2_diff"] * annual_hours
     annual_cost_saved = annual_energy_saved * electricity_rate
-
-    summary = {
-        "category": category,
-        "old": row["Old_Component"],
-        "modern": row["Modern_Component"],
-        "updated": row["Updated_Component"],
-        "energy_diff": energy_diff,
-        "co2_diff": co2_diff,
-        "eff_gain": eff_gain,
+    return {
         "annual_energy_saved": annual_energy_saved,
         "annual_co2_saved": annual_co2_saved,
         "annual_cost_saved": annual_cost_saved,
-        "old_row": row,
-        "components": get_component_breakdown(category),
     }
 
+
+def _savings(category, hours_per_day, electricity_rate, region=None):
+    deltas = category_deltas(category, region)
+    return {**deltas, **usage_savings(deltas, hours_per_day, electricity_rate)}
+
+
+@instrument("model.savings_surface")
+def savings_surface(category, hours_per_day, electricity_rate, region=None):
+    """Annual savings over every hours × rate pair, e.g. for a heatmap.
+
+    ``hours_per_day`` and ``electricity_rate`` are 1-D sweeps; each result is
+    a (len(hours), len(rates)) grid matching analyze_efficiency cell for cell.
+    """
+    hours = np.asarray(hours_per_day)[:, None]
+    rates = np.asarray(electricity_rate)[None, :]
+    shape = (hours.shape[0], rates.shape[1])
+    surface = usage_savings(category_deltas(category, region), hours, rates)
+    return {name: np.broadcast_to(grid, shape) for name, grid in surface.items()}
+
+
+@instrument("model.category_summary")
+def category_summary(category):
+    """category_deltas plus the catalog row and component breakdown."""
+    summary = category_deltas(category)
+    summary["old_row"] = get_catalog().row(category)
+    summary["components"] = get_component_breakdown(category)
+    return summary
+
+
+def regional_row(row, category, region):
+    """Overwrite a catalog row's (Series or dict) CO₂ columns with ``region``'s."""
+    if region is not None:
+        for name, value in get_region_table().row_values(region, get_catalog().index_of(category)).items():
+            row[name] = value
+    return row
+
+
+@instrument("model.analyze_efficiency")
+def analyze_efficiency(category, hours_per_day, electricity_rate, region=None):
+    summary = _savings(category, hours_per_day, electricity_rate, region)
+    summary["old_row"] = regional_row(get_catalog().row(category), category, region)
+    summary["components"] = get_component_breakdown(category)
     return summary
+
+
+@instrument("model.efficiency_record")
+def efficiency_record(category, hours_per_day, electricity_rate, region=None):
+    """JSON-serializable analyze_efficiency summary built without pandas"""
+    summary = {k: v.item() if isinstance(v, np.generic) else v
+               for k, v in _savings(category, hours_per_day, electricity_rate, region).items()}
+    summary["old_row"] = regional_row(get_catalog().record(category), category, region)
+    summary["components"] = get_component_breakdown(category)
+    return summary
+
+
+def _is_frame(obj):
+    # A DataFrame can only exist once pandas is imported, so never import it here
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, pd.DataFrame)
+
+
+@instrument("model.analyze_efficiency_batch")
+def analyze_efficiency_batch(category, hours_per_day=None, electricity_rate=None, region=None):
+    """Vectorized analyze_efficiency over many scenarios at once.
+
+    ``category`` may be an array of category names / catalog codes, or a
+    DataFrame with ``category``, ``hours_per_day`` and ``electricity_rate``
+    (and optionally ``region``) columns. ``region`` holds region codes (or
+    RegionTable indices): CO₂ uses each region's grid factor, and a missing
+    ``electricity_rate`` defaults to each region's tariff. Inputs broadcast
+    against each other. Returns a dict of NumPy arrays matching the scalar
+    summary's numeric fields element for element.
+    """
+    if _is_frame(category):
+        scenarios = category
+        category = scenarios["category"].to_numpy()
+        hours_per_day = scenarios["hours_per_day"].to_numpy()
+        if "electricity_rate" in scenarios:
+            electricity_rate = scenarios["electricity_rate"].to_numpy()
+        if "region" in scenarios:
+            region = scenarios["region"].to_numpy()
+    if hours_per_day is None or (electricity_rate is None and region is None):
+        raise ValueError("hours_per_day and electricity_rate (or region) are required")
+
+    catalog = get_catalog()
+    col = catalog.columns
+    if region is None:
+        idx, hours, rate = np.broadcast_arrays(
+            catalog.indices_of(category), np.asarray(hours_per_day), np.asarray(electricity_rate)
+        )
+        co2_diff = col.take("Old_CO2(kg/hr)", idx) - col.take("Updated_CO2(kg/hr)", idx)
+    else:
+        table = get_region_table()
+        regions = table.indices_of(region)
+        if electricity_rate is None:
+            electricity_rate = table.tariff[regions]
+        idx, hours, rate, regions = np.broadcast_arrays(
+            catalog.indices_of(category), np.asarray(hours_per_day), np.asarray(electricity_rate), regions
+        )
+        co2_diff = table.take("CO2_Diff", regions, idx)
+
+    deltas = {
+        "category_code": idx,
+        "energy_diff": col["Old_Energy(W)"][idx] - col["Updated_Energy(W)"][idx],
+        "co2_diff": co2_diff,
+        "eff_gain": col["Updated_Eff(%)"][idx] - col["Old_Eff(%)"][idx],
+    }
+    if region is not None:
+        deltas["region_code"] = regions
+    return {**deltas, **usage_savings(deltas, hours, rate)}
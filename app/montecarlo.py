@@ -0,0 +1,274 @@
+# ======================================================
+# montecarlo.py — EcoFusion 2.0 Savings & Payback Uncertainty (Monte Carlo)
+# ======================================================
+# analyze_efficiency reports one number per category; this module samples
+# the inputs instead:
+#
+#   hours_per_day      per category (appliances are used independently)
+#   electricity_rate   per sample, shared by every category
+#   emission factor    per sample (kg CO₂ / kWh of the grid)
+#
+# and reports percentiles of annual cost saved, CO₂ avoided and payback
+# years (upgrade price / annual cost saved) for every category.
+#
+# Savings are the category's per-hour delta times a usage product
+# (hours × rate, hours × factor), so workers only histogram those products
+# over their exact bounds (BINS fixed-width bins per category) and keep
+# exact sums; payback percentiles follow from the savings quantiles because
+# payback is monotone in savings. Partials are additive, samples are drawn
+# in fixed-size shards seeded from SeedSequence(seed).spawn(), and results
+# are identical for any worker count.
+#
+# Run: python app/montecarlo.py --samples 10000000 --hours 2,6,12 --rate 5,7,10
+
+import argparse
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from catalog import get_catalog
+from parallel import process_pool, reduce_partials
+from utils import EMISSION_FACTOR, co2_from_watts
+
+Triangular = namedtuple("Triangular", "low mode high")
+Uniform = namedtuple("Uniform", "low high")
+
+DEFAULT_FACTOR = Triangular(0.70, EMISSION_FACTOR, 0.95)
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+BINS = 4096
+DEFAULT_SAMPLES = 1_000_000
+DEFAULT_SHARD_SAMPLES = 250_000
+
+
+# ------------------------------------------------------
+# Distributions
+# ------------------------------------------------------
+def bounds(dist):
+    """(low, high) support of a Triangular, Uniform or constant."""
+    if isinstance(dist, (Triangular, Uniform)):
+        return float(dist.low), float(dist.high)
+    return float(dist), float(dist)
+
+
+def sample(dist, rng, size):
+    if isinstance(dist, Triangular):
+        if dist.low == dist.high:
+            return np.full(size, float(dist.low))
+        return rng.triangular(dist.low, dist.mode, dist.high, size)
+    if isinstance(dist, Uniform):
+        return rng.uniform(dist.low, dist.high, size)
+    return np.full(size, float(dist))
+
+
+def scenario_distributions(hours_per_day, electricity_rate, spread=0.5, rate_spread=0.2):
+    """Triangular hours / rate distributions peaking at a point scenario."""
+    hours = Triangular(hours_per_day * (1 - spread), hours_per_day, min(hours_per_day * (1 + spread), 24))
+    rate = Triangular(electricity_rate * (1 - rate_spread), electricity_rate, electricity_rate * (1 + rate_spread))
+    return hours, rate
+
+
+def factor_distribution(emission_factor, spread=0.15):
+    """Triangular grid-factor distribution around a region's point estimate."""
+    return Triangular(emission_factor * (1 - spread), emission_factor, emission_factor * (1 + spread))
+
+
+def _validate(dist, name):
+    low, high = bounds(dist)
+    if low < 0 or high < low:
+        raise ValueError(f"{name} distribution must have 0 <= low <= high, got {dist!r}")
+
+
+# ------------------------------------------------------
+# Shard kernel (runs in worker processes)
+# ------------------------------------------------------
+def _histogram(values, lows, highs):
+    """Per-row BINS-bin histograms of a (n_categories, n) array, flattened."""
+    n_rows = len(values)
+    width = np.where(highs > lows, highs - lows, 1.0)
+    idx = ((values - lows[:, None]) * (BINS / width)[:, None]).astype(np.int64)
+    np.clip(idx, 0, BINS - 1, out=idx)
+    idx += (np.arange(n_rows) * BINS)[:, None]
+    return np.bincount(idx.ravel(), minlength=n_rows * BINS).reshape(n_rows, BINS)
+
+
+def simulate_shard(task):
+    """Histograms and sums of the usage products for one shard of samples."""
+    seed, size, hours, rate, factor, limits = task
+    rng = np.random.default_rng(seed)
+    r = sample(rate, rng, size)
+    f = sample(factor, rng, size)
+    h = np.stack([sample(dist, rng, size) for dist in hours])
+    cost_use = h * r
+    co2_use = h * f
+    with np.errstate(divide="ignore"):
+        inverse = 1.0 / cost_use  # products are >= 0, so zero usage gives inf
+    return {
+        "samples": size,
+        "cost_sum": cost_use.sum(axis=1),
+        "cost_sq": np.square(cost_use).sum(axis=1),
+        "co2_sum": co2_use.sum(axis=1),
+        "co2_sq": np.square(co2_use).sum(axis=1),
+        "inverse_sum": inverse.sum(axis=1),
+        "cost_hist": _histogram(cost_use, *limits["cost"]),
+        "co2_hist": _histogram(co2_use, *limits["co2"]),
+    }
+
+
+# ------------------------------------------------------
+# Summaries
+# ------------------------------------------------------
+def _hist_quantiles(hist, lows, highs, qs):
+    """Linearly interpolated quantiles (0–100) of each row's histogram."""
+    cdf = np.cumsum(hist, axis=1)
+    total = cdf[:, -1:]
+    width = (highs - lows) / BINS
+    out = np.empty((len(hist), len(qs)))
+    for j, q in enumerate(qs):
+        target = q / 100 * total[:, 0]
+        i = np.array([np.searchsorted(row, t, "left") for row, t in zip(cdf, target)])
+        i = np.minimum(i, BINS - 1)
+        below = np.where(i > 0, cdf[np.arange(len(hist)), i - 1], 0)
+        count = hist[np.arange(len(hist)), i]
+        frac = np.where(count > 0, (target - below) / np.maximum(count, 1), 0.0)
+        out[:, j] = lows + (i + frac) * width
+    return out
+
+
+def _product_quantiles(total, name):
+    """(q, 100 - q) quantiles of a usage product for every q in PERCENTILES."""
+    hist, (lows, highs) = total[f"{name}_hist"], total["limits"][name]
+    return (_hist_quantiles(hist, lows, highs, PERCENTILES),
+            _hist_quantiles(hist, lows, highs, [100 - q for q in PERCENTILES]))
+
+
+def _scaled_stats(scale, total_sum, total_sq, quantiles, n):
+    """Mean / std / percentiles of scale × product (scale may be negative)."""
+    mean = total_sum / n
+    std = np.sqrt(np.maximum(total_sq / n - mean ** 2, 0.0))
+    # a negative scale maps the product's (100 - q) quantile to q
+    upper, lower = quantiles
+    ordered = np.where(scale[:, None] < 0, lower, upper)
+    stats = {"mean": scale * mean, "std": np.abs(scale) * std}
+    for j, q in enumerate(PERCENTILES):
+        stats[f"p{q}"] = scale * ordered[:, j]
+    return stats
+
+
+def summarize(total, deltas, price):
+    """Per-category percentile tables from reduced partials."""
+    n = total["samples"]
+    cost_q = _product_quantiles(total, "cost")
+    per_hour_kwh = deltas / 1000 * 365
+
+    cost = _scaled_stats(per_hour_kwh, total["cost_sum"], total["cost_sq"], cost_q, n)
+    # kg CO₂ a year per unit of the sampled hours × factor product
+    co2_per_use = co2_from_watts(deltas, 1.0, hours=365)
+    co2 = _scaled_stats(co2_per_use, total["co2_sum"], total["co2_sq"], _product_quantiles(total, "co2"), n)
+
+    # payback = price / (per_hour_kwh × product) falls as the product grows,
+    # so its q-th percentile comes from the product's (100 - q)-th
+    saves = per_hour_kwh > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(saves, price / np.where(saves, per_hour_kwh, 1), np.inf)
+        payback = {"mean": scale * total["inverse_sum"] / n}
+        for j, q in enumerate(PERCENTILES):
+            product = cost_q[1][:, j]
+            payback[f"p{q}"] = np.where(product > 0, scale / product, np.inf)
+    return {"annual_cost_saved": cost, "annual_co2_saved": co2, "payback_years": payback}
+
+
+# ------------------------------------------------------
+# Engine
+# ------------------------------------------------------
+def simulate_uncertainty(hours, rate, factor=DEFAULT_FACTOR, samples=DEFAULT_SAMPLES, categories=None,
+                         seed=0, workers=None, price_rate=1.0, incremental=False,
+                         shard_samples=DEFAULT_SHARD_SAMPLES):
+    """Monte Carlo percentiles of savings and payback for each category.
+
+    ``hours`` is a distribution (Triangular, Uniform or constant) or a
+    {category: distribution} mapping; ``rate`` and ``factor`` are
+    distributions. The upgrade price is ``Updated_Cost($)`` (minus
+    ``Old_Cost($)`` when ``incremental``) times ``price_rate``, the tariff
+    currency per catalog price unit. ``workers=1`` runs in-process.
+
+    Returns ``{"categories", "samples", "upgrade_cost", "annual_cost_saved",
+    "annual_co2_saved", "payback_years"}``; each metric maps "mean", "std"
+    and "p5" … "p95" to arrays aligned with ``categories``.
+    """
+    catalog = get_catalog()
+    categories = list(categories or catalog.categories)
+    codes = np.array([catalog.index_of(c) for c in categories], dtype=np.intp)
+    col = catalog.columns
+    if isinstance(hours, dict):
+        hours = [hours[c] for c in categories]
+    else:
+        hours = [hours] * len(categories)
+    for i, dist in enumerate(hours):
+        _validate(dist, f"hours[{categories[i]}]")
+    _validate(rate, "rate")
+    _validate(factor, "factor")
+
+    h = np.array([bounds(d) for d in hours])
+    r, f = bounds(rate), bounds(factor)
+    limits = {"cost": (h[:, 0] * r[0], h[:, 1] * r[1]), "co2": (h[:, 0] * f[0], h[:, 1] * f[1])}
+
+    sizes = [shard_samples] * (samples // shard_samples)
+    if samples % shard_samples:
+        sizes.append(samples % shard_samples)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(s, size, hours, rate, factor, limits) for s, size in zip(seeds, sizes)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        partials = [simulate_shard(task) for task in tasks]
+    else:
+        with process_pool(min(workers, len(tasks))) as pool:
+            partials = list(pool.map(simulate_shard, tasks))
+    total = reduce_partials(partials)
+    total["limits"] = limits
+
+    energy_diff = col["Old_Energy(W)"][codes] - col["Updated_Energy(W)"][codes]
+    price = col["Updated_Cost($)"][codes].astype(np.float64)
+    if incremental:
+        price = price - col["Old_Cost($)"][codes]
+    price = price * price_rate
+    # Both metrics scale the watts delta by a sampled usage product
+    result = summarize(total, energy_diff.astype(np.float64), price)
+    result.update(categories=categories, samples=samples, upgrade_cost=price)
+    return result
+
+
+def _triple(text):
+    values = [float(v) for v in text.split(",")]
+    return Triangular(*values) if len(values) == 3 else values[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo savings / payback percentiles per category")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--hours", type=_triple, default=Triangular(3, 6, 9), help="low,mode,high or a constant")
+    parser.add_argument("--rate", type=_triple, default=Triangular(5, 7, 9), help="low,mode,high or a constant")
+    parser.add_argument("--factor", type=_triple, default=DEFAULT_FACTOR, help="low,mode,high or a constant")
+    parser.add_argument("--price-rate", type=float, default=1.0, help="tariff currency per catalog price unit")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    result = simulate_uncertainty(args.hours, args.rate, args.factor, args.samples, seed=args.seed,
+                                  workers=args.workers, price_rate=args.price_rate)
+    elapsed = time.perf_counter() - t0
+    n = args.samples * len(result["categories"])
+    print(f"🎲 {args.samples:,} samples × {len(result['categories'])} categories in {elapsed:.2f}s "
+          f"({n / elapsed:,.0f} evaluations/s)")
+    print(f"{'category':<20}{'cost p10':>11}{'p50':>11}{'p90':>11}{'CO₂ p50':>10}{'payback p10':>13}{'p50':>8}{'p90':>8}")
+    cost, co2, payback = result["annual_cost_saved"], result["annual_co2_saved"], result["payback_years"]
+    for i, name in enumerate(result["categories"]):
+        print(f"{name:<20}{cost['p10'][i]:>11,.1f}{cost['p50'][i]:>11,.1f}{cost['p90'][i]:>11,.1f}"
+              f"{co2['p50'][i]:>10,.1f}{payback['p10'][i]:>13,.1f}{payback['p50'][i]:>8,.1f}{payback['p90'][i]:>8,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# ======================================================
+# parallel.py — EcoFusion 2.0 Process-Pool Helpers for Sharded Simulations
+# ======================================================
+# Fleet projections (fleet.py) and Monte Carlo bands (montecarlo.py) both
+# split work into shards whose results are dicts of additive partials (sums,
+# counts, fixed-bin histograms). This module holds the two pieces they share:
+# the worker pool, forked where the platform allows so large read-only
+# inputs are inherited without a copy, and the element-wise reduce.
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def process_pool(workers, initializer=None, initargs=()):
+    """ProcessPoolExecutor using fork when available, else the platform default."""
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+    return ProcessPoolExecutor(workers, mp_context=ctx, initializer=initializer, initargs=initargs)
+
+
+def reduce_partials(partials):
+    """Sum a non-empty list of same-keyed partial dicts key by key."""
+    total = dict(partials[0])
+    for part in partials[1:]:
+        for key, value in part.items():
+            total[key] = total[key] + value
+    return total
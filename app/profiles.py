@@ -0,0 +1,195 @@
+# ======================================================
+# profiles.py — EcoFusion 2.0 Hourly Usage Profiles & Time-of-Use Tariffs
+# ======================================================
+# analyze_efficiency assumes flat usage (hours_per_day * 365), one rate and
+# one grid factor. This module works on full 8760-hour years instead:
+#
+#   usage profiles     (n_profiles, 8760)  fraction of each hour in use (0..1)
+#   tariffs            (n_tariffs, 8760)   price per kWh in each hour
+#   carbon intensity   (n_curves, 8760)    kg CO₂ per kWh in each hour
+#
+# Each lives in an immutable HourlyMatrix. Annual cost / CO₂ for every
+# profile × tariff (or × curve) pair is one matrix product, memoized per
+# matrix pair, and scaled per category by the Old→Updated power saving.
+# With a flat profile, flat tariff and flat 0.82 curve the results equal
+# analyze_efficiency's (up to floating-point summation order).
+
+import itertools
+from collections import OrderedDict
+
+import numpy as np
+
+from catalog import get_catalog
+
+HOURS_PER_YEAR = 8760
+DAYS_PER_YEAR = 365
+# Products memoized per matrix (least recently used evicted first)
+PRODUCT_CACHE_SIZE = 32
+_keys = itertools.count()
+
+
+class HourlyMatrix:
+    """Immutable, labelled (n, 8760) matrix with a memoized product cache."""
+
+    __slots__ = ("names", "values", "key", "_index", "_products", "_totals")
+
+    def __init__(self, values, names=None, dtype=np.float64):
+        values = np.array(values, dtype=dtype, ndmin=2, order="C")
+        if values.shape[1] != HOURS_PER_YEAR:
+            raise ValueError(f"Hourly rows must have {HOURS_PER_YEAR} values, got {values.shape[1]}")
+        values.flags.writeable = False
+        self.values = values
+        self.names = tuple(names) if names is not None else tuple(range(len(values)))
+        if len(self.names) != len(values):
+            raise ValueError("names must match the number of rows")
+        self.key = next(_keys)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._products = OrderedDict()
+        self._totals = None
+
+    def __len__(self):
+        return len(self.values)
+
+    def index(self, name):
+        try:
+            return self._index[name]
+        except KeyError:
+            raise KeyError(f"Unknown hourly series: {name!r}") from None
+
+    def totals(self):
+        """Sum over the year of every row."""
+        if self._totals is None:
+            self._totals = self.values.sum(axis=1)
+            self._totals.flags.writeable = False
+        return self._totals
+
+    def dot(self, other):
+        """``self.values @ other.values.T`` — shape (len(self), len(other)), memoized."""
+        product = self._products.get(other.key)
+        if product is not None:
+            self._products.move_to_end(other.key)
+            return product
+        product = self._products[other.key] = self.values @ other.values.T
+        product.flags.writeable = False
+        if len(self._products) > PRODUCT_CACHE_SIZE:
+            self._products.popitem(last=False)
+        return product
+
+    @classmethod
+    def from_daily(cls, weekday, weekend=None, names=None, start_weekday=0, dtype=np.float64):
+        """Expand (n, 24) weekday / weekend day patterns to full years.
+
+        ``start_weekday`` is the weekday of 1 January (0 = Monday).
+        """
+        weekday = np.array(weekday, dtype=dtype, ndmin=2)
+        weekend = weekday if weekend is None else np.array(weekend, dtype=dtype, ndmin=2)
+        if weekday.shape[1] != 24 or weekend.shape != weekday.shape:
+            raise ValueError("Daily patterns must have shape (n, 24)")
+        is_weekend = (np.arange(DAYS_PER_YEAR) + start_weekday) % 7 >= 5
+        days = np.where(is_weekend[None, :, None], weekend[:, None, :], weekday[:, None, :])
+        return cls(days.reshape(len(weekday), HOURS_PER_YEAR), names, dtype)
+
+    @classmethod
+    def concat(cls, matrices):
+        return cls(np.concatenate([m.values for m in matrices]),
+                   [n for m in matrices for n in m.names], matrices[0].values.dtype)
+
+
+# ------------------------------------------------------
+# Builders
+# ------------------------------------------------------
+def flat_profile(hours_per_day, names=None):
+    """Usage spread evenly over the day: ``hours_per_day / 24`` of every hour.
+
+    Accepts a scalar or an array of hours, giving one profile row each.
+    """
+    hours = np.atleast_1d(np.asarray(hours_per_day, dtype=np.float64))
+    daily = np.repeat((hours / 24)[:, None], 24, axis=1)
+    return HourlyMatrix.from_daily(daily, names=names if names is not None else hours.tolist())
+
+
+def window_profile(start_hour, hours_per_day, weekend_hours=None, names=None):
+    """Appliance fully on for ``hours_per_day`` consecutive hours from ``start_hour``."""
+    def pattern(start, length):
+        start, length = np.broadcast_arrays(np.atleast_1d(start), np.atleast_1d(length))
+        hour = np.arange(24)
+        offset = (hour[None, :] - start[:, None]) % 24
+        return np.clip(length[:, None] - offset, 0, 1)
+
+    weekday = pattern(start_hour, hours_per_day)
+    weekend = None if weekend_hours is None else pattern(start_hour, weekend_hours)
+    return HourlyMatrix.from_daily(weekday, weekend, names)
+
+
+def flat_tariff(rate, names=None):
+    rates = np.atleast_1d(np.asarray(rate, dtype=np.float64))
+    return HourlyMatrix.from_daily(np.repeat(rates[:, None], 24, axis=1),
+                                   names=names if names is not None else rates.tolist())
+
+
+def tou_tariff(periods, weekend_rate=None, name=None):
+    """Time-of-use tariff from ``[(start_hour, end_hour, rate), ...]`` weekday bands.
+
+    Bands may wrap past midnight (e.g. ``(22, 6, 3.5)``); weekends use
+    ``weekend_rate`` all day when given, otherwise the weekday bands.
+    """
+    day = np.full(24, np.nan)
+    for start, end, rate in periods:
+        hours = np.arange(start, end if end > start else end + 24) % 24
+        day[hours] = rate
+    if np.isnan(day).any():
+        raise ValueError("Tariff bands must cover all 24 hours")
+    weekend = None if weekend_rate is None else np.full((1, 24), weekend_rate)
+    return HourlyMatrix.from_daily(day, weekend, [name if name is not None else "tou"])
+
+
+def flat_intensity(factor=None, names=None):
+    """Constant grid carbon intensity (defaults to the catalog's 0.82 kg/kWh)."""
+    factor = get_catalog().co2_factor if factor is None else factor
+    return flat_tariff(factor, names)
+
+
+_DEFAULT_INTENSITIES = {}  # factor -> flat_intensity(factor), built once
+
+
+def _default_intensity():
+    factor = get_catalog().co2_factor
+    intensity = _DEFAULT_INTENSITIES.get(factor)
+    if intensity is None:
+        intensity = _DEFAULT_INTENSITIES[factor] = flat_intensity(factor)
+    return intensity
+
+
+# ------------------------------------------------------
+# Annual computation
+# ------------------------------------------------------
+def power_saved_kw(category=None):
+    """Old→Updated power saving in kW for one category, an array, or all (None)."""
+    catalog = get_catalog()
+    if category is None:
+        idx = np.array([catalog.index_of(c) for c in catalog.categories], dtype=np.intp)
+    else:
+        idx = catalog.indices_of(category)
+    col = catalog.columns
+    return (col["Old_Energy(W)"][idx] - col["Updated_Energy(W)"][idx]) / 1000
+
+
+def annual_savings(profiles, tariffs, intensity=None, category=None):
+    """Annual savings for every category × profile × tariff / carbon curve.
+
+    Returns arrays shaped (n_categories, n_profiles[, n_tariffs | n_curves]);
+    ``category`` narrows the first axis (scalar name → axis dropped).
+    """
+    intensity = intensity if intensity is not None else _default_intensity()
+    kw = power_saved_kw(category)
+    scalar = np.ndim(kw) == 0
+    kw = np.atleast_1d(kw)
+
+    result = {
+        "annual_energy_saved": kw[:, None] * profiles.totals()[None, :],
+        "annual_cost_saved": kw[:, None, None] * profiles.dot(tariffs)[None],
+        "annual_co2_saved": kw[:, None, None] * profiles.dot(intensity)[None],
+    }
+    if scalar:
+        result = {name: values[0] for name, values in result.items()}
+    return result
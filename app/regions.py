@@ -0,0 +1,161 @@
+# ======================================================
+# regions.py — EcoFusion 2.0 Region Registry (grid, tariff, currency)
+# ======================================================
+# Each region carries its grid emission factor, a default tariff and the
+# currency tariffs and savings are expressed in:
+#
+#   Region(code, name, emission_factor, tariff, tariff_range, currency, symbol, per_usd)
+#
+# ``per_usd`` converts the catalog's $ prices to the region currency;
+# ``tariff_range`` is (low, high, step) for the dashboard's rate slider.
+# Built-in values are representative defaults; deployments override or add
+# regions with register_region().
+#
+# RegionTable holds the region-dependent catalog columns for every region at
+# once, as (n_regions, n_rows) arrays computed on first use of each column:
+#
+#   CO2_Factor, <tier>_CO2(kg/hr), CO2_Diff, <tier>_Cost(local)
+#
+# so switching region is a row lookup, and batch analysis resolves a whole
+# region column with one fancy index.
+
+from collections import namedtuple
+
+import numpy as np
+
+from catalog import get_catalog
+from catalog_store import TIERS
+from utils import EMISSION_FACTOR, co2_from_watts
+
+Region = namedtuple("Region", "code name emission_factor tariff tariff_range currency symbol per_usd")
+
+DEFAULT_REGION = "IN"
+
+REGIONS = {
+    "IN": Region("IN", "India", EMISSION_FACTOR, 7, (3, 15, 1), "INR", "₹", 83.0),
+    "US": Region("US", "United States", 0.39, 0.16, (0.06, 0.40, 0.01), "USD", "$", 1.0),
+    "GB": Region("GB", "United Kingdom", 0.21, 0.28, (0.10, 0.60, 0.01), "GBP", "£", 0.79),
+    "DE": Region("DE", "Germany", 0.38, 0.35, (0.15, 0.70, 0.01), "EUR", "€", 0.92),
+    "FR": Region("FR", "France", 0.06, 0.25, (0.10, 0.50, 0.01), "EUR", "€", 0.92),
+    "CN": Region("CN", "China", 0.58, 0.55, (0.30, 1.20, 0.05), "CNY", "¥", 7.2),
+    "AU": Region("AU", "Australia", 0.68, 0.30, (0.15, 0.60, 0.01), "AUD", "A$", 1.5),
+    "BR": Region("BR", "Brazil", 0.10, 0.80, (0.40, 1.60, 0.05), "BRL", "R$", 5.0),
+}
+
+# Catalog columns whose values depend on the region
+CATALOG_COLUMNS = ("CO2_Factor",) + tuple(f"{tier}_CO2(kg/hr)" for tier in TIERS)
+
+_VERSION = 0
+
+
+def register_region(code, **fields):
+    """Add or replace a region; missing fields of an existing one are kept."""
+    global _VERSION
+    base = REGIONS.get(code)
+    region = base._replace(**fields) if base else Region(code=code, **fields)
+    REGIONS[code] = region
+    _VERSION += 1
+    return region
+
+
+def get_region(code=None):
+    """Resolve ``None`` / a region code / a Region to a Region."""
+    if code is None:
+        return REGIONS[DEFAULT_REGION]
+    if isinstance(code, Region):
+        return code
+    try:
+        return REGIONS[code]
+    except KeyError:
+        raise KeyError(f"Unknown region: {code!r}") from None
+
+
+def tariff_values(code=None):
+    """Rate slider stops of a region's tariff_range (integer ranges stay int)."""
+    low, high, step = get_region(code).tariff_range
+    if all(isinstance(v, int) for v in (low, high, step)):
+        return tuple(range(low, high + 1, step))
+    return tuple(round(low + i * step, 10) for i in range(int(round((high - low) / step)) + 1))
+
+
+def emission_factors():
+    """{code: emission_factor}, e.g. for utils.co2_from_watts(..., region=...)."""
+    return {code: r.emission_factor for code, r in REGIONS.items()}
+
+
+class RegionTable:
+    """Region-dependent catalog columns for every registered region."""
+
+    def __init__(self, catalog, regions, version=0):
+        self.catalog = catalog
+        self.version = version
+        self.regions = tuple(regions)
+        self.codes = tuple(r.code for r in self.regions)
+        self._index = {code: i for i, code in enumerate(self.codes)}
+        self.emission_factor = np.array([r.emission_factor for r in self.regions], dtype=np.float64)
+        self.tariff = np.array([r.tariff for r in self.regions], dtype=np.float64)
+        self.per_usd = np.array([r.per_usd for r in self.regions], dtype=np.float64)
+        self._columns = {}
+        self.names = CATALOG_COLUMNS + ("CO2_Diff",) + tuple(f"{tier}_Cost(local)" for tier in TIERS)
+
+    def index_of(self, region):
+        try:
+            return self._index[region]
+        except KeyError:
+            raise KeyError(f"Unknown region: {region!r}") from None
+
+    def indices_of(self, regions):
+        """Map region codes (or integer region indices) to an index array."""
+        arr = np.asarray(regions)
+        if arr.dtype.kind in "iu":
+            if arr.size and (arr.min() < 0 or arr.max() >= len(self.codes)):
+                raise IndexError("Region index out of range")
+            return arr.astype(np.intp, copy=False)
+        uniques, inverse = np.unique(arr.ravel(), return_inverse=True)
+        table = np.array([self.index_of(code) for code in uniques.tolist()], dtype=np.intp)
+        return table[inverse].reshape(arr.shape)
+
+    def _compute(self, name):
+        col = self.catalog.columns
+        factor = self.emission_factor[:, None]
+        if name == "CO2_Factor":
+            return np.broadcast_to(factor, (len(self.codes), len(self.catalog))).copy()
+        if name == "CO2_Diff":
+            return self.column("Old_CO2(kg/hr)") - self.column("Updated_CO2(kg/hr)")
+        tier, _, suffix = name.partition("_")
+        if suffix == "CO2(kg/hr)":
+            # same expression as the catalog's derived column, one row per region
+            return co2_from_watts(np.asarray(col[f"{tier}_Energy(W)"])[None, :], factor)
+        if suffix == "Cost(local)":
+            return np.asarray(col[f"{tier}_Cost($)"], dtype=np.float64)[None, :] * self.per_usd[:, None]
+        raise KeyError(f"Unknown regional column: {name!r}")
+
+    def column(self, name, region=None):
+        """(n_regions, n_rows) array of ``name``, or one region's row of it."""
+        arr = self._columns.get(name)
+        if arr is None:
+            arr = self._compute(name)
+            arr.flags.writeable = False
+            self._columns[name] = arr
+        return arr if region is None else arr[self.index_of(region)]
+
+    def take(self, name, regions, rows):
+        """Values of ``name`` at (region index, row) pairs; inputs broadcast."""
+        return self.column(name)[regions, rows]
+
+    def row_values(self, region, row):
+        """{name: value} of the region-dependent catalog columns for one row."""
+        r = self.index_of(region)
+        return {name: self.column(name)[r, row].item() for name in CATALOG_COLUMNS}
+
+
+_TABLE = None
+
+
+def get_region_table():
+    """Process-wide RegionTable over get_catalog() and the current registry."""
+    global _TABLE
+    catalog = get_catalog()
+    if _TABLE is None or _TABLE.catalog is not catalog or _TABLE.version != _VERSION:
+        _TABLE = RegionTable(catalog, REGIONS.values(), _VERSION)
+    return _TABLE
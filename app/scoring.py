@@ -0,0 +1,129 @@
+# ======================================================
+# scoring.py — EcoFusion 2.0 Upgrade Recommendation Scoring Engine
+# ======================================================
+# The eco_score behind the dashboard's "Smart Upgrade Recommendation":
+#
+#   eco_score = eff_gain * 3 + annual_co2_saved / 10 + annual_cost_saved / 100
+#   > 120 → Updated,  > 80 → Modern,  otherwise stay on Old
+#
+# Every function accepts scalars or NumPy arrays and broadcasts, so whole
+# portfolios are scored in one call. Weight sets are pluggable; the
+# "default" set reproduces the dashboard exactly. Weights are calibrated in
+# the default region's currency, so regional cost savings are converted to
+# it before scoring.
+
+from collections import namedtuple
+
+import numpy as np
+
+from catalog import get_catalog
+from model import analyze_efficiency_batch
+from regions import DEFAULT_REGION, get_region_table
+
+TIER_NAMES = ("Old", "Modern", "Updated")
+OLD, MODERN, UPDATED = range(3)
+
+WeightSet = namedtuple("WeightSet", "eff_gain co2_scale cost_scale updated_above modern_above")
+WeightSet.__doc__ = """eco_score = eff_gain*w.eff_gain + co2/w.co2_scale + cost/w.cost_scale,
+recommending Updated above ``updated_above`` and Modern above ``modern_above``."""
+
+DEFAULT_WEIGHTS = WeightSet(eff_gain=3, co2_scale=10, cost_scale=100, updated_above=120, modern_above=80)
+
+WEIGHT_SETS = {
+    "default": DEFAULT_WEIGHTS,
+    "carbon-first": WeightSet(eff_gain=1, co2_scale=2, cost_scale=500, updated_above=120, modern_above=80),
+    "cost-first": WeightSet(eff_gain=1, co2_scale=50, cost_scale=20, updated_above=120, modern_above=80),
+}
+
+
+def register_weights(name, weights):
+    """Add or replace a named weight set."""
+    if not isinstance(weights, WeightSet):
+        weights = WeightSet(**weights)
+    WEIGHT_SETS[name] = weights
+    return weights
+
+
+def get_weights(weights=None):
+    """Resolve ``None`` / a registered name / a WeightSet to a WeightSet."""
+    if weights is None:
+        return DEFAULT_WEIGHTS
+    if isinstance(weights, str):
+        try:
+            return WEIGHT_SETS[weights]
+        except KeyError:
+            raise KeyError(f"Unknown weight set: {weights!r}") from None
+    return weights
+
+
+def eco_score(eff_gain, annual_co2_saved, annual_cost_saved, weights=None):
+    w = get_weights(weights)
+    return (eff_gain * w.eff_gain) + (annual_co2_saved / w.co2_scale) + (annual_cost_saved / w.cost_scale)
+
+
+def recommend(score, weights=None):
+    """Tier code per score: UPDATED, MODERN or OLD (int8 array, or int for scalars)."""
+    w = get_weights(weights)
+    score = np.asarray(score)
+    tiers = np.where(score > w.updated_above, UPDATED, np.where(score > w.modern_above, MODERN, OLD))
+    return tiers.astype(np.int8) if tiers.ndim else int(tiers)
+
+
+def tier_names(tiers):
+    """Map tier codes to "Old" / "Modern" / "Updated"."""
+    return np.asarray(TIER_NAMES, dtype=object)[tiers]
+
+
+def _scored_cost(annual_cost_saved, region):
+    """Cost savings in the default region's currency (what weights expect)."""
+    if region is None:
+        return annual_cost_saved
+    table = get_region_table()
+    return annual_cost_saved * (table.per_usd[table.index_of(DEFAULT_REGION)] / table.per_usd[region])
+
+
+def score_summary(summary, weights=None, region=None):
+    """eco_score and tier for one analyze_efficiency summary dict."""
+    regions = None if region is None else get_region_table().index_of(region)
+    score = eco_score(summary["eff_gain"], summary["annual_co2_saved"],
+                      _scored_cost(summary["annual_cost_saved"], regions), weights)
+    return score, recommend(score, weights)
+
+
+def score_scenarios(category, hours_per_day=None, electricity_rate=None, weights=None, region=None):
+    """analyze_efficiency_batch plus ``eco_score`` and ``tier`` columns."""
+    result = analyze_efficiency_batch(category, hours_per_day, electricity_rate, region)
+    result["eco_score"] = eco_score(result["eff_gain"], result["annual_co2_saved"],
+                                    _scored_cost(result["annual_cost_saved"], result.get("region_code")), weights)
+    result["tier"] = recommend(result["eco_score"], weights)
+    return result
+
+
+def score_all_categories(hours_per_day, electricity_rate, weights=None, region=None):
+    """Score every catalog category against the same usage scenario(s).
+
+    Returns a dict of arrays shaped ``(n_categories, *scenario_shape)`` plus
+    the ``categories`` names and the recommended component per cell.
+    """
+    catalog = get_catalog()
+    codes = np.array([catalog.index_of(c) for c in catalog.categories], dtype=np.intp)
+    hours = np.asarray(hours_per_day)
+    rates = np.asarray(electricity_rate)
+    shape = np.broadcast_shapes(hours.shape, rates.shape)
+    codes = codes.reshape((-1,) + (1,) * len(shape))
+
+    result = score_scenarios(codes, hours, rates, weights, region)
+    components = np.stack([catalog.columns.take(f"{tier}_Component", codes.ravel()) for tier in TIER_NAMES])
+    tier = result["tier"].reshape(len(codes), -1)
+    result["recommended"] = components[tier, np.arange(len(codes))[:, None]].reshape(tier.shape[:1] + shape)
+    result["categories"] = catalog.categories
+    return result
+
+
+def rank(scores, top=None):
+    """Indices of ``scores`` from best to worst (stable), optionally the first ``top``."""
+    scores = np.asarray(scores).ravel()
+    if top is not None and top < len(scores):
+        part = np.argpartition(-scores, top)[:top]
+        return part[np.argsort(-scores[part], kind="stable")]
+    return np.argsort(-scores, kind="stable")
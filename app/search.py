@@ -0,0 +1,227 @@
+# ======================================================
+# search.py — EcoFusion 2.0 Catalog Search Index
+# ======================================================
+# Filtered lookup over appliance models (catalog rows) and their component
+# breakdowns without scanning the catalog:
+#
+#   sorted numeric indexes   one argsort per numeric column, built on first
+#                            use; range predicates are two searchsorted calls
+#   inverted component index breakdown entries sorted by (attribute, tier,
+#                            value code), so an attribute/value predicate is a
+#                            handful of contiguous ranges
+#
+#   index = get_index()
+#   rows = index.query(where("Updated_Energy(W)", "<", 100), where("Updated_Cost($)", "<", 500))
+#   rows = index.query(has_component("Updated", "Refrigerant", contains="R290"))
+#   index.categories(rows)
+#
+# The most selective predicate produces the candidate rows; the rest are
+# checked only on those candidates, so queries cost O(log n + result size).
+
+from collections import namedtuple
+
+import numpy as np
+
+from catalog import get_catalog
+from catalog_store import TIERS
+
+OPS = ("<", "<=", ">", ">=", "==", "between")
+
+Where = namedtuple("Where", "column op value")
+HasComponent = namedtuple("HasComponent", "tier attribute equals contains")
+
+
+def where(column, op, value):
+    """Numeric predicate; ``op`` is one of OPS (``between`` takes ``(low, high)``, inclusive)."""
+    if op not in OPS:
+        raise ValueError(f"Unknown operator: {op!r} (expected one of {', '.join(OPS)})")
+    return Where(column, op, value)
+
+
+def has_component(tier, attribute, equals=None, contains=None):
+    """Component predicate: ``tier``'s ``attribute`` equals / contains a value (or just exists)."""
+    if tier not in TIERS:
+        raise ValueError(f"Unknown tier: {tier!r} (expected one of {', '.join(TIERS)})")
+    return HasComponent(tier, attribute, equals, contains)
+
+
+def _expand(starts, stops):
+    """Concatenate ``arange(start, stop)`` for every pair, vectorized."""
+    lengths = stops - starts
+    total = int(lengths.sum())
+    if not total:
+        return np.empty(0, dtype=np.intp)
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+    return offsets + np.arange(total)
+
+
+class _SortedColumn:
+    __slots__ = ("values", "order", "sorted")
+
+    def __init__(self, values):
+        self.values = values
+        self.order = np.argsort(values, kind="stable")
+        self.sorted = values[self.order]
+
+    def bounds(self, op, value):
+        s = self.sorted
+        if op == "<":
+            return 0, int(np.searchsorted(s, value, "left"))
+        if op == "<=":
+            return 0, int(np.searchsorted(s, value, "right"))
+        if op == ">":
+            return int(np.searchsorted(s, value, "right")), len(s)
+        if op == ">=":
+            return int(np.searchsorted(s, value, "left")), len(s)
+        if op == "==":
+            return int(np.searchsorted(s, value, "left")), int(np.searchsorted(s, value, "right"))
+        low, high = value
+        return int(np.searchsorted(s, low, "left")), int(np.searchsorted(s, high, "right"))
+
+    def test(self, rows, op, value):
+        v = self.values[rows]
+        if op == "<":
+            return v < value
+        if op == "<=":
+            return v <= value
+        if op == ">":
+            return v > value
+        if op == ">=":
+            return v >= value
+        if op == "==":
+            return v == value
+        return (v >= value[0]) & (v <= value[1])
+
+
+class CatalogIndex:
+    """Search index over one ApplianceCatalog; sub-indexes build on first use."""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self._numeric = {}
+        self._entries = None
+        self._attribute_codes = None
+        self._values = {}
+        self._rows_by_category = None
+
+    # ---- numeric ----------------------------------------------------
+    def _sorted(self, column):
+        index = self._numeric.get(column)
+        if index is None:
+            if column not in self.catalog.columns:
+                raise KeyError(f"Unknown column: {column!r}")
+            values = np.asarray(self.catalog.columns[column])
+            if values.dtype.kind not in "iuf":
+                raise TypeError(f"Column {column!r} is not numeric")
+            index = self._numeric[column] = _SortedColumn(values)
+        return index
+
+    # ---- components -------------------------------------------------
+    def _component_entries(self):
+        if self._entries is None:
+            comp = self.catalog.component_codes
+            category, tier = np.asarray(comp["category"]), np.asarray(comp["tier"])
+            key, value = np.asarray(comp["key"]), np.asarray(comp["value"])
+            order = np.lexsort((value, tier, key))
+            # (attribute, tier) pairs become one sortable int64
+            pair = key[order].astype(np.int64) * len(TIERS) + tier[order]
+            self._entries = (pair, value[order], category[order])
+            strings = self.catalog.strings
+            self._attribute_codes = {strings[k]: k for k in np.unique(key).tolist()}
+        return self._entries
+
+    def _attribute_values(self, lo, hi):
+        """(distinct value codes, decoded strings) for one (attribute, tier) range."""
+        # An empty range shares its ``lo`` with the next one, so key by both ends
+        cached = self._values.get((lo, hi))
+        if cached is None:
+            codes = np.unique(self._entries[1][lo:hi])
+            strings = self.catalog.strings
+            cached = self._values[(lo, hi)] = (codes, [strings[c] for c in codes.tolist()])
+        return cached
+
+    def _component_categories(self, pred):
+        """Category string codes satisfying a HasComponent predicate."""
+        pair, values, categories = self._component_entries()
+        key = self._attribute_codes.get(pred.attribute)
+        if key is None:
+            return np.empty(0, dtype=categories.dtype)
+        p = key * len(TIERS) + TIERS.index(pred.tier)
+        lo, hi = int(np.searchsorted(pair, p, "left")), int(np.searchsorted(pair, p, "right"))
+        if pred.equals is None and pred.contains is None:
+            return np.unique(categories[lo:hi])
+
+        codes, decoded = self._attribute_values(lo, hi)
+        matched = np.array([c for c, s in zip(codes.tolist(), decoded)
+                            if (pred.equals is None or s == pred.equals)
+                            and (pred.contains is None or pred.contains in s)], dtype=values.dtype)
+        span = values[lo:hi]
+        starts = np.searchsorted(span, matched, "left")
+        stops = np.searchsorted(span, matched, "right")
+        return np.unique(categories[lo:hi][_expand(starts, stops)])
+
+    def _rows_of_categories(self, codes):
+        if self._rows_by_category is None:
+            category = self.catalog.columns.codes("Category")
+            order = np.argsort(category, kind="stable")
+            self._rows_by_category = (order, np.asarray(category)[order])
+        order, sorted_codes = self._rows_by_category
+        starts = np.searchsorted(sorted_codes, codes, "left")
+        stops = np.searchsorted(sorted_codes, codes, "right")
+        return order[_expand(starts, stops)]
+
+    # ---- query ------------------------------------------------------
+    def count(self, pred):
+        """Number of rows a single Where predicate matches (two binary searches)."""
+        lo, hi = self._sorted(pred.column).bounds(pred.op, pred.value)
+        return max(hi - lo, 0)
+
+    def query(self, *predicates, order_by=None, descending=False, limit=None):
+        """Row indices matching every predicate (ascending unless ``order_by`` is given)."""
+        numeric = [p for p in predicates if isinstance(p, Where)]
+        components = [p for p in predicates if isinstance(p, HasComponent)]
+
+        category_sets = [self._component_categories(p) for p in components]
+        if category_sets:
+            smallest = min(range(len(category_sets)), key=lambda i: len(category_sets[i]))
+            rows = self._rows_of_categories(category_sets.pop(smallest))
+        elif numeric:
+            best = min(numeric, key=self.count)
+            numeric.remove(best)
+            index = self._sorted(best.column)
+            lo, hi = index.bounds(best.op, best.value)
+            rows = index.order[lo:max(hi, lo)]
+        else:
+            rows = np.arange(len(self.catalog))
+
+        for pred in numeric:
+            if not len(rows):
+                break
+            rows = rows[self._sorted(pred.column).test(rows, pred.op, pred.value)]
+        if category_sets:
+            category = self.catalog.columns.codes("Category")
+            for codes in category_sets:
+                rows = rows[np.isin(category[rows], codes)]
+
+        if order_by is None:
+            rows = np.sort(rows)
+        else:
+            keys = self._sorted(order_by).values[rows]
+            rows = rows[np.argsort(-keys if descending else keys, kind="stable")]
+        return rows[:limit] if limit is not None else rows
+
+    def categories(self, rows):
+        """Distinct category names of ``rows``, in row order."""
+        names = self.catalog.columns.take("Category", np.asarray(rows))
+        return list(dict.fromkeys(np.atleast_1d(names).tolist()))
+
+
+_INDEX = None
+
+
+def get_index():
+    """Return the process-wide index over get_catalog()."""
+    global _INDEX
+    if _INDEX is None or _INDEX.catalog is not get_catalog():
+        _INDEX = CatalogIndex(get_catalog())
+    return _INDEX
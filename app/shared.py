@@ -0,0 +1,171 @@
+# ======================================================
+# shared.py — EcoFusion 2.0 Shared Computation Layer
+# ======================================================
+# One dashboard process serves every session behind the load balancer, and
+# sessions ask for the same handful of category / parameter combinations.
+# This layer makes concurrent sessions share work instead of repeating it:
+#
+#   single-flight   concurrent calls with the same key run the function once;
+#                   the other callers block and receive the same result
+#   render pool     chart rendering runs on a bounded thread pool, each
+#                   worker with its own matplotlib figures (charts.py)
+#   backpressure    at most workers + queue renders are admitted; further
+#                   callers wait up to a timeout and then get Overloaded
+#
+#   @shared("chart_png", pool=True)    single-flight + render pool
+#   @shared("uncertainty")             single-flight in the calling thread
+#
+# ECOFUSION_SHARED=0           disables the layer (functions run inline)
+# ECOFUSION_RENDER_WORKERS     render threads (default min(4, CPUs))
+# ECOFUSION_RENDER_QUEUE       renders allowed to wait for a worker (default 16)
+# ECOFUSION_RENDER_TIMEOUT     seconds to wait for admission (default 10)
+
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import metrics
+from charts import use_thread_renderer
+
+ENABLED = os.environ.get("ECOFUSION_SHARED", "1").lower() not in ("0", "false", "no", "off")
+RENDER_WORKERS = int(os.environ.get("ECOFUSION_RENDER_WORKERS", min(4, os.cpu_count() or 1)))
+RENDER_QUEUE = int(os.environ.get("ECOFUSION_RENDER_QUEUE", 16))
+RENDER_TIMEOUT = float(os.environ.get("ECOFUSION_RENDER_TIMEOUT", 10))
+
+
+class Overloaded(RuntimeError):
+    """The render pool stayed saturated for the whole admission timeout."""
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+        try:
+            value = fn(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+class RenderPool:
+    """Bounded thread pool with admission control.
+
+    At most ``workers`` renders run at once and ``queue`` more may wait for
+    a worker; a caller that cannot be admitted within ``timeout`` seconds
+    gets Overloaded rather than growing the backlog.
+    """
+
+    def __init__(self, workers=RENDER_WORKERS, queue=RENDER_QUEUE, timeout=RENDER_TIMEOUT):
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="ecofusion-render",
+                                            initializer=use_thread_renderer)
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def submit(self, fn, *args, timeout=None):
+        if not self._slots.acquire(timeout=self.timeout if timeout is None else timeout):
+            with self._lock:
+                self.rejected += 1
+            raise Overloaded(f"render pool saturated ({self.capacity} renders admitted)")
+        with self._lock:
+            self.pending += 1
+        try:
+            future = self._executor.submit(self._timed, time.perf_counter(), fn, args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def run(self, fn, *args, timeout=None):
+        """submit() and wait for the result."""
+        return self.submit(fn, *args, timeout=timeout).result()
+
+    @staticmethod
+    def _timed(submitted, fn, args):
+        if metrics.ENABLED:
+            metrics.observe("shared.render_queue_wait", time.perf_counter() - submitted)
+        return fn(*args)
+
+    def _release(self, future):
+        with self._lock:
+            self.pending -= 1
+            self.completed += future is not None
+        self._slots.release()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+
+_FLIGHTS = SingleFlight()
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_render_pool():
+    """Process-wide RenderPool, created on first render."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = RenderPool()
+        return _POOL
+
+
+def shared(namespace, pool=False):
+    """Single-flight a function of hashable arguments; ``pool=True`` also
+    runs it on the render pool (and may raise Overloaded)."""
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            if pool:
+                return _FLIGHTS.do((namespace, args), get_render_pool().run, fn, *args)
+            return _FLIGHTS.do((namespace, args), fn, *args)
+        return wrapper
+    return decorate
+
+
+def stats():
+    """Counters for dashboards and load tests."""
+    out = {"enabled": ENABLED, "calls": _FLIGHTS.calls, "shared": _FLIGHTS.shared,
+           "in_flight": _FLIGHTS.in_flight()}
+    if _POOL is not None:
+        out.update(render_workers=_POOL.workers, render_capacity=_POOL.capacity,
+                   render_pending=_POOL.pending, renders=_POOL.completed, rejected=_POOL.rejected)
+    return out
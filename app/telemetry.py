@@ -0,0 +1,125 @@
+# ======================================================
+# telemetry.py — EcoFusion 2.0 Streaming Telemetry Scoring
+# ======================================================
+# Reads Voltage/Current/Temperature readings in fixed-size chunks from a CSV
+# file or stdin, scores each chunk with data/energy_model.pkl and emits
+# predicted energy and CO₂. Only one chunk is resident at a time, so memory
+# stays bounded regardless of input size.
+#
+# Run: python app/telemetry.py data/appliance_data.csv -o predictions.csv
+#      cat meter.log.csv | python app/telemetry.py - > predictions.csv
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from catalog import CO2_FACTOR
+from utils import co2_from_watts
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+MODEL_PATH = os.path.join(DATA_DIR, "energy_model.pkl")
+FEATURES = ["Voltage(V)", "Current(A)", "Temperature(°C)"]
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def load_energy_model(path=MODEL_PATH):
+    # Saved with joblib (NumpyArrayWrapper), so plain pickle cannot read it.
+    # Imported here so scikit-learn is only loaded when a model is needed.
+    import joblib
+
+    return joblib.load(path)
+
+
+_MODELS = {}
+
+
+def get_energy_model(path=MODEL_PATH):
+    """Return the unpickled model for ``path``, loading it once per process."""
+    key = os.path.abspath(path)
+    if key not in _MODELS:
+        _MODELS[key] = load_energy_model(key)
+    return _MODELS[key]
+
+
+class EnergyScorer:
+    """Vectorized scorer for the pickled energy regression model.
+
+    Linear models are evaluated directly as ``X @ coef_ + intercept_`` on
+    the raw float array, skipping scikit-learn's per-call validation.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.features = list(getattr(model, "feature_names_in_", FEATURES))
+        coef = getattr(model, "coef_", None)
+        if coef is not None and np.ndim(coef) == 1 and hasattr(model, "intercept_"):
+            self._coef = np.asarray(coef, dtype=np.float64)
+            self._intercept = float(model.intercept_)
+        else:
+            self._coef = None
+
+    def predict(self, X):
+        """Predict energy for an (n, n_features) array or a DataFrame."""
+        if isinstance(X, pd.DataFrame):
+            X = X[self.features]
+        if self._coef is not None:
+            return np.asarray(X, dtype=np.float64) @ self._coef + self._intercept
+        return np.asarray(self.model.predict(pd.DataFrame(np.asarray(X), columns=self.features)))
+
+
+def iter_chunks(source, chunksize=DEFAULT_CHUNKSIZE, usecols=None):
+    """Yield DataFrame chunks from a CSV path, open file, or ``-`` for stdin."""
+    if source == "-":
+        source = sys.stdin
+    yield from pd.read_csv(source, chunksize=chunksize, usecols=usecols)
+
+
+def score_chunk(chunk, scorer):
+    """Append predicted energy and CO₂ (calculate_co2 math) to one chunk."""
+    predicted = scorer.predict(chunk)
+    chunk["Predicted_Energy(W)"] = predicted
+    chunk["Predicted_CO2(kg)"] = co2_from_watts(predicted, CO2_FACTOR, decimals=3)
+    return chunk
+
+
+def score_stream(source, scorer=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Lazily yield scored chunks from ``source``."""
+    scorer = scorer or EnergyScorer(get_energy_model())
+    for chunk in iter_chunks(source, chunksize):
+        yield score_chunk(chunk, scorer)
+
+
+def run_pipeline(source, output, chunksize=DEFAULT_CHUNKSIZE, scorer=None):
+    """Score ``source`` into ``output`` (path, file object or ``-``).
+
+    Returns ``{"rows", "seconds", "rows_per_sec"}``.
+    """
+    scorer = EnergyScorer(get_energy_model()) if scorer is None else scorer  # load outside the timing
+    out = sys.stdout if output == "-" else output
+    rows = 0
+    t0 = time.perf_counter()
+    for n, chunk in enumerate(score_stream(source, scorer, chunksize)):
+        chunk.to_csv(out, mode="w" if n == 0 else "a", header=(n == 0), index=False)
+        rows += len(chunk)
+    seconds = time.perf_counter() - t0
+    return {"rows": rows, "seconds": seconds, "rows_per_sec": rows / seconds if seconds else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score appliance telemetry with energy_model.pkl")
+    parser.add_argument("source", help="CSV path, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output CSV path (default: stdout)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args()
+
+    stats = run_pipeline(args.source, args.output, args.chunksize)
+    print(f"⚡ {stats['rows']:,} rows in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_sec']:,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# ======================================================
+# training.py — EcoFusion 2.0 Out-of-Core Energy Model Retraining
+# ======================================================
+# Refits data/energy_model.pkl (ordinary least squares of Energy(W) on
+# Voltage/Current/Temperature) from telemetry files of any size. Chunks are
+# reduced to sufficient statistics — row count, column means and the
+# centered co-moment matrix of [features, target] — which are merged with
+# Chan's parallel update, so peak memory is one chunk no matter how many
+# rows stream through, and the fit equals LinearRegression on all rows.
+#
+# Each run writes a new versioned artifact next to the current model:
+#
+#   data/energy_model-v<N>.pkl    LinearRegression (joblib, same as the original)
+#   data/energy_model-v<N>.json   sources, rows, coefficients, R², RMSE, throughput
+#
+# Point telemetry / anomaly detection at it with get_energy_model(path).
+#
+# Run: python app/training.py data/appliance_data.csv [more.csv ...] [--chunksize 1000000]
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+from telemetry import FEATURES, MODEL_PATH, iter_chunks
+
+TARGET = "Energy(W)"
+DEFAULT_CHUNKSIZE = 1_000_000
+
+
+class RegressionStats:
+    """Mergeable sufficient statistics for least squares of ``target`` on ``features``."""
+
+    def __init__(self, n_features):
+        self.n = 0
+        self.mean = np.zeros(n_features + 1)
+        self.comoment = np.zeros((n_features + 1, n_features + 1))
+
+    def update(self, block):
+        """Fold in an (m, n_features + 1) array whose last column is the target."""
+        block = np.asarray(block, dtype=np.float64)
+        m = len(block)
+        if not m:
+            return self
+        mean = block.mean(axis=0)
+        centered = block - mean
+        self._merge(m, mean, centered.T @ centered)
+        return self
+
+    def merge(self, other):
+        """Combine with statistics gathered elsewhere (another file or worker)."""
+        if other.n:
+            self._merge(other.n, other.mean, other.comoment)
+        return self
+
+    def _merge(self, n_b, mean_b, comoment_b):
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.comoment += comoment_b + np.outer(delta, delta) * (self.n * n_b / n)
+        self.mean += delta * (n_b / n)
+        self.n = n
+
+    def solve(self):
+        """``(coef, intercept)`` of the least-squares fit."""
+        if self.n < 2:
+            raise ValueError(f"Need at least 2 rows to fit, got {self.n}")
+        cxx, cxy = self.comoment[:-1, :-1], self.comoment[:-1, -1]
+        coef = np.linalg.lstsq(cxx, cxy, rcond=None)[0]
+        return coef, float(self.mean[-1] - self.mean[:-1] @ coef)
+
+    def scores(self, coef):
+        """``{"r2", "rmse"}`` of ``coef`` on the accumulated rows."""
+        syy = self.comoment[-1, -1]
+        residual = max(syy - coef @ self.comoment[:-1, -1], 0.0)
+        return {"r2": 1.0 - residual / syy if syy > 0 else 1.0, "rmse": float(np.sqrt(residual / self.n))}
+
+
+def fit_stream(sources, chunksize=DEFAULT_CHUNKSIZE, features=FEATURES, target=TARGET):
+    """Accumulate RegressionStats over CSV ``sources`` (paths or ``-``).
+
+    Returns ``(stats, report)`` with report ``{"rows", "seconds", "rows_per_sec"}``.
+    """
+    columns = list(features) + [target]
+    stats = RegressionStats(len(features))
+    t0 = time.perf_counter()
+    for source in sources:
+        for chunk in iter_chunks(source, chunksize, usecols=columns):
+            stats.update(chunk[columns].to_numpy(dtype=np.float64))
+    seconds = time.perf_counter() - t0
+    return stats, {"rows": stats.n, "seconds": seconds, "rows_per_sec": stats.n / seconds if seconds else 0.0}
+
+
+def build_model(stats, features=FEATURES):
+    """A fitted scikit-learn LinearRegression equivalent to ``stats``."""
+    from sklearn.linear_model import LinearRegression
+
+    coef, intercept = stats.solve()
+    model = LinearRegression()
+    model.feature_names_in_ = np.asarray(features, dtype=object)
+    model.n_features_in_ = len(features)
+    model.coef_ = coef
+    model.intercept_ = np.float64(intercept)
+    # LinearRegression reports the singular values of the centered design matrix
+    cxx = stats.comoment[:-1, :-1]
+    model.rank_ = int(np.linalg.matrix_rank(cxx))
+    model.singular_ = np.sqrt(np.clip(np.linalg.eigvalsh(cxx)[::-1], 0.0, None))
+    return model
+
+
+def next_version_path(path=MODEL_PATH):
+    """``energy_model-v<N>.pkl`` beside ``path``; the unversioned file counts as v1."""
+    stem, ext = os.path.splitext(path)
+    pattern = re.compile(re.escape(os.path.basename(stem)) + r"-v(\d+)" + re.escape(ext) + "$")
+    versions = [int(m.group(1)) for f in glob.glob(f"{glob.escape(stem)}-v*{ext}")
+                if (m := pattern.match(os.path.basename(f)))]
+    return f"{stem}-v{max(versions, default=1) + 1}{ext}"
+
+
+def save_model(model, stats, report, sources, path=None):
+    """Write the model and its JSON metadata; returns the model path."""
+    import joblib
+
+    path = path or next_version_path()
+    metadata = {
+        "model": os.path.basename(path),
+        "trained_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sources": [os.path.abspath(s) if s != "-" else "-" for s in sources],
+        "features": list(model.feature_names_in_),
+        "target": TARGET,
+        "coef": model.coef_.tolist(),
+        "intercept": float(model.intercept_),
+        **stats.scores(model.coef_),
+        **report,
+    }
+    joblib.dump(model, path)
+    with open(os.path.splitext(path)[0] + ".json", "w", encoding="utf-8") as fh:
+        json.dump(metadata, fh, indent=2, ensure_ascii=False)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Retrain energy_model.pkl from telemetry CSVs")
+    parser.add_argument("sources", nargs="+", help="CSV paths, or - for stdin")
+    parser.add_argument("-o", "--output", help="model path (default: next energy_model-v<N>.pkl)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args()
+
+    stats, report = fit_stream(args.sources, args.chunksize)
+    model = build_model(stats)
+    path = save_model(model, stats, report, args.sources, args.output)
+    scores = stats.scores(model.coef_)
+    print(f"🧠 {report['rows']:,} rows in {report['seconds']:.2f}s ({report['rows_per_sec']:,.0f} rows/s), "
+          f"R² {scores['r2']:.4f}, RMSE {scores['rmse']:.4g} → {path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,92 @@
+# ======================================================
+# utils.py — EcoFusion 2.0 Energy / CO₂ Conversion Kernel
+# ======================================================
+# Every CO₂ figure in the project is computed here:
+#
+#   co2_kg = (energy_watts / 1000) * emission_factor [* hours], then rounded
+#
+# Inputs may be Python numbers, NumPy arrays or pandas Series (the result has
+# the same kind). Emission factors may be a scalar, a per-row array, or a
+# {region: factor} mapping looked up through a ``region`` column. NumPy is
+# imported only for non-scalar input, so importing utils stays cheap.
+
+EMISSION_FACTOR = 0.82  # kg CO₂ per kWh
+
+ROUNDING_MODES = ("half_even", "half_up", "floor", "ceil")
+
+
+def _array_like(values):
+    # Python lists/tuples become arrays; arrays and Series pass through
+    if isinstance(values, (list, tuple)):
+        import numpy as np
+
+        return np.asarray(values, dtype=np.float64)
+    return values
+
+
+def region_factors(region, factors):
+    """Per-row emission factors for ``region`` keys from a {region: factor} mapping."""
+    import numpy as np
+
+    keys, inverse = np.unique(np.asarray(region), return_inverse=True)
+    try:
+        table = np.array([factors[k] for k in keys.tolist()], dtype=np.float64)
+    except KeyError as exc:
+        raise KeyError(f"No emission factor for region: {exc.args[0]!r}") from None
+    return table[inverse.reshape(np.shape(region))]
+
+
+def round_values(values, decimals, mode="half_even"):
+    """Round scalars, arrays or Series to ``decimals`` places.
+
+    ``half_even`` matches Python's ``round`` for scalars and ``np.round`` for
+    arrays (identical except at exact binary ties); ``half_up``, ``floor``
+    and ``ceil`` round toward +inf at .5, down and up respectively.
+    """
+    if mode == "half_even":
+        if isinstance(values, (int, float)):
+            return round(values, decimals)
+        import numpy as np
+
+        return np.round(values, decimals)
+    if mode not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding mode: {mode!r} (expected one of {', '.join(ROUNDING_MODES)})")
+
+    import numpy as np
+
+    scale = 10.0 ** decimals
+    if mode == "half_up":
+        out = np.floor(values * scale + 0.5) / scale
+    else:
+        out = getattr(np, mode)(values * scale) / scale
+    return float(out) if isinstance(values, (int, float)) else out
+
+
+def watts_to_kwh(energy_watts, hours=None):
+    """Energy in kWh for ``hours`` of use (per hour when ``hours`` is None)."""
+    energy_kwh = _array_like(energy_watts) / 1000
+    return energy_kwh if hours is None else energy_kwh * _array_like(hours)
+
+
+def co2_from_watts(energy_watts, factor=EMISSION_FACTOR, *, region=None, hours=None,
+                   decimals=None, rounding="half_even"):
+    """kg CO₂ for a power draw in watts — scalar, array or Series in, same out.
+
+    ``factor`` is a scalar, per-row array, or {region: factor} mapping used
+    with ``region``. ``hours`` scales per-hour emissions to a duration.
+    ``decimals`` (default: no rounding) rounds with the ``rounding`` mode.
+    """
+    if region is not None:
+        factor = region_factors(region, factor)
+    co2 = (_array_like(energy_watts) / 1000) * _array_like(factor)
+    if hours is not None:
+        co2 = co2 * _array_like(hours)
+    return co2 if decimals is None else round_values(co2, decimals, rounding)
+
+
 def calculate_co2(energy_watts):
-    energy_kwh = energy_watts / 1000
-    emission_factor = 0.82  # kg CO₂ per kWh
-    return round(energy_kwh * emission_factor, 3)
+    """kg CO₂ per hour at the default grid factor, rounded to 3 decimals."""
+    if isinstance(energy_watts, (int, float)):
+        # Same math as co2_from_watts without the dispatch, for per-reading callers
+        return round((energy_watts / 1000) * EMISSION_FACTOR, 3)
+    return co2_from_watts(energy_watts, decimals=3)
@@ -0,0 +1,40 @@
+# ======================================================
+# bench_batch.py — analyze_efficiency_batch vs scalar loop
+# Run: python benchmarks/bench_batch.py [n_scenarios]
+# ======================================================
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import numpy as np
+
+from catalog import get_catalog
+from model import analyze_efficiency, analyze_efficiency_batch
+
+
+def main(n=500_000, loop_n=5_000):
+    rng = np.random.default_rng(0)
+    categories = rng.choice(np.array(get_catalog().categories, dtype=object), n)
+    hours = rng.integers(1, 25, n)
+    rates = rng.integers(3, 16, n)
+
+    t0 = time.perf_counter()
+    analyze_efficiency_batch(categories, hours, rates)
+    batch_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for c, h, r in zip(categories[:loop_n], hours[:loop_n], rates[:loop_n]):
+        analyze_efficiency(c, h, r)
+    loop_s = (time.perf_counter() - t0) / loop_n * n
+
+    print(f"scenarios: {n:,}")
+    print(f"batch:       {batch_s:8.3f} s  ({n / batch_s:,.0f} scenarios/s)")
+    print(f"scalar loop: {loop_s:8.3f} s  (extrapolated from {loop_n:,})")
+    print(f"speedup: {loop_s / batch_s:.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,73 @@
+# ======================================================
+# bench_catalog.py — analyze_efficiency per-call latency
+# Legacy (rebuild DataFrame + mask scan) vs precomputed catalog
+# Run: python benchmarks/bench_catalog.py
+# ======================================================
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import pandas as pd
+
+from catalog import get_catalog
+from catalog_store import decode_columns, read_bundle
+from model import analyze_efficiency, get_component_breakdown
+
+# Source columns as the old hard-coded dict literal held them
+APPLIANCE_DATA = {name: col.tolist() for name, col in decode_columns(read_bundle()).items()}
+
+
+def legacy_analyze_efficiency(category, hours_per_day, electricity_rate):
+    # Reproduces the pre-catalog implementation for comparison
+    df = pd.DataFrame(APPLIANCE_DATA)
+    df["CO2_Factor"] = 0.82
+    df["Old_CO2(kg/hr)"] = (df["Old_Energy(W)"] / 1000) * df["CO2_Factor"]
+    df["Modern_CO2(kg/hr)"] = (df["Modern_Energy(W)"] / 1000) * df["CO2_Factor"]
+    df["Updated_CO2(kg/hr)"] = (df["Updated_Energy(W)"] / 1000) * df["CO2_Factor"]
+    row = df[df["Category"] == category].iloc[0]
+
+    energy_diff = row["Old_Energy(W)"] - row["Updated_Energy(W)"]
+    co2_diff = row["Old_CO2(kg/hr)"] - row["Updated_CO2(kg/hr)"]
+    eff_gain = row["Updated_Eff(%)"] - row["Old_Eff(%)"]
+
+    annual_hours = hours_per_day * 365
+    annual_energy_saved = (energy_diff / 1000) * annual_hours
+    return {
+        "category": category,
+        "old": row["Old_Component"],
+        "modern": row["Modern_Component"],
+        "updated": row["Updated_Component"],
+        "energy_diff": energy_diff,
+        "co2_diff": co2_diff,
+        "eff_gain": eff_gain,
+        "annual_energy_saved": annual_energy_saved,
+        "annual_co2_saved": co2_diff * annual_hours,
+        "annual_cost_saved": annual_energy_saved * electricity_rate,
+        "old_row": row,
+        "components": get_component_breakdown(category),
+    }
+
+
+def per_call_us(fn, number):
+    best = min(timeit.repeat(fn, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main():
+    get_catalog()  # built once per process; excluded from per-call cost
+    args = ("Refrigerator", 6, 7)
+
+    legacy = per_call_us(lambda: legacy_analyze_efficiency(*args), 200)
+    current = per_call_us(lambda: analyze_efficiency(*args), 2000)
+
+    print(f"{'path':<28}{'µs/call':>12}")
+    print(f"{'legacy (DataFrame rebuild)':<28}{legacy:>12.1f}")
+    print(f"{'catalog lookup':<28}{current:>12.1f}")
+    print(f"speedup: {legacy / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
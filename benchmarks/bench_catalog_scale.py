@@ -0,0 +1,84 @@
+# ======================================================
+# bench_catalog_scale.py — Catalog open time and RSS vs. catalog size
+# Writes synthetic bundles with N appliance model rows (8 categories) and
+# opens each in a fresh process: memory-mapped bundle vs. building the
+# same rows as an in-memory DataFrame (the old dict-literal approach).
+# Run: python benchmarks/bench_catalog_scale.py [rows ...]
+# ======================================================
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+sys.path.insert(0, APP_DIR)
+
+import numpy as np
+
+
+def rss_mb():
+    with open("/proc/self/statm") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def make_bundle(path, rows):
+    from catalog import get_catalog
+    from catalog_store import decode_columns, read_bundle, write_bundle
+
+    base = get_catalog()
+    source = decode_columns(read_bundle())
+    reps = -(-rows // len(base))
+    data = {}
+    for name, col in source.items():
+        tiled = np.tile(np.asarray(col), reps)[:rows]
+        if name.endswith("_Component"):
+            # Distinct model names so the string table grows with the catalog
+            tiled = np.array([f"{v} #{i // len(base)}" for i, v in enumerate(tiled.tolist())], dtype=object)
+        data[name] = tiled
+    components = {c: base.components(c) for c in base.categories}
+    write_bundle(path, data, components, f"synthetic-{rows}")
+
+
+def open_bundle(mode, path):
+    import pandas  # noqa: F401  (import cost is not part of either path)
+    import catalog
+    from catalog import load_catalog
+    from model import analyze_efficiency
+
+    rss0 = rss_mb()
+    t0 = time.perf_counter()
+    if mode == "mmap":
+        catalog._CATALOG = load_catalog(path)
+        analyze_efficiency("Fan", 6, 7)
+    else:
+        import pandas as pd
+        from catalog_store import decode_columns, read_bundle
+
+        data = {name: col.tolist() for name, col in decode_columns(read_bundle(path)).items()}
+        t0, rss0 = time.perf_counter(), rss_mb()  # literal data already "in source"
+        df = pd.DataFrame(data)
+        df[df["Category"] == "Fan"].iloc[0]
+    print(f"{(time.perf_counter() - t0) * 1000:.1f} {rss_mb() - rss0:.1f}")
+
+
+def main(sizes):
+    print(f"{'rows':>10}{'mmap ms':>10}{'mmap MB':>10}{'frame ms':>10}{'frame MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = os.path.join(tmp, f"catalog_{rows}")
+            make_bundle(path, rows)
+            results = []
+            for mode in ("mmap", "frame"):
+                out = subprocess.run([sys.executable, __file__, "--open", mode, path],
+                                     capture_output=True, text=True, check=True).stdout.split()
+                results += [float(v) for v in out]
+            print(f"{rows:>10,}" + "".join(f"{v:>10.1f}" for v in results))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--open":
+        open_bundle(sys.argv[2], sys.argv[3])
+    else:
+        main([int(a) for a in sys.argv[1:]] or [8, 10_000, 100_000, 1_000_000])
@@ -0,0 +1,95 @@
+# ======================================================
+# bench_charts.py — Rerun CPU time and RSS for chart rendering
+# legacy:   fresh pyplot figures every rerun, never closed (old app.py)
+# renderer: charts.ChartRenderer with persistent, reused figures
+# Each mode runs in its own subprocess so RSS numbers are independent.
+# Run: python benchmarks/bench_charts.py [reruns]
+# ======================================================
+
+import os
+import subprocess
+import sys
+import time
+import warnings
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+sys.path.insert(0, APP_DIR)
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def legacy_rerun(row, category):
+    import io
+    import matplotlib.pyplot as plt
+    from charts import BAR_CHARTS, RADAR_METRICS, RADAR_STYLES, TIER_LABELS, TIERS, radar_values
+    import numpy as np
+
+    for title, suffix, colors in BAR_CHARTS.values():
+        fig, ax = plt.subplots(figsize=(3.5, 2.5))
+        ax.bar(TIER_LABELS, [row[f"{t}_{suffix}"] for t in TIERS], color=colors)
+        ax.set_title(title)
+        fig.savefig(io.BytesIO(), format="png", bbox_inches="tight", dpi=200)
+
+    angles = np.linspace(0, 2*np.pi, len(RADAR_METRICS), endpoint=False).tolist()
+    angles += angles[:1]
+    fig = plt.figure(figsize=(5, 5))
+    ax = plt.subplot(111, polar=True)
+    for tier, label, color in RADAR_STYLES:
+        vals = radar_values(row, tier)
+        ax.plot(angles, vals, f"{color}-", linewidth=2, label=label)
+        ax.fill(angles, vals, color, alpha=0.25)
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(RADAR_METRICS)
+    ax.set_title(f"{category} – Multi-Factor Radar", color="#1B5E20", fontsize=11)
+    ax.legend(loc="upper right", bbox_to_anchor=(1.3, 1.1))
+    fig.savefig(io.BytesIO(), format="png", bbox_inches="tight", dpi=200)
+
+
+def renderer_rerun(row, category):
+    from charts import BAR_CHARTS, get_renderer
+
+    renderer = get_renderer()
+    for kind in BAR_CHARTS:
+        renderer.render_png(kind, row, category)
+    renderer.render_png("radar", row, category)
+
+
+def run_mode(mode, reruns):
+    import matplotlib
+    matplotlib.use("Agg")
+    warnings.filterwarnings("ignore")
+    from catalog import get_catalog
+
+    catalog = get_catalog()
+    rows = [(catalog.row(c), c) for c in catalog.categories]
+    rerun = legacy_rerun if mode == "legacy" else renderer_rerun
+    rerun(*rows[0])  # import / font cache warm-up
+
+    rss_start = rss_mb()
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for i in range(reruns):
+        rerun(*rows[i % len(rows)])
+    cpu = time.process_time() - cpu0
+    wall = time.perf_counter() - wall0
+    print(f"{mode:<10}{reruns:>8}{cpu / reruns * 1000:>14.2f}{wall / reruns * 1000:>14.2f}"
+          f"{rss_start:>12.1f}{rss_mb():>12.1f}")
+
+
+def main(reruns=1000):
+    print(f"{'mode':<10}{'reruns':>8}{'cpu ms/run':>14}{'wall ms/run':>14}{'RSS0 MB':>12}{'RSS1 MB':>12}")
+    for mode in ("legacy", "renderer"):
+        subprocess.run([sys.executable, __file__, "--mode", mode, str(reruns)], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--mode":
+        run_mode(sys.argv[2], int(sys.argv[3]))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,38 @@
+# ======================================================
+# bench_co2.py — Vectorized CO₂ kernel vs. looping calculate_co2
+# Run: python benchmarks/bench_co2.py [n ...]
+# ======================================================
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import numpy as np
+
+from utils import calculate_co2, co2_from_watts
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(sizes):
+    print(f"{'n':>12}{'loop s':>10}{'kernel s':>10}{'Mrows/s':>10}{'speedup':>10}  identical")
+    for n in sizes:
+        watts = np.random.default_rng(0).uniform(0, 5000, n)
+        values = watts.tolist()
+        loop = best_of(lambda: [calculate_co2(w) for w in values], repeat=1)
+        kernel = best_of(lambda: co2_from_watts(watts, decimals=3))
+        same = np.array_equal(np.array([calculate_co2(w) for w in values]), co2_from_watts(watts, decimals=3))
+        print(f"{n:>12,}{loop:>10.3f}{kernel:>10.4f}{n / kernel / 1e6:>10.1f}{loop / kernel:>9.0f}x  {same}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 1_000_000, 10_000_000])
@@ -0,0 +1,91 @@
+# ======================================================
+# bench_components.py — Component store memory and table-build time
+# Builds a synthetic catalog with N categories (12 attributes per tier drawn
+# from a small shared vocabulary) and compares the nested-dict breakdown +
+# set-union table build with the coded ComponentTable store.
+# Build times start from a freshly opened catalog, including string decoding.
+# Run: python benchmarks/bench_components.py [categories ...]
+# ======================================================
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import numpy as np
+
+from catalog import load_catalog
+from catalog_store import TIERS, write_bundle
+
+ATTRIBUTES = [f"Attribute {i}" for i in range(16)]
+VALUES = ["BLDC", "IoT", "High", "Low", "Manual", "Smart", "Inverter", "LED", "AI", "Sensor"]
+
+
+def synthetic_components(n_categories, seed=0):
+    rng = np.random.default_rng(seed)
+    components = {}
+    for c in range(n_categories):
+        components[f"Category {c}"] = {
+            tier: {ATTRIBUTES[a]: f"{VALUES[v]} {tier}"
+                   for a, v in zip(rng.choice(16, 12, replace=False).tolist(), rng.integers(0, 10, 12).tolist())}
+            for tier in TIERS
+        }
+    return components
+
+
+def legacy_table(components):
+    # The previous cached_component_table body, minus the DataFrame
+    all_keys = set(components["Old"].keys()) | set(components["Modern"].keys()) | set(components["Updated"].keys())
+    return {
+        "Component": list(all_keys),
+        "Legacy": [components["Old"].get(k, "") for k in all_keys],
+        "Modern": [components["Modern"].get(k, "") for k in all_keys],
+        "Updated (Self-Upgrading)": [components["Updated"].get(k, "") for k in all_keys],
+    }
+
+
+def measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def main(sizes):
+    print(f"{'categories':>11}{'dict B/entry':>14}{'store B/entry':>15}{'legacy build s':>16}{'store build s':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = os.path.join(tmp, f"components_{n}")
+            components = synthetic_components(n)
+            names = list(components)
+            write_bundle(path, {"Category": names, "Old_Energy(W)": np.zeros(n)}, components, "synthetic")
+            catalog = load_catalog(path)
+            entries = sum(len(t) for tiers in components.values() for t in tiers.values())
+
+            # Memory: materialized nested dicts vs. every category's coded table
+            _, _, dict_bytes = measure(lambda: [catalog.components(c) for c in names])
+            _, _, store_bytes = measure(lambda: [catalog.component_table(c) for c in names])
+
+            fresh = load_catalog(path)
+            t0 = time.perf_counter()
+            for c in names:
+                legacy_table(fresh.components(c))
+            legacy = time.perf_counter() - t0
+            fresh = load_catalog(path)
+            t0 = time.perf_counter()
+            for c in names:
+                fresh.component_table(c).to_dict()
+            store = time.perf_counter() - t0
+
+            print(f"{n:>11,}{dict_bytes / entries:>14.1f}{store_bytes / entries:>15.1f}"
+                  f"{legacy:>16.3f}{store:>15.3f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 50_000])
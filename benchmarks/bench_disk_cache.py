@@ -0,0 +1,60 @@
+# ======================================================
+# bench_disk_cache.py — Cold process start with / without the persistent cache
+# Each run is a fresh interpreter that renders every category's summary and
+# charts plus the portfolio chart, as a restarted dashboard replica would.
+# "cold" uses an empty cache file, "warm" reuses the file the cold run filled,
+# "off" sets ECOFUSION_DISK_CACHE=0.
+# Run: python benchmarks/bench_disk_cache.py [--runs 3]
+# ======================================================
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+
+WORKLOAD = """
+from cache import cached_chart_png, cached_portfolio_png, cached_summary
+from catalog import get_catalog
+for category in get_catalog().categories:
+    cached_summary(category, 6, 7)
+    for kind in ("co2", "energy", "efficiency", "radar"):
+        cached_chart_png(category, kind)
+cached_portfolio_png()
+"""
+
+
+def run(env):
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", WORKLOAD], cwd=APP_DIR, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = dict(os.environ, ECOFUSION_CACHE_PATH=os.path.join(tmp, "results.sqlite"))
+        cold, warm, off = [], [], []
+        for i in range(args.runs):
+            for suffix in ("", "-wal", "-shm"):
+                path = base["ECOFUSION_CACHE_PATH"] + suffix
+                if os.path.exists(path):
+                    os.remove(path)
+            cold.append(run(base))
+            warm.append(run(base))
+            off.append(run(dict(base, ECOFUSION_DISK_CACHE="0")))
+
+    print(f"{'disk cache off':<20}{min(off) * 1000:>9.0f} ms")
+    print(f"{'cold (empty file)':<20}{min(cold) * 1000:>9.0f} ms")
+    print(f"{'warm (restart)':<20}{min(warm) * 1000:>9.0f} ms   {min(off) / min(warm):.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# ======================================================
+# bench_fleet.py — Fleet simulation households/sec vs. worker count
+# Run: python benchmarks/bench_fleet.py [--households 4000000] [--workers 1,2,4,8]
+# ======================================================
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from fleet import DEFAULT_SHARD_ROWS, simulate_fleet, synthetic_fleet
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fleet simulation scaling benchmark")
+    parser.add_argument("--households", type=int, default=4_000_000)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--shard-rows", type=int, default=DEFAULT_SHARD_ROWS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    inventory = synthetic_fleet(args.households)
+    rows = len(inventory["household_id"])
+    print(f"{args.households:,} households, {rows:,} appliance rows, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'seconds':>10}{'households/s':>16}{'speedup':>10}")
+
+    base = None
+    for workers in (int(w) for w in args.workers.split(",")):
+        best = min(_timed(inventory, workers, args.shard_rows) for _ in range(args.repeat))
+        base = base or best
+        print(f"{workers:>8}{best:>10.3f}{args.households / best:>16,.0f}{base / best:>10.2f}")
+
+
+def _timed(inventory, workers, shard_rows):
+    t0 = time.perf_counter()
+    simulate_fleet(inventory, workers=workers, shard_rows=shard_rows)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    main()
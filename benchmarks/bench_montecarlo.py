@@ -0,0 +1,45 @@
+# ======================================================
+# bench_montecarlo.py — Monte Carlo samples/sec vs. worker count
+# Also checks that every worker count yields bit-identical percentiles.
+# Run: python benchmarks/bench_montecarlo.py [--samples 10000000] [--workers 1,2,4,8]
+# ======================================================
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import numpy as np
+
+from montecarlo import Triangular, simulate_uncertainty
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo scaling benchmark")
+    parser.add_argument("--samples", type=int, default=10_000_000)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    hours, rate = Triangular(3, 6, 9), Triangular(5, 7, 9)
+    print(f"{args.samples:,} samples × every category, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'seconds':>10}{'samples/s':>16}{'speedup':>10}{'identical':>11}")
+
+    base = reference = None
+    for workers in (int(w) for w in args.workers.split(",")):
+        best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            result = simulate_uncertainty(hours, rate, samples=args.samples, workers=workers)
+            best = min(best, time.perf_counter() - t0)
+        reference = reference or result
+        same = all(np.array_equal(reference[m][k], result[m][k])
+                   for m in ("annual_cost_saved", "annual_co2_saved", "payback_years") for k in result[m])
+        base = base or best
+        print(f"{workers:>8}{best:>10.3f}{args.samples / best:>16,.0f}{base / best:>10.2f}{str(same):>11}")
+
+
+if __name__ == "__main__":
+    main()
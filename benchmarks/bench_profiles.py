@@ -0,0 +1,68 @@
+# ======================================================
+# bench_profiles.py — Annual cost / CO₂ over profile × tariff combinations
+# Compares the HourlyMatrix dot-product path with an hour-by-hour Python loop
+# (timed on a small sample and extrapolated).
+# Run: python benchmarks/bench_profiles.py [--profiles 2000] [--tariffs 8]
+# ======================================================
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import numpy as np
+
+from profiles import HourlyMatrix, annual_savings, flat_tariff, tou_tariff, window_profile
+
+
+def build(n_profiles, n_tariffs, seed=0):
+    rng = np.random.default_rng(seed)
+    profiles = window_profile(rng.integers(0, 24, n_profiles), rng.integers(1, 13, n_profiles),
+                              weekend_hours=rng.integers(1, 17, n_profiles))
+    tariffs = [tou_tariff([(0, 6, 3.5), (6, 18, 7.0), (18, 22, 11.0), (22, 24, 7.0)], weekend_rate=5.0)]
+    tariffs.append(flat_tariff(rng.uniform(3, 15, n_tariffs - 1)))
+    return profiles, HourlyMatrix.concat(tariffs)
+
+
+def loop_cost(kw, profile, tariff):
+    total = 0.0
+    for h in range(len(profile)):
+        total += kw * profile[h] * tariff[h]
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hourly profile × tariff benchmark")
+    parser.add_argument("--profiles", type=int, default=2000)
+    parser.add_argument("--tariffs", type=int, default=8)
+    args = parser.parse_args()
+
+    profiles, tariffs = build(args.profiles, args.tariffs)
+    combos = len(profiles) * len(tariffs)
+
+    t0 = time.perf_counter()
+    result = annual_savings(profiles, tariffs)
+    cold = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    annual_savings(profiles, tariffs)
+    warm = time.perf_counter() - t0
+
+    sample = 20
+    p, t = profiles.values[:sample].tolist(), tariffs.values[0].tolist()
+    t0 = time.perf_counter()
+    for row in p:
+        loop_cost(1.0, row, t)
+    loop = (time.perf_counter() - t0) / sample * combos
+
+    n_categories = result["annual_cost_saved"].shape[0]
+    print(f"{len(profiles):,} profiles × {len(tariffs)} tariffs = {combos:,} combinations "
+          f"(× {n_categories} categories)")
+    print(f"{'matrix (cold)':<18}{cold * 1000:>10.1f} ms")
+    print(f"{'matrix (cached)':<18}{warm * 1000:>10.1f} ms")
+    print(f"{'python loop (est)':<18}{loop * 1000:>10.1f} ms   {loop / cold:,.0f}× slower")
+
+
+if __name__ == "__main__":
+    main()
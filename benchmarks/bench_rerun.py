@@ -0,0 +1,87 @@
+# ======================================================
+# bench_rerun.py — Cold vs warm dashboard rerun latency
+# Drives app/app.py headlessly through Streamlit's AppTest.
+#   cold       in-memory and persistent caches empty
+#   disk-warm  in-memory caches empty, persistent cache populated (restart)
+#   warm       every layer populated
+# The persistent cache lives in a temporary file, never ~/.cache/ecofusion.
+# Run: python benchmarks/bench_rerun.py [reruns]
+# ======================================================
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+sys.path.insert(0, APP_DIR)
+os.environ["ECOFUSION_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(), "results.sqlite")
+
+from streamlit.testing.v1 import AppTest
+
+from cache import clear_caches
+from disk_cache import get_disk_cache
+
+APP_PATH = os.path.join(APP_DIR, "app.py")
+
+
+def timed_run(at):
+    t0 = time.perf_counter()
+    at.run(timeout=60)
+    elapsed = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed * 1000
+
+
+def clear_all_caches():
+    clear_caches()
+    disk = get_disk_cache()
+    if disk is not None:
+        disk.clear()
+
+
+def main(reruns=20):
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    cold = []
+    disk_warm = []
+    warm = []
+
+    clear_all_caches()
+    timed_run(at)  # first script run also pays module import cost
+    categories = at.sidebar.selectbox[0].options
+
+    for category in categories:
+        clear_all_caches()
+        at.sidebar.selectbox[0].set_value(category)
+        cold.append(timed_run(at))
+
+    def prime():
+        for category in categories:  # run every selection once
+            at.sidebar.selectbox[0].set_value(category)
+            timed_run(at)
+
+    prime()  # every selection is now on disk
+    for category in categories:
+        clear_caches()
+        at.sidebar.selectbox[0].set_value(category)
+        disk_warm.append(timed_run(at))
+
+    prime()
+    for _ in range(reruns):
+        for category in categories:
+            at.sidebar.selectbox[0].set_value(category)
+            warm.append(timed_run(at))
+
+    def report(name, samples):
+        print(f"{name:<10} n={len(samples):<5} median={statistics.median(samples):8.1f} ms  "
+              f"max={max(samples):8.1f} ms")
+
+    report("cold", cold)
+    report("disk-warm", disk_warm)
+    report("warm", warm)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
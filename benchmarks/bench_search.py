@@ -0,0 +1,112 @@
+# ======================================================
+# bench_search.py — Search index vs. pandas filtering
+# Builds a synthetic catalog bundle (default 200,000 models in 10,000
+# categories), then times each query through CatalogIndex and through the
+# naive DataFrame boolean-mask equivalent, checking both return the same rows.
+# Run: python benchmarks/bench_search.py [--rows 200000] [--categories 10000]
+# ======================================================
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import numpy as np
+import pandas as pd
+
+from catalog import load_catalog
+from catalog_store import TIERS, write_bundle
+from search import CatalogIndex, has_component, where
+
+ATTRIBUTES = ["Motor", "Refrigerant", "Compressor", "Sensors", "Connectivity", "Display",
+              "Power Supply", "Body", "Noise", "Efficiency", "Controller", "Cooling"]
+VALUES = ["BLDC", "IoT", "High", "R290", "R600a", "R32", "Inverter", "LED", "AI", "Smart", "Solar", "Manual"]
+
+
+def build(path, rows, n_categories, seed=0):
+    rng = np.random.default_rng(seed)
+    category = np.array([f"Category {c}" for c in range(n_categories)], dtype=object)[
+        np.sort(rng.integers(0, n_categories, rows))]
+    data = {"Category": category}
+    for tier, scale in zip(TIERS, (1.0, 0.7, 0.45)):
+        data[f"{tier}_Component"] = np.array([f"{tier} model {i}" for i in range(rows)], dtype=object)
+    for tier, scale in zip(TIERS, (1.0, 0.7, 0.45)):
+        data[f"{tier}_Energy(W)"] = (rng.uniform(20, 2500, rows) * scale).round(1)
+    for tier, base in zip(TIERS, (60, 75, 88)):
+        data[f"{tier}_Eff(%)"] = rng.integers(base - 10, base + 10, rows)
+    for tier, base in zip(TIERS, (300, 450, 700)):
+        data[f"{tier}_Cost($)"] = rng.integers(base // 3, base * 3, rows)
+
+    components = {}
+    for name in dict.fromkeys(category.tolist()):
+        components[name] = {
+            tier: {ATTRIBUTES[a]: f"{VALUES[v]} {rng.integers(0, 50)}"
+                   for a, v in zip(rng.choice(12, 8, replace=False).tolist(), rng.integers(0, 12, 8).tolist())}
+            for tier in TIERS
+        }
+    write_bundle(path, data, components, "synthetic-search")
+    long = pd.DataFrame([(c, t, k, v) for c, tiers in components.items() for t, kv in tiers.items()
+                         for k, v in kv.items()], columns=["Category", "Tier", "Attribute", "Value"])
+    return long
+
+
+def best_ms(fn, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search index vs pandas filter benchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--categories", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        long = build(tmp, args.rows, args.categories)
+        catalog = load_catalog(tmp)
+        df = catalog.to_frame()
+        index = CatalogIndex(catalog)
+
+        def components_pandas(tier, attribute, contains):
+            hit = long[(long["Tier"] == tier) & (long["Attribute"] == attribute)
+                       & long["Value"].str.contains(contains, regex=False)]
+            return np.flatnonzero(df["Category"].isin(hit["Category"]).to_numpy())
+
+        queries = {
+            "energy < 100 W & cost < 500": (
+                lambda: index.query(where("Updated_Energy(W)", "<", 100), where("Updated_Cost($)", "<", 500)),
+                lambda: np.flatnonzero(((df["Updated_Energy(W)"] < 100) & (df["Updated_Cost($)"] < 500)).to_numpy())),
+            "eff between 95 and 97": (
+                lambda: index.query(where("Updated_Eff(%)", "between", (95, 97))),
+                lambda: np.flatnonzero(df["Updated_Eff(%)"].between(95, 97).to_numpy())),
+            "Updated Refrigerant ~ 'R290 1'": (
+                lambda: index.query(has_component("Updated", "Refrigerant", contains="R290 1")),
+                lambda: components_pandas("Updated", "Refrigerant", "R290 1")),
+            "R290 & energy < 200 W": (
+                lambda: index.query(has_component("Updated", "Refrigerant", contains="R290"),
+                                    where("Updated_Energy(W)", "<", 200)),
+                lambda: np.intersect1d(components_pandas("Updated", "Refrigerant", "R290"),
+                                       np.flatnonzero((df["Updated_Energy(W)"] < 200).to_numpy()))),
+        }
+
+        t0 = time.perf_counter()
+        for indexed, _ in queries.values():  # builds the sub-indexes
+            indexed()
+        print(f"{args.rows:,} models / {args.categories:,} categories; index build {time.perf_counter() - t0:.2f}s")
+        print(f"{'query':<32}{'rows':>8}{'index ms':>10}{'pandas ms':>11}{'speedup':>9}")
+        for name, (indexed, naive) in queries.items():
+            index_ms, rows = best_ms(indexed)
+            pandas_ms, expected = best_ms(naive, repeat=3)
+            assert np.array_equal(rows, expected), name
+            print(f"{name:<32}{len(rows):>8,}{index_ms:>10.3f}{pandas_ms:>11.2f}{pandas_ms / index_ms:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
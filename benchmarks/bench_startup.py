@@ -0,0 +1,77 @@
+# ======================================================
+# bench_startup.py — Cold-import regression guard for the analysis core
+# Spawns fresh interpreters with `python -X importtime` and reports the
+# cumulative import time of each entry module, plus any heavy dependency
+# it pulled in that it should not have. Exits non-zero on regression.
+# Run: python benchmarks/bench_startup.py [--runs 7] [--scale 1.0]
+# ======================================================
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+
+HEAVY = ("pandas", "matplotlib", "streamlit", "sklearn", "joblib")
+
+# module -> (budget in ms, heavy modules it may import)
+BUDGETS = {
+    "utils": (20, ()),
+    "catalog": (150, ()),
+    "model": (150, ()),
+    "api": (200, ()),
+    "charts": (150, ()),
+    "telemetry": (600, ("pandas",)),
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\| (\S+)")
+
+
+def measure(module):
+    """Return (cumulative µs for ``module``, set of top-level modules imported)."""
+    probe = f"import {module}, sys; print(','.join(sorted(sys.modules)))"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", probe],
+                          cwd=APP_DIR, capture_output=True, text=True, check=True)
+    cumulative = None
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match and match.group(3) == module:
+            cumulative = int(match.group(2))
+    loaded = {name.split(".")[0] for name in proc.stdout.strip().split(",")}
+    return cumulative, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiply budgets, e.g. 2.0 on slow CI machines")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<12}{'median ms':>11}{'budget ms':>11}  heavy deps")
+    for module, (budget, allowed) in BUDGETS.items():
+        samples, loaded = [], set()
+        for _ in range(args.runs):
+            us, loaded = measure(module)
+            samples.append(us / 1000)
+        median = statistics.median(samples)
+        heavy = sorted(m for m in HEAVY if m in loaded)
+        print(f"{module:<12}{median:>11.1f}{budget * args.scale:>11.0f}  {', '.join(heavy) or '-'}")
+
+        if median > budget * args.scale:
+            failures.append(f"{module}: {median:.1f} ms exceeds {budget * args.scale:.0f} ms")
+        unexpected = [m for m in heavy if m not in allowed]
+        if unexpected:
+            failures.append(f"{module}: eagerly imports {', '.join(unexpected)}")
+
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
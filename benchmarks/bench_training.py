@@ -0,0 +1,85 @@
+# ======================================================
+# bench_training.py — Out-of-core retraining throughput and peak memory
+# 1. Kernel: RegressionStats.update over --kernel-rows rows (default 100M)
+#    fed as in-memory chunks, i.e. the fit cost without CSV parsing.
+# 2. End to end: fit_stream over synthetic telemetry CSVs of growing size,
+#    each in a fresh process so its peak RSS is measured alone. Peak memory
+#    should stay flat while rows grow; the slowest rows/s is extrapolated to
+#    100M rows.
+# Run: python benchmarks/bench_training.py [--csv-rows 1000000,4000000] [--kernel-rows 100000000]
+# ======================================================
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+import numpy as np
+import pandas as pd
+
+from telemetry import FEATURES
+from training import DEFAULT_CHUNKSIZE, TARGET, RegressionStats, fit_stream
+
+COEF = np.array([0.0034, 0.2217, -0.0012])
+INTERCEPT = -0.7044
+
+
+def synthetic_block(rows, rng):
+    X = np.column_stack((rng.normal(230, 5, rows), rng.uniform(0.1, 10, rows), rng.normal(30, 4, rows)))
+    y = X @ COEF + INTERCEPT + rng.normal(0, 0.005, rows)
+    return np.column_stack((X, y))
+
+
+def write_csv(path, rows, block_rows=1_000_000):
+    rng = np.random.default_rng(0)
+    for start in range(0, rows, block_rows):
+        block = synthetic_block(min(block_rows, rows - start), rng)
+        pd.DataFrame(block, columns=FEATURES + [TARGET]).to_csv(
+            path, mode="w" if start == 0 else "a", header=(start == 0), index=False, float_format="%.6f")
+
+
+def _fit_csv(path, chunksize):
+    stats, report = fit_stream([path], chunksize)
+    coef, _ = stats.solve()
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return report, peak_kib / 1024, float(np.abs(coef - COEF).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Retraining throughput / memory benchmark")
+    parser.add_argument("--csv-rows", default="1000000,4000000")
+    parser.add_argument("--kernel-rows", type=int, default=100_000_000)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args()
+
+    block = synthetic_block(args.chunksize, np.random.default_rng(1))
+    stats = RegressionStats(len(FEATURES))
+    t0 = time.perf_counter()
+    for _ in range(args.kernel_rows // args.chunksize):
+        stats.update(block)
+    seconds = time.perf_counter() - t0
+    print(f"kernel: {stats.n:,} rows in {seconds:.2f}s ({stats.n / seconds:,.0f} rows/s)")
+
+    print(f"\n{'csv rows':>12}{'seconds':>10}{'rows/s':>14}{'peak RSS':>12}{'coef err':>12}")
+    ctx = multiprocessing.get_context("spawn")
+    slowest = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in (int(r) for r in args.csv_rows.split(",")):
+            path = os.path.join(tmp, f"telemetry-{rows}.csv")
+            write_csv(path, rows)
+            with ctx.Pool(1) as pool:
+                report, peak_mib, error = pool.apply(_fit_csv, (path, args.chunksize))
+            os.remove(path)
+            slowest = min(slowest or report["rows_per_sec"], report["rows_per_sec"])
+            print(f"{rows:>12,}{report['seconds']:>10.2f}{report['rows_per_sec']:>14,.0f}"
+                  f"{peak_mib:>9.0f} MiB{error:>12.1e}")
+    print(f"\nestimated 100M-row CSV fit: {1e8 / slowest / 60:.1f} min")
+
+
+if __name__ == "__main__":
+    main()
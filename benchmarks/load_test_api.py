@@ -0,0 +1,133 @@
+# ======================================================
+# load_test_api.py — Latency / throughput load test for app/api.py
+# Starts the API in a subprocess (unless --url is given) and drives it with
+# N concurrent keep-alive connections.
+# Run: python benchmarks/load_test_api.py --requests 20000 --concurrency 64
+# ======================================================
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode, urlsplit
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+sys.path.insert(0, APP_DIR)
+
+from catalog import get_catalog
+
+
+def build_requests(kind, n, batch_size):
+    rng = random.Random(0)
+    categories = get_catalog().categories
+    out = []
+    for _ in range(n):
+        if kind == "analyze":
+            query = urlencode({"category": rng.choice(categories),
+                               "hours_per_day": rng.randint(1, 24),
+                               "electricity_rate": rng.randint(3, 15)})
+            out.append(("GET", f"/analyze?{query}", b""))
+        elif kind == "components":
+            out.append(("GET", f"/components?{urlencode({'category': rng.choice(categories)})}", b""))
+        else:
+            body = json.dumps({
+                "category": [rng.choice(categories) for _ in range(batch_size)],
+                "hours_per_day": [rng.randint(1, 24) for _ in range(batch_size)],
+                "electricity_rate": [rng.randint(3, 15) for _ in range(batch_size)],
+            }).encode()
+            out.append(("POST", "/analyze/batch", body))
+    return out
+
+
+async def worker(host, port, queue, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                method, target, body = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            request = (f"{method} {target} HTTP/1.1\r\nHost: {host}\r\n"
+                       f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+            t0 = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - t0)
+            if b" 200 " not in status:
+                raise RuntimeError(f"{target}: {status.decode().strip()}")
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, requests, concurrency):
+    queue = asyncio.Queue()
+    for req in requests:
+        queue.put_nowait(req)
+    latencies = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, queue, latencies) for _ in range(concurrency)))
+    return latencies, time.perf_counter() - t0
+
+
+def wait_for_port(host, port, timeout=15):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"API did not start on {host}:{port}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="existing server, e.g. http://127.0.0.1:8765")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--kinds", default="analyze,components,batch")
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            host, port = "127.0.0.1", s.getsockname()[1]
+        proc = subprocess.Popen([sys.executable, os.path.join(APP_DIR, "api.py"), "--port", str(port)],
+                                stdout=subprocess.DEVNULL)
+    try:
+        wait_for_port(host, port)
+        print(f"{'endpoint':<12}{'requests':>10}{'req/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+        for kind in args.kinds.split(","):
+            n = args.requests if kind != "batch" else max(1, args.requests // 10)
+            latencies, elapsed = asyncio.run(
+                run_load(host, port, build_requests(kind, n, args.batch_size), args.concurrency))
+            q = statistics.quantiles(latencies, n=100, method="inclusive")
+            print(f"{kind:<12}{n:>10}{n / elapsed:>12,.0f}{q[49] * 1000:>10.2f}{q[98] * 1000:>10.2f}")
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# ======================================================
+# load_test_dashboard.py — Concurrent session load test for app/app.py
+# Starts `streamlit run app/app.py` in a subprocess (unless --url is given)
+# and drives it with N simulated browser sessions over Streamlit's websocket
+# protocol. All sessions connect at once; each then reruns the script with one
+# widget change at a time, picked from a small set of category / hours /
+# region / view combinations, like users clicking around the dashboard.
+# Reports rerun throughput, tail latency and how many charts were deferred by
+# render-pool backpressure.
+#
+# Needs the websockets client (pip install websockets), which the dashboard
+# itself does not depend on; without it the load test is skipped.
+#
+# Run: python benchmarks/load_test_dashboard.py --sessions 32 --reruns 20
+#      python benchmarks/load_test_dashboard.py --cold           (no persistent cache)
+#      python benchmarks/load_test_dashboard.py --no-shared      (shared layer disabled)
+#      python benchmarks/load_test_dashboard.py --url http://host:8501
+# ======================================================
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+try:
+    import websockets
+except ImportError:
+    print("load_test_dashboard skipped (websockets not installed; pip install websockets)", file=sys.stderr)
+    sys.exit(0)
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+APP_PATH = os.path.join(APP_DIR, "app.py")
+
+HOURS = (4.0, 6.0, 8.0)
+REGIONS = ("India (INR)", "United States (USD)", "United Kingdom (GBP)")
+VIEWS = ("Single Appliance", "Household Portfolio")
+WIDGETS = ("radio", "selectbox", "slider")
+
+
+class Session:
+    """One simulated browser tab: its widgets and the values the user picked."""
+
+    def __init__(self, ws, rng):
+        self.ws = ws
+        self.rng = rng
+        self.widgets = {}  # label -> widget proto from the last run
+        self.values = {}   # label -> value the user chose
+
+    async def rerun(self):
+        """Send a rerun with the current widget values; return (seconds, busy, error)."""
+        msg = BackMsg()
+        msg.rerun_script.SetInParent()
+        for label, value in self.values.items():
+            widget = self.widgets.get(label)
+            if widget is None:
+                continue
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget.id
+            if isinstance(value, float):
+                state.double_array_value.data[:] = [value]
+            else:
+                state.string_value = value
+        t0 = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        widgets, busy, error = {}, 0, None
+        while True:
+            fmsg = ForwardMsg()
+            fmsg.ParseFromString(await self.ws.recv())
+            kind = fmsg.WhichOneof("type")
+            if kind == "script_finished":
+                break
+            if kind != "delta" or fmsg.delta.WhichOneof("type") != "new_element":
+                continue
+            element = fmsg.delta.new_element
+            etype = element.WhichOneof("type")
+            if etype in WIDGETS:
+                widget = getattr(element, etype)
+                widgets[widget.label] = widget
+            elif etype == "alert" and "busy" in element.alert.body:
+                busy += 1
+            elif etype == "exception":
+                error = element.exception.message
+        self.widgets = widgets
+        return time.perf_counter() - t0, busy, error
+
+    def click(self):
+        """Change one widget, the way a user would between reruns."""
+        rng = self.rng
+        view = rng.choices(VIEWS, (0.8, 0.2))[0]
+        self.values["View"] = view
+        if view == VIEWS[0] and rng.random() < 0.5 and "Select Appliance Category" in self.widgets:
+            self.values["Select Appliance Category"] = rng.choice(
+                list(self.widgets["Select Appliance Category"].options))
+        elif rng.random() < 0.5:
+            self.values["Region"] = rng.choice(REGIONS)
+        else:
+            self.values["Average Usage Hours per Day"] = rng.choice(HOURS)
+
+
+async def run_session(url, seed, reruns, think, start, results):
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        session = Session(ws, random.Random(seed))
+        await start.wait()
+        await session.rerun()  # page load
+        for _ in range(reruns):
+            if think:
+                await asyncio.sleep(session.rng.expovariate(1 / think))
+            session.click()
+            results.append(await session.rerun())
+
+
+async def run_load(url, sessions, reruns, think, seed):
+    start = asyncio.Event()
+    results = []
+    tasks = [asyncio.create_task(run_session(url, seed + i, reruns, think, start, results))
+             for i in range(sessions)]
+    await asyncio.sleep(0.1)
+    t0 = time.perf_counter()
+    start.set()
+    await asyncio.gather(*tasks)
+    return results, time.perf_counter() - t0
+
+
+def wait_for_port(host, port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"dashboard did not start on {host}:{port}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent dashboard sessions load test")
+    parser.add_argument("--url", help="existing deployment, e.g. http://127.0.0.1:8501")
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--reruns", type=int, default=20, help="reruns per session after page load")
+    parser.add_argument("--think", type=float, default=0.0, help="mean seconds between a session's reruns")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cold", action="store_true", help="start the server with an empty persistent cache")
+    parser.add_argument("--no-shared", action="store_true", help="start the server with the shared layer disabled")
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            host, port = "127.0.0.1", s.getsockname()[1]
+        env = dict(os.environ)
+        if args.cold:
+            env["ECOFUSION_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(), "results.sqlite")
+        if args.no_shared:
+            env["ECOFUSION_SHARED"] = "0"
+        proc = subprocess.Popen([sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.headless", "true",
+                                 "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+                                env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(host, port)
+        results, elapsed = asyncio.run(
+            run_load(f"ws://{host}:{port}/_stcore/stream", args.sessions, args.reruns, args.think, args.seed))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    latencies = [seconds for seconds, _, _ in results]
+    busy = sum(b for _, b, _ in results)
+    errors = [e for _, _, e in results if e]
+    q = statistics.quantiles(latencies, n=100, method="inclusive")
+    print(f"{args.sessions} sessions × {args.reruns} reruns, server CPUs {os.cpu_count()}"
+          f"{' (cold cache)' if args.cold else ''}{' (shared layer off)' if args.no_shared else ''}")
+    print(f"{'reruns':>8}{'reruns/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+          f"{'busy':>6}{'errors':>8}")
+    print(f"{len(latencies):>8}{len(latencies) / elapsed:>10.1f}{q[49] * 1000:>10.1f}{q[94] * 1000:>10.1f}"
+          f"{q[98] * 1000:>10.1f}{max(latencies) * 1000:>10.1f}{busy:>6}{len(errors):>8}")
+    for error in errors[:3]:
+        print(f"script error: {error}", file=sys.stderr)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+# ======================================================
+# suite.py — EcoFusion 2.0 benchmark suite with saved baselines
+# Times every hot path of the analysis core, telemetry scoring and a
+# headless dashboard rerun, then optionally saves the numbers as a JSON
+# baseline or compares against one. Exits non-zero when a case is slower
+# than its baseline by more than --threshold.
+#
+# The reference baseline is committed as benchmarks/baseline.json; refresh it
+# with --save after an intentional performance change (note the machine in
+# the commit, since timings are only comparable on similar hardware).
+#
+# Run: python benchmarks/suite.py --compare            (against baseline.json)
+#      python benchmarks/suite.py --save               (rewrite baseline.json)
+#      python benchmarks/suite.py --compare other.json
+#      python benchmarks/suite.py -k analyze      (regex filter on case names)
+# ======================================================
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+sys.path.insert(0, APP_DIR)
+# Keep the dashboard case out of the developer's real persistent cache
+os.environ["ECOFUSION_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(), "results.sqlite")
+
+import numpy as np
+
+CASES = {}
+# Hours slider position carried across app_rerun calls
+_RERUN_STATE = {"hours": 1}
+
+
+def case(name):
+    """Register ``setup() -> callable`` as benchmark ``name``."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# ------------------------------------------------------
+# Cases
+# ------------------------------------------------------
+@case("load_dataset")
+def _load_dataset():
+    from model import load_dataset
+    return load_dataset
+
+
+@case("get_component_breakdown")
+def _component_breakdown():
+    from model import get_component_breakdown
+    return lambda: get_component_breakdown("Refrigerator")
+
+
+@case("analyze_efficiency")
+def _analyze():
+    from model import analyze_efficiency
+    return lambda: analyze_efficiency("Air Conditioner", 6, 7)
+
+
+@case("analyze_efficiency_batch[100k]")
+def _analyze_batch():
+    from catalog import get_catalog
+    from model import analyze_efficiency_batch
+
+    rng = np.random.default_rng(0)
+    n = 100_000
+    codes = rng.integers(0, len(get_catalog()), n)
+    hours = rng.integers(1, 25, n).astype(np.float64)
+    rates = rng.uniform(3, 15, n)
+    return lambda: analyze_efficiency_batch(codes, hours, rates)
+
+
+@case("analyze_batch[100k, all regions]")
+def _analyze_batch_regions():
+    from catalog import get_catalog
+    from model import analyze_efficiency_batch
+    from regions import REGIONS
+
+    rng = np.random.default_rng(0)
+    n = 100_000
+    codes = rng.integers(0, len(get_catalog()), n)
+    hours = rng.integers(1, 25, n).astype(np.float64)
+    regions = rng.choice(list(REGIONS), n)
+    return lambda: analyze_efficiency_batch(codes, hours, region=regions)
+
+
+@case("calculate_co2[1M]")
+def _calculate_co2():
+    from utils import calculate_co2
+
+    watts = np.random.default_rng(0).uniform(10, 3000, 1_000_000).tolist()
+    return lambda: [calculate_co2(w) for w in watts]
+
+
+@case("co2_from_watts[1M]")
+def _co2_kernel():
+    from utils import co2_from_watts
+
+    watts = np.random.default_rng(0).uniform(10, 3000, 1_000_000)
+    return lambda: co2_from_watts(watts, decimals=3)
+
+
+@case("telemetry_score_chunk[100k]")
+def _telemetry():
+    import pandas as pd
+    from telemetry import FEATURES, EnergyScorer, get_energy_model, score_chunk
+
+    rng = np.random.default_rng(0)
+    n = 100_000
+    chunk = pd.DataFrame({
+        FEATURES[0]: rng.normal(230, 5, n),
+        FEATURES[1]: rng.uniform(0.1, 10, n),
+        FEATURES[2]: rng.normal(30, 4, n),
+    })
+    scorer = EnergyScorer(get_energy_model())
+    return lambda: score_chunk(chunk.copy(), scorer)
+
+
+@case("anomaly_update[100k/10k devices]")
+def _anomaly():
+    from anomaly import ResidualMonitor
+
+    rng = np.random.default_rng(0)
+    n = 100_000
+    devices = rng.integers(0, 10_000, n)
+    residuals = rng.normal(0, 1, n)
+    monitor = ResidualMonitor(scorer=object())
+    return lambda: monitor.update(monitor.slots_of(devices), residuals)
+
+
+@case("montecarlo[1M, 1 worker]")
+def _montecarlo():
+    from montecarlo import Triangular, simulate_uncertainty
+
+    return lambda: simulate_uncertainty(Triangular(3, 6, 9), Triangular(5, 7, 9), samples=1_000_000, workers=1)
+
+
+@case("app_rerun[warm]")
+def _app_rerun():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(APP_DIR, "app.py"), default_timeout=60)
+    at.run()
+    sliders = at.sidebar.slider
+
+    def rerun():
+        # Move the hours slider so every rerun does real (incremental) work
+        _RERUN_STATE["hours"] = _RERUN_STATE["hours"] % 24 + 1
+        sliders[0].set_value(_RERUN_STATE["hours"])
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    return rerun
+
+
+# ------------------------------------------------------
+# Runner
+# ------------------------------------------------------
+def measure(fn, repeat, min_time):
+    """Per-call seconds: (min, median) over ``repeat`` autoranged samples."""
+    timer = timeit.Timer(fn)
+    number, total = timer.autorange()
+    if total < min_time:
+        number = max(1, int(number * min_time / total))
+    samples = [t / number for t in timer.repeat(repeat, number)]
+    return {"min": min(samples), "median": statistics.median(samples), "number": number, "repeat": repeat}
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run(pattern=None, repeat=5, min_time=0.2):
+    results = {}
+    for name, setup in CASES.items():
+        if pattern and not re.search(pattern, name):
+            continue
+        try:
+            fn = setup()
+        except ImportError as exc:
+            print(f"{name:<34}skipped ({exc.name or exc} not installed)")
+            continue
+        results[name] = measure(fn, repeat, min_time)
+        print(f"{name:<34}{_fmt(results[name]['median']):>12}  (min {_fmt(results[name]['min'])})")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print a comparison table; return the names of regressed cases."""
+    base = baseline["results"]
+    meta = baseline.get("environment", {})
+    print(f"\nvs. baseline {meta.get('commit') or '?'} ({meta.get('timestamp', '?')})")
+    print(f"{'case':<34}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    regressions = []
+    for name, result in results.items():
+        if name not in base:
+            print(f"{name:<34}{'-':>12}{_fmt(result['median']):>12}{'new':>8}")
+            continue
+        ratio = result["median"] / base[name]["median"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"{name:<34}{_fmt(base[name]['median']):>12}{_fmt(result['median']):>12}{ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def _fmt(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EcoFusion benchmark suite")
+    parser.add_argument("-k", dest="pattern", help="only run cases matching this regex")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per sample")
+    parser.add_argument("--save", metavar="PATH", nargs="?", const=BASELINE,
+                        help="write results as a baseline (default: benchmarks/baseline.json)")
+    parser.add_argument("--compare", metavar="PATH", nargs="?", const=BASELINE,
+                        help="compare against a saved baseline (default: benchmarks/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="median slowdown ratio that counts as a regression")
+    args = parser.parse_args()
+    if args.compare and not os.path.exists(args.compare):
+        parser.error(f"no baseline at {args.compare}; create one with --save")
+
+    results = run(args.pattern, args.repeat, args.min_time)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            regressions = compare(results, json.load(fh), args.threshold)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump({"environment": environment(), "results": results}, fh, indent=2)
+        print(f"\nbaseline written to {args.save}")
+
+    for name in regressions:
+        print(f"REGRESSION {name}", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
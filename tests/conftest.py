@@ -0,0 +1,5 @@
+# Tests import the app's flat modules the same way app.py and the benchmarks do
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from anomaly import ResidualMonitor
+
+ALPHA = 0.1
+
+
+def _stream(n=5000, devices=40, seed=0):
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(0, devices, n)
+    residuals = rng.normal(ids * 0.5, 1 + ids % 3, n)
+    return np.array([f"dev-{i}" for i in ids], dtype=object), residuals
+
+
+def _per_reading(devices, residuals):
+    """Reference: one Python update per reading."""
+    state = {}
+    for device, r in zip(devices.tolist(), residuals.tolist()):
+        if device not in state:
+            state[device] = [0, 0.0, 0.0, r]
+        s = state[device]
+        s[0] += 1
+        delta = r - s[1]
+        s[1] += delta / s[0]
+        s[2] += delta * (r - s[1])
+        s[3] = (1 - ALPHA) * s[3] + ALPHA * r
+    return state
+
+
+def _feed(monitor, devices, residuals, sizes):
+    start = 0
+    for size in sizes:
+        stop = start + size
+        monitor.update(monitor.slots_of(devices[start:stop]), residuals[start:stop], start)
+        start = stop
+    assert start == len(residuals)
+
+
+@pytest.mark.parametrize("sizes", [[5000], [1] * 50 + [950, 3000, 1000], [7] * 714 + [2]])
+def test_streaming_stats_match_per_reading(sizes):
+    devices, residuals = _stream()
+    monitor = ResidualMonitor(scorer=object(), alpha=ALPHA, capacity=4)
+    _feed(monitor, devices, residuals, sizes)
+
+    expected = _per_reading(devices, residuals)
+    stats = monitor.device_stats().set_index("device")
+    assert set(stats.index) == set(expected)
+    for device, (count, mean, m2, ewma) in expected.items():
+        row = stats.loc[device]
+        assert row["count"] == count
+        np.testing.assert_allclose(row["mean"], mean, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(row["std"], np.sqrt(m2 / max(count - 1, 1)), rtol=1e-9)
+        np.testing.assert_allclose(row["ewma"], ewma, rtol=1e-9, atol=1e-12)
+
+
+def test_spike_alert_on_outlier_after_warmup():
+    rng = np.random.default_rng(1)
+    residuals = rng.normal(0, 1, 200)
+    residuals[150] = 50.0
+    monitor = ResidualMonitor(scorer=object(), alpha=ALPHA, warmup=30)
+    alerts = []
+    for i, r in enumerate(residuals):
+        alerts.append(monitor.update(monitor.slots_of(["meter"]), [r], i))
+    spikes = [a for a in alerts if len(a) and (a["kind"] == "spike").any()]
+    assert len(spikes) == 1
+    assert spikes[0]["row"].tolist()[0] == 150
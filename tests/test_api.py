@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+import pytest
+
+from api import HTTPError, dispatch, encode_response, handle_connection
+
+
+@pytest.mark.parametrize("category", [5, 1.5, True, {"name": "Fan"}])
+def test_batch_rejects_non_sequence_category(category):
+    body = json.dumps({"category": category, "hours_per_day": 6, "electricity_rate": 7}).encode()
+    with pytest.raises(HTTPError) as exc:
+        asyncio.run(dispatch("POST", "/analyze/batch", body))
+    assert exc.value.status == 400
+
+
+def test_analyze_rejects_non_string_category():
+    body = json.dumps({"category": ["Fan"], "hours_per_day": 6, "electricity_rate": 7}).encode()
+    with pytest.raises(HTTPError) as exc:
+        asyncio.run(dispatch("POST", "/analyze", body))
+    assert exc.value.status == 400
+
+
+@pytest.mark.parametrize("length", ["abc", "-5", "1.5"])
+def test_invalid_content_length_is_a_bad_request(length):
+    async def roundtrip():
+        server = await asyncio.start_server(handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"POST /analyze HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        return response
+
+    status_line = asyncio.run(roundtrip()).split(b"\r\n", 1)[0]
+    assert status_line == b"HTTP/1.1 400 Bad Request"
+
+
+@pytest.mark.parametrize("rate", ["nan", "inf", "-Infinity"])
+def test_analyze_rejects_non_finite_numbers(rate):
+    with pytest.raises(HTTPError) as exc:
+        asyncio.run(dispatch("GET", f"/analyze?category=Fan&hours_per_day=6&electricity_rate={rate}", b""))
+    assert exc.value.status == 400
+
+
+def test_batch_rejects_non_finite_numbers():
+    body = b'{"category": ["Fan", "Fan"], "hours_per_day": [6, NaN], "electricity_rate": 7}'
+    with pytest.raises(HTTPError) as exc:
+        asyncio.run(dispatch("POST", "/analyze/batch", body))
+    assert exc.value.status == 400
+
+
+def test_non_finite_payload_never_reaches_the_wire():
+    response = encode_response(200, {"value": float("nan")}, False)
+    head, body = response.split(b"\r\n\r\n", 1)
+    assert head.startswith(b"HTTP/1.1 500 ")
+    assert json.loads(body) == {"error": "Response contained a non-finite number"}
+
+
+@pytest.mark.parametrize("region, status", [(99, 400), (0, 400), ([0, 1], 400), (["US", 2], 400),
+                                            ("Atlantis", 404), (["US", "Atlantis"], 404)])
+def test_batch_validates_region(region, status):
+    body = json.dumps({"category": ["Fan", "Fan"], "hours_per_day": 6, "region": region}).encode()
+    with pytest.raises(HTTPError) as exc:
+        asyncio.run(dispatch("POST", "/analyze/batch", body))
+    assert exc.value.status == status
+
+
+def test_batch_accepts_region_codes():
+    body = json.dumps({"category": ["Fan", "Fan"], "hours_per_day": 6, "region": ["US", "IN"]}).encode()
+    status, payload = asyncio.run(dispatch("POST", "/analyze/batch", body))
+    assert status == 200 and payload["region"] == ["US", "IN"]
@@ -0,0 +1,36 @@
+from catalog import ComponentTable, get_catalog, load_catalog
+from catalog_store import TIERS
+
+
+def _expected_table(breakdown):
+    # The old dashboard's table: union of attributes, "" where a tier lacks one,
+    # rows in first-appearance order (Old, then Modern, then Updated)
+    keys = list(dict.fromkeys(k for tier in TIERS for k in breakdown[tier]))
+    columns = [[breakdown[tier].get(k, "") for k in keys] for tier in TIERS]
+    return dict(zip(ComponentTable.COLUMNS, [keys] + columns))
+
+
+def test_component_table_matches_breakdown():
+    catalog = get_catalog()
+    for category in catalog.categories:
+        breakdown = catalog.components(category)
+        table = catalog.component_table(category)
+        if breakdown is None:
+            assert table is None
+            continue
+        assert table.to_dict() == _expected_table(breakdown), category
+
+
+def test_component_table_order_is_stable_across_loads():
+    first, second = get_catalog(), load_catalog()
+    for category in first.categories:
+        table = first.component_table(category)
+        if table is not None:
+            assert table.to_dict() == second.component_table(category).to_dict()
+
+
+def test_components_returns_private_copies():
+    catalog = get_catalog()
+    category = catalog.categories[0]
+    catalog.components(category)["Old"].clear()
+    assert catalog.components(category)["Old"]
@@ -0,0 +1,57 @@
+import logging
+import sqlite3
+
+import pytest
+
+import disk_cache
+from disk_cache import persistent
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(disk_cache, "ENABLED", True)
+    monkeypatch.setattr(disk_cache, "_CACHE", None)
+    monkeypatch.setattr(disk_cache, "_UNAVAILABLE", set())
+    monkeypatch.setattr(disk_cache, "_WARNED", False)
+
+
+def _square():
+    calls = []
+
+    @persistent("test_square")
+    def square(x):
+        calls.append(x)
+        return x * x
+    return square, calls
+
+
+def test_unwritable_path_falls_back_to_computing(fresh_cache, monkeypatch, caplog):
+    monkeypatch.setenv("ECOFUSION_CACHE_PATH", "/proc/nope/r.sqlite")
+    square, calls = _square()
+    with caplog.at_level(logging.WARNING, logger="disk_cache"):
+        assert square(3) == 9
+        assert square(3) == 9
+    assert calls == [3, 3]
+    assert len(caplog.records) == 1
+
+
+def test_corrupt_database_falls_back_to_computing(fresh_cache, monkeypatch, tmp_path):
+    path = tmp_path / "results.sqlite"
+    path.write_bytes(b"not a sqlite database" * 100)
+    monkeypatch.setenv("ECOFUSION_CACHE_PATH", str(path))
+    square, calls = _square()
+    assert square(4) == 16
+    assert calls == [4]
+
+
+def test_failing_reads_and_writes_fall_back_to_computing(fresh_cache, monkeypatch, tmp_path):
+    monkeypatch.setenv("ECOFUSION_CACHE_PATH", str(tmp_path / "results.sqlite"))
+    square, calls = _square()
+    assert square(5) == 25
+
+    def locked(*args):
+        raise sqlite3.OperationalError("database is locked")
+    cache = disk_cache.get_disk_cache()
+    monkeypatch.setattr(cache, "get", locked)
+    assert square(5) == 25
+    assert calls == [5, 5]
@@ -0,0 +1,33 @@
+import numpy as np
+
+from fleet import COST_BINS, cost_histogram, prepare_inventory, simulate_fleet, synthetic_fleet
+from scoring import score_scenarios
+
+
+def _household_costs(inventory):
+    cols = prepare_inventory(inventory)
+    per_unit = score_scenarios(cols["category"], cols["hours_per_day"], cols["electricity_rate"])
+    cost = per_unit["annual_cost_saved"] * cols["quantity"]
+    _, households = np.unique(cols["household_id"], return_inverse=True)
+    return np.bincount(households, cost)
+
+
+def test_cost_histogram_counts_every_value():
+    values = np.array([-5e6, -1e6, -3.5, -0.2, 0.0, 0.7, 42.0, 1e6, 2e6])
+    hist = cost_histogram(values)
+    assert len(hist) == len(COST_BINS) + 1
+    assert hist.sum() == len(values)
+    assert hist[0] == 1 and hist[-1] == 2
+
+
+def test_household_cost_percentiles_include_losers():
+    inventory = synthetic_fleet(20_000, seed=1)
+    exact = _household_costs(inventory)
+    assert (exact < 0).any(), "fixture should contain households that lose money"
+
+    result = simulate_fleet(inventory, workers=1, shard_rows=10_000)
+    assert result["household_cost_histogram"][1].sum() == result["households"] == len(exact)
+    # Log bins are ~6% wide, and the bin around zero is [-1, 1)
+    for q in (10, 50, 90, 99):
+        expected = np.percentile(exact, q)
+        assert abs(result["household_cost_saved"][f"p{q}"] - expected) <= 0.06 * abs(expected) + 1
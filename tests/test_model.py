@@ -0,0 +1,52 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from catalog import get_catalog
+from model import analyze_efficiency, analyze_efficiency_batch
+
+FIELDS = ("energy_diff", "co2_diff", "eff_gain", "annual_energy_saved", "annual_co2_saved", "annual_cost_saved")
+HOURS = (0, 1, 2.5, 6, 24)
+RATES = (0, 3.5, 7, 12.25)
+
+
+def _scenarios():
+    return list(itertools.product(get_catalog().categories, HOURS, RATES))
+
+
+def _assert_matches_scalar(result, scenarios, region=None):
+    for i, (category, hours, rate) in enumerate(scenarios):
+        expected = analyze_efficiency(category, hours, rate, region)
+        for field in FIELDS:
+            assert result[field][i] == expected[field], (category, hours, rate, field)
+
+
+def test_batch_matches_scalar_exactly():
+    scenarios = _scenarios()
+    categories, hours, rates = map(np.array, zip(*scenarios))
+    result = analyze_efficiency_batch(categories, hours, rates)
+    codes = [get_catalog().index_of(c) for c in categories]
+    np.testing.assert_array_equal(result["category_code"], codes)
+    _assert_matches_scalar(result, scenarios)
+
+
+def test_batch_accepts_catalog_codes():
+    scenarios = _scenarios()
+    categories, hours, rates = map(np.array, zip(*scenarios))
+    by_name = analyze_efficiency_batch(categories, hours, rates)
+    by_code = analyze_efficiency_batch(by_name["category_code"], hours, rates)
+    for field in FIELDS:
+        np.testing.assert_array_equal(by_code[field], by_name[field])
+
+
+def test_batch_dataframe_matches_scalar_exactly():
+    scenarios = _scenarios()
+    frame = pd.DataFrame(scenarios, columns=["category", "hours_per_day", "electricity_rate"])
+    _assert_matches_scalar(analyze_efficiency_batch(frame), scenarios)
+
+
+def test_batch_broadcasts_scalars():
+    categories = np.array(get_catalog().categories)
+    result = analyze_efficiency_batch(categories, 6, 7)
+    _assert_matches_scalar(result, [(c, 6, 7) for c in categories])
@@ -0,0 +1,25 @@
+import numpy as np
+
+from fleet import simulate_fleet, synthetic_fleet
+from montecarlo import Triangular, simulate_uncertainty
+from parallel import reduce_partials
+
+
+def test_reduce_partials_sums_key_by_key():
+    parts = [{"n": 1, "hist": np.array([1, 0])}, {"n": 2, "hist": np.array([0, 3])}]
+    total = reduce_partials(parts)
+    assert total["n"] == 3
+    np.testing.assert_array_equal(total["hist"], [1, 3])
+    np.testing.assert_array_equal(parts[0]["hist"], [1, 0])  # inputs are left alone
+
+
+def test_fleet_pool_matches_in_process():
+    inventory = synthetic_fleet(20_000)
+    np.testing.assert_equal(simulate_fleet(inventory, workers=2, shard_rows=10_000),
+                 simulate_fleet(inventory, workers=1, shard_rows=10_000))
+
+
+def test_montecarlo_pool_matches_in_process():
+    args = (Triangular(3, 6, 9), Triangular(5, 7, 9))
+    np.testing.assert_equal(simulate_uncertainty(*args, samples=300_000, workers=2),
+                 simulate_uncertainty(*args, samples=300_000, workers=1))
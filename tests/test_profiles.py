@@ -0,0 +1,25 @@
+import numpy as np
+
+import profiles
+from profiles import annual_savings, flat_profile, flat_tariff
+
+
+def test_default_intensity_products_are_reused():
+    usage, tariff = flat_profile([4, 8]), flat_tariff(7)
+    first = annual_savings(usage, tariff)
+    for _ in range(100):
+        again = annual_savings(usage, tariff)
+    assert len(usage._products) == 2  # one tariff product, one intensity product
+    np.testing.assert_array_equal(first["annual_co2_saved"], again["annual_co2_saved"])
+
+
+def test_product_cache_is_bounded():
+    usage = flat_profile(6)
+    tariffs = [flat_tariff(rate) for rate in range(profiles.PRODUCT_CACHE_SIZE + 10)]
+    for tariff in tariffs:
+        usage.dot(tariff)
+    assert len(usage._products) == profiles.PRODUCT_CACHE_SIZE
+    # the least recently used products are the ones evicted
+    assert tariffs[0].key not in usage._products
+    assert tariffs[-1].key in usage._products
+    np.testing.assert_allclose(usage.dot(tariffs[3]), [[6 / 24 * 3 * 8760]])
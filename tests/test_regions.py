@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import disk_cache
+import regions
+from cache import cached_chart_png, cached_uncertainty
+from catalog import get_catalog
+from model import analyze_efficiency, analyze_efficiency_batch
+
+
+@pytest.fixture
+def isolated_registry(tmp_path, monkeypatch):
+    monkeypatch.setenv("ECOFUSION_CACHE_PATH", str(tmp_path / "results.sqlite"))
+    monkeypatch.setattr(disk_cache, "_CACHE", None)
+    saved = dict(regions.REGIONS)
+    yield
+    regions.REGIONS.clear()
+    regions.REGIONS.update(saved)
+    regions.register_region(regions.DEFAULT_REGION)  # bump the version past the override
+
+
+def test_register_region_override_invalidates_cached_results(isolated_registry):
+    png = cached_chart_png("Fan", "co2", "US")
+    bands = cached_uncertainty(6, 0.16, "US")
+
+    regions.register_region("US", emission_factor=0.9, per_usd=2.0)
+
+    assert cached_chart_png("Fan", "co2", "US") != png
+    assert not np.array_equal(cached_uncertainty(6, 0.16, "US")["annual_co2_saved"]["p50"],
+                              bands["annual_co2_saved"]["p50"])
+
+
+def test_regional_batch_matches_scalar_exactly():
+    scenarios = [(c, h, r, code) for c in get_catalog().categories for h in (1, 6, 24)
+                 for r in (0, 7.5) for code in regions.REGIONS]
+    categories, hours, rates, codes = map(np.array, zip(*scenarios))
+    result = analyze_efficiency_batch(categories, hours, rates, codes)
+    for i, (category, h, r, code) in enumerate(scenarios):
+        expected = analyze_efficiency(category, h, r, code)
+        for field in ("co2_diff", "annual_energy_saved", "annual_co2_saved", "annual_cost_saved"):
+            assert result[field][i] == expected[field], (category, h, r, code, field)
+
+
+def test_regional_batch_defaults_to_each_region_tariff():
+    codes = list(regions.REGIONS)
+    result = analyze_efficiency_batch("Fan", 6, region=codes)
+    for i, code in enumerate(codes):
+        expected = analyze_efficiency("Fan", 6, regions.get_region(code).tariff, code)
+        assert result["annual_cost_saved"][i] == expected["annual_cost_saved"]
+        assert result["annual_co2_saved"][i] == expected["annual_co2_saved"]
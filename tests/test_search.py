@@ -0,0 +1,11 @@
+from catalog import get_catalog
+from search import CatalogIndex, has_component
+
+
+def test_empty_component_range_does_not_poison_next_range():
+    # No Legacy model has a "Cooling Mode" component: its (attribute, tier)
+    # range is empty and starts where the Updated range starts
+    index = CatalogIndex(get_catalog())
+    assert index.categories(index.query(has_component("Old", "Cooling Mode", contains="Adaptive"))) == []
+    updated = index.query(has_component("Updated", "Cooling Mode", contains="Adaptive"))
+    assert index.categories(updated) == ["Air Conditioner"]
@@ -0,0 +1,20 @@
+import os
+import time
+
+import telemetry
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "..", "data", "appliance_data.csv")
+
+
+def test_pipeline_throughput_excludes_model_load(tmp_path, monkeypatch):
+    model = telemetry.get_energy_model()
+
+    def slow_load(path=telemetry.MODEL_PATH):
+        time.sleep(0.5)
+        return model
+
+    monkeypatch.setattr(telemetry, "get_energy_model", slow_load)
+    output = tmp_path / "scored.csv"
+    stats = telemetry.run_pipeline(SAMPLE, str(output))
+    assert stats["rows"] > 0
+    assert stats["seconds"] < 0.5
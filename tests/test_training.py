@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from telemetry import FEATURES
+from training import TARGET, RegressionStats, build_model, fit_stream
+
+
+@pytest.fixture
+def telemetry_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 5000
+    frame = pd.DataFrame({
+        FEATURES[0]: rng.normal(230, 5, n),
+        FEATURES[1]: rng.uniform(0.1, 10, n),
+        FEATURES[2]: rng.normal(30, 4, n),
+    })
+    frame[TARGET] = frame @ np.array([0.3, 228.0, -1.5]) + 12 + rng.normal(0, 20, n)
+    path = tmp_path / "telemetry.csv"
+    frame.to_csv(path, index=False)
+    return str(path), frame
+
+
+@pytest.mark.parametrize("chunksize", [5000, 777, 50])
+def test_streamed_fit_matches_linear_regression(telemetry_csv, chunksize):
+    path, frame = telemetry_csv
+    stats, report = fit_stream([path], chunksize=chunksize)
+    model = build_model(stats)
+    reference = LinearRegression().fit(frame[list(FEATURES)], frame[TARGET])
+
+    assert report["rows"] == len(frame)
+    np.testing.assert_allclose(model.coef_, reference.coef_, rtol=1e-9)
+    np.testing.assert_allclose(model.intercept_, reference.intercept_, rtol=1e-9)
+    np.testing.assert_allclose(model.singular_, reference.singular_, rtol=1e-9)
+    assert model.rank_ == reference.rank_
+    np.testing.assert_allclose(model.predict(frame[list(FEATURES)]), reference.predict(frame[list(FEATURES)]),
+                               rtol=1e-9)
+    np.testing.assert_allclose(stats.scores(model.coef_)["r2"],
+                               reference.score(frame[list(FEATURES)], frame[TARGET]), rtol=1e-9)
+
+
+def test_merged_stats_equal_single_pass(telemetry_csv):
+    _, frame = telemetry_csv
+    block = frame[list(FEATURES) + [TARGET]].to_numpy()
+    whole = RegressionStats(len(FEATURES)).update(block)
+    merged = RegressionStats(len(FEATURES)).update(block[:1234]).merge(
+        RegressionStats(len(FEATURES)).update(block[1234:]))
+    assert merged.n == whole.n
+    np.testing.assert_allclose(merged.mean, whole.mean, rtol=1e-12)
+    np.testing.assert_allclose(merged.comoment, whole.comoment, rtol=1e-9)